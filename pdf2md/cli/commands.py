@@ -8,11 +8,27 @@ import click
 
 from pdf2md.cli.arguments import VALIDADOR_DIRETORIO, VALIDADOR_PDF
 from pdf2md.core.converter import PDFConverter
+from pdf2md.core.image_extractor import (
+    AREA_MINIMA_IMAGEM,
+    EXTENSOES_SAIDA,
+    LADO_MINIMO_IMAGEM,
+    QUALIDADE_PADRAO,
+)
+from pdf2md.core.ocr_processor import OCR_AUTOMATICO, OCR_REGIOES
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
 
+def _modo_ocr(ocr: bool, ocr_auto: bool, ocr_regions: bool):
+    """Converte as opções de OCR da linha de comando em ``ocr_habilitado``."""
+    if ocr_regions:
+        return OCR_REGIOES
+    if ocr_auto:
+        return OCR_AUTOMATICO
+    return ocr
+
+
 @click.group(invoke_without_command=True)  # ✅ CORREÇÃO APLICADA
 @click.pass_context  # ✅ CORREÇÃO APLICADA
 @click.version_option(version="1.0.0", prog_name="pdf2md")
@@ -49,12 +65,126 @@ def cli(ctx):  # ✅ CORREÇÃO APLICADA
 @click.option(
     "--ocr", is_flag=True, default=False, help="Ativar OCR para PDFs escaneados"
 )
+@click.option(
+    "--ocr-auto",
+    is_flag=True,
+    default=False,
+    help="Aplicar OCR apenas nas páginas que parecem escaneadas",
+)
+@click.option(
+    "--ocr-regions",
+    is_flag=True,
+    default=False,
+    help="Aplicar OCR apenas nas imagens, mantendo o texto nativo das páginas",
+)
+@click.option(
+    "--ocr-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Número de processos do Tesseract (OCR em paralelo)",
+)
+@click.option(
+    "--ocr-grayscale",
+    is_flag=True,
+    default=False,
+    help="Renderizar as páginas do OCR em tons de cinza (menos memória)",
+)
+@click.option(
+    "--ocr-preprocess",
+    is_flag=True,
+    default=False,
+    help="Binarizar, endireitar e recortar as páginas antes do OCR",
+)
+@click.option(
+    "--ocr-max-page-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Memória máxima por página em OCR, em MB (páginas maiores são "
+    "reconhecidas em faixas)",
+)
+@click.option(
+    "--ocr-batch-size",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Páginas reconhecidas por execução do Tesseract",
+)
 @click.option(
     "--extract-images", is_flag=True, default=False, help="Extrair imagens do PDF"
 )
+@click.option(
+    "--raw-images",
+    is_flag=True,
+    default=False,
+    help="Gravar imagens JPEG/JPEG 2000/PNG como estão no PDF, sem recodificar",
+)
+@click.option(
+    "--dedup-images",
+    is_flag=True,
+    default=False,
+    help="Gravar cada imagem repetida uma única vez (nome pelo hash do conteúdo)",
+)
+@click.option(
+    "--image-threads",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Threads que codificam e gravam as imagens em segundo plano",
+)
+@click.option(
+    "--filter-images",
+    is_flag=True,
+    default=False,
+    help="Ignorar imagens decorativas (espaçadores, fios, fundos de uma cor)",
+)
+@click.option(
+    "--min-image-side",
+    type=click.IntRange(min=0),
+    default=LADO_MINIMO_IMAGEM,
+    show_default=True,
+    help="Com --filter-images, menor lado de imagem mantido (pixels)",
+)
+@click.option(
+    "--min-image-area",
+    type=click.FloatRange(min=0),
+    default=AREA_MINIMA_IMAGEM,
+    show_default=True,
+    help="Com --filter-images, menor área na página de imagem mantida (pt²)",
+)
+@click.option(
+    "--max-image-size",
+    type=click.IntRange(min=1),
+    envvar="MAX_IMAGE_SIZE",
+    default=None,
+    help="Reduzir imagens cujo maior lado passe disto, em pixels (ou MAX_IMAGE_SIZE)",
+)
+@click.option(
+    "--image-format",
+    type=click.Choice(list(EXTENSOES_SAIDA)),
+    default="png",
+    show_default=True,
+    help="Formato das imagens convertidas",
+)
+@click.option(
+    "--image-quality",
+    type=click.IntRange(1, 100),
+    default=QUALIDADE_PADRAO,
+    show_default=True,
+    help="Qualidade das imagens em JPEG e WebP",
+)
+@click.option(
+    "--lazy-images",
+    is_flag=True,
+    default=False,
+    help="Só referenciar as imagens; gravá-las depois com 'pdf2md materialize'",
+)
 @click.option(
     "--extract-tables", is_flag=True, default=True, help="Extrair tabelas do PDF"
 )
+@click.option(
+    "--no-table-prefilter",
+    is_flag=True,
+    default=False,
+    help="Procurar tabelas em todas as páginas, mesmo sem linhas de grade",
+)
 @click.option(
     "-v", "--verbose", is_flag=True, default=False, help="Modo verbose (mais detalhes)"
 )
@@ -64,14 +194,77 @@ def cli(ctx):  # ✅ CORREÇÃO APLICADA
     default="por",
     help="Idioma para OCR",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Número de processos para converter páginas em paralelo",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Gravar o Markdown página a página durante a conversão",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="PDF2MD_CACHE_DIR",
+    default=None,
+    help="Diretório do cache de conversões (ou PDF2MD_CACHE_DIR)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignorar os caches de conversões e de OCR",
+)
+@click.option(
+    "--ocr-cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="PDF2MD_OCR_CACHE_DIR",
+    default=None,
+    help="Diretório do cache de OCR por página (ou PDF2MD_OCR_CACHE_DIR)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Reconverter apenas as páginas alteradas desde a última conversão",
+)
 def converter(
     arquivo_pdf: Path,
     output: Path,
     ocr: bool,
+    ocr_auto: bool,
+    ocr_regions: bool,
+    ocr_workers: int,
+    ocr_grayscale: bool,
+    ocr_preprocess: bool,
+    ocr_max_page_memory: int,
+    ocr_batch_size: int,
     extract_images: bool,
+    raw_images: bool,
+    dedup_images: bool,
+    image_threads: int,
+    filter_images: bool,
+    min_image_side: int,
+    min_image_area: float,
+    max_image_size: int,
+    image_format: str,
+    image_quality: int,
+    lazy_images: bool,
     extract_tables: bool,
+    no_table_prefilter: bool,
     verbose: bool,
     language: str,
+    jobs: int,
+    stream: bool,
+    cache_dir: Path,
+    no_cache: bool,
+    ocr_cache_dir: Path,
+    incremental: bool,
 ):
     """
     🔄 Converte um arquivo PDF para Markdown
@@ -88,11 +281,32 @@ def converter(
 
         # Configurações de conversão
         config = {
-            "ocr_habilitado": ocr,
+            "ocr_habilitado": _modo_ocr(ocr, ocr_auto, ocr_regions),
             "extrair_imagens": extract_images,
+            "imagens_originais": raw_images,
+            "deduplicar_imagens": dedup_images,
+            "threads_imagens": image_threads,
+            "filtrar_imagens": filter_images,
+            "lado_minimo_imagem": min_image_side,
+            "area_minima_imagem": min_image_area,
+            "dimensao_maxima_imagem": max_image_size,
+            "formato_imagem": image_format,
+            "qualidade_imagem": image_quality,
+            "adiar_imagens": lazy_images,
             "extrair_tabelas": extract_tables,
+            "prefiltrar_tabelas": not no_table_prefilter,
             "idioma_ocr": language,
             "verbose": verbose,
+            "workers": jobs,
+            "streaming": stream,
+            "diretorio_cache": None if no_cache else cache_dir,
+            "incremental": incremental,
+            "workers_ocr": ocr_workers,
+            "ocr_escala_cinza": ocr_grayscale,
+            "ocr_preprocessar": ocr_preprocess,
+            "ocr_memoria_maxima_mb": ocr_max_page_memory,
+            "ocr_tamanho_lote": ocr_batch_size,
+            "diretorio_cache_ocr": None if no_cache else ocr_cache_dir,
         }
 
         # Criar conversor
@@ -220,17 +434,108 @@ def _exibir_estatisticas(conversor):
     is_flag=True,
     help='Ativar OCR para PDFs escaneados'
 )
+@click.option(
+    '--ocr-auto',
+    is_flag=True,
+    help='Aplicar OCR apenas nas páginas que parecem escaneadas'
+)
+@click.option(
+    '--ocr-regions',
+    is_flag=True,
+    help='Aplicar OCR apenas nas imagens, mantendo o texto nativo das páginas'
+)
+@click.option(
+    '--ocr-workers',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Número de processos do Tesseract (OCR em paralelo)'
+)
+@click.option(
+    '--ocr-grayscale',
+    is_flag=True,
+    help='Renderizar as páginas do OCR em tons de cinza (menos memória)'
+)
+@click.option(
+    '--ocr-preprocess',
+    is_flag=True,
+    help='Binarizar, endireitar e recortar as páginas antes do OCR'
+)
+@click.option(
+    '--ocr-max-page-memory',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Memória máxima por página em OCR, em MB (páginas maiores são '
+         'reconhecidas em faixas)'
+)
+@click.option(
+    '--ocr-batch-size',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Páginas reconhecidas por execução do Tesseract'
+)
 @click.option(
     '--extract-images',
     is_flag=True,
     help='Extrair imagens do PDF'
 )
+@click.option(
+    '--raw-images',
+    is_flag=True,
+    help='Gravar imagens JPEG/JPEG 2000/PNG como estão no PDF, sem recodificar'
+)
+@click.option(
+    '--dedup-images',
+    is_flag=True,
+    help='Gravar cada imagem repetida uma única vez, inclusive entre os PDFs '
+         '(nome pelo hash do conteúdo)'
+)
+@click.option(
+    '--image-threads',
+    type=click.IntRange(min=0),
+    default=0,
+    help='Threads que codificam e gravam as imagens em segundo plano'
+)
+@click.option(
+    '--filter-images',
+    is_flag=True,
+    help='Ignorar imagens decorativas (espaçadores, fios, fundos de uma cor)'
+)
+@click.option(
+    '--max-image-size',
+    type=click.IntRange(min=1),
+    envvar='MAX_IMAGE_SIZE',
+    default=None,
+    help='Reduzir imagens cujo maior lado passe disto, em pixels '
+         '(ou MAX_IMAGE_SIZE)'
+)
+@click.option(
+    '--image-format',
+    type=click.Choice(list(EXTENSOES_SAIDA)),
+    default='png',
+    help='Formato das imagens convertidas (padrão: png)'
+)
+@click.option(
+    '--image-quality',
+    type=click.IntRange(1, 100),
+    default=QUALIDADE_PADRAO,
+    help='Qualidade das imagens em JPEG e WebP'
+)
+@click.option(
+    '--lazy-images',
+    is_flag=True,
+    help="Só referenciar as imagens; gravá-las depois com 'pdf2md materialize'"
+)
 @click.option(
     '--extract-tables',
     is_flag=True,
     default=True,
     help='Extrair tabelas (padrão: ativado)'
 )
+@click.option(
+    '--no-table-prefilter',
+    is_flag=True,
+    help='Procurar tabelas em todas as páginas, mesmo sem linhas de grade'
+)
 @click.option(
     '--language',
     default='por',
@@ -241,7 +546,60 @@ def _exibir_estatisticas(conversor):
     is_flag=True,
     help='Modo detalhado'
 )
-def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, language, verbose):
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar='PDF2MD_CACHE_DIR',
+    default=None,
+    help='Diretório do cache de conversões (ou PDF2MD_CACHE_DIR)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Ignorar os caches de conversões e de OCR'
+)
+@click.option(
+    '--ocr-cache-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar='PDF2MD_OCR_CACHE_DIR',
+    default=None,
+    help='Diretório do cache de OCR por página (ou PDF2MD_OCR_CACHE_DIR)'
+)
+@click.option(
+    '-j', '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Número de PDFs convertidos em paralelo'
+)
+@click.option(
+    '--resume',
+    is_flag=True,
+    help='Pular PDFs já convertidos com sucesso (segundo o jornal da saída)'
+)
+@click.option(
+    '--timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help='Tempo máximo de conversão por PDF, em segundos'
+)
+@click.option(
+    '--max-memory',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Memória máxima do processo que converte cada PDF, em MB'
+)
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Converter também os PDFs em quarentena'
+)
+def batch(diretorio_entrada, output, ocr, ocr_auto, ocr_regions, ocr_workers,
+          ocr_grayscale, ocr_preprocess, ocr_max_page_memory, ocr_batch_size,
+          extract_images, raw_images, dedup_images, image_threads,
+          filter_images, max_image_size, image_format, image_quality,
+          lazy_images, extract_tables, no_table_prefilter, language,
+          verbose, cache_dir, no_cache, ocr_cache_dir, jobs, resume,
+          timeout, max_memory, force):
     """
     🗂️  Converte TODOS os PDFs de uma pasta
 
@@ -255,6 +613,9 @@ def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, langua
 
         # Especificar pasta de saída
         pdf2md batch livros/ -o meus_markdowns/
+
+        # Limitar cada PDF a 2 minutos e 1 GB de memória
+        pdf2md batch livros/ --timeout 120 --max-memory 1024
     """
     from pdf2md.core.batch_converter import BatchConverter
 
@@ -273,11 +634,32 @@ def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, langua
         conversor = BatchConverter(
             diretorio_entrada=diretorio_entrada,
             diretorio_saida=output,
-            ocr_habilitado=ocr,
+            ocr_habilitado=_modo_ocr(ocr, ocr_auto, ocr_regions),
             extrair_imagens=extract_images,
+            imagens_originais=raw_images,
+            deduplicar_imagens=dedup_images,
+            threads_imagens=image_threads,
+            filtrar_imagens=filter_images,
+            dimensao_maxima_imagem=max_image_size,
+            formato_imagem=image_format,
+            qualidade_imagem=image_quality,
+            adiar_imagens=lazy_images,
             extrair_tabelas=extract_tables,
+            prefiltrar_tabelas=not no_table_prefilter,
             idioma_ocr=language,
-            verbose=verbose
+            verbose=verbose,
+            diretorio_cache=None if no_cache else cache_dir,
+            max_workers=jobs,
+            retomar=resume,
+            tempo_limite=timeout,
+            limite_memoria_mb=max_memory,
+            forcar=force,
+            workers_ocr=ocr_workers,
+            ocr_escala_cinza=ocr_grayscale,
+            diretorio_cache_ocr=None if no_cache else ocr_cache_dir,
+            ocr_preprocessar=ocr_preprocess,
+            ocr_memoria_maxima_mb=ocr_max_page_memory,
+            ocr_tamanho_lote=ocr_batch_size
         )
 
         resultado = conversor.converter_todos()
@@ -292,6 +674,15 @@ def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, langua
         )
 
         click.echo(f"  • Total de PDFs: {resultado['total_pdfs']}")
+        if resultado.get('retomados'):
+            click.echo(f"  • Pulados (já convertidos): {resultado['retomados']}")
+
+        if resultado.get('makespan_estimado') is not None:
+            click.echo(
+                f"  • Tempo estimado: {resultado['makespan_estimado']:.1f}s"
+            )
+        if resultado.get('makespan_real') is not None:
+            click.echo(f"  • Tempo real: {resultado['makespan_real']:.1f}s")
         click.echo(
             click.style(
                 f"  • Sucesso: {resultado['sucesso']}",
@@ -320,6 +711,21 @@ def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, langua
             for falha in falhas:
                 click.echo(f"  • {falha['pdf']}: {falha['erro']}")
 
+        # PDFs em quarentena pulados nesta execução
+        em_quarentena = [
+            r for r in resultado['resultados'] if r['status'] == 'quarentena'
+        ]
+        if em_quarentena:
+            click.echo(
+                click.style(
+                    "\n🚫 PDFs em quarentena (use --force para convertê-los):",
+                    fg='yellow',
+                    bold=True
+                )
+            )
+            for item in em_quarentena:
+                click.echo(f"  • {item['pdf']}: {item['erro']}")
+
         click.echo(
             click.style(
                 f"\n✅ Conversão concluída!",
@@ -338,3 +744,43 @@ def batch(diretorio_entrada, output, ocr, extract_images, extract_tables, langua
             err=True
         )
         raise click.Exit(1)
+
+
+@cli.command(name="materialize")
+@click.argument(
+    "arquivo_markdown",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.argument("imagens", nargs=-1)
+@click.option(
+    "--pdf",
+    "caminho_pdf",
+    type=VALIDADOR_PDF,
+    default=None,
+    help="PDF de origem, se tiver mudado de lugar desde a conversão",
+)
+def materializar(arquivo_markdown: Path, imagens: tuple, caminho_pdf: Path):
+    """
+    🖼️  Grava as imagens de uma conversão com --lazy-images
+
+    Sem IMAGENS, grava todas as referenciadas no Markdown.
+
+    Exemplos:
+
+        # Gravar todas as imagens
+        pdf2md materialize output/relatorio.md
+
+        # Gravar só algumas
+        pdf2md materialize output/relatorio.md imagens/imagem_3_1.png
+    """
+    from pdf2md.core.image_manifest import materializar_imagens
+
+    try:
+        caminhos = materializar_imagens(arquivo_markdown, imagens or None, caminho_pdf)
+        for caminho in caminhos:
+            click.echo(f"  • {caminho}")
+        click.echo(click.style(f"\n✅ {len(caminhos)} imagens disponíveis", fg="green"))
+
+    except (OSError, ValueError) as e:
+        click.echo(click.style(f"❌ Erro: {e}", fg="red", bold=True), err=True)
+        raise click.Exit(1)
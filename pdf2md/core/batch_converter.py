@@ -2,13 +2,27 @@
 Conversor em lote de múltiplos PDFs.
 """
 
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+import heapq
+from pdf2md.core.batch_journal import JornalLote, calcular_impressao_arquivo
 from pdf2md.core.converter import PDFConverter
+from pdf2md.core.image_extractor import QUALIDADE_PADRAO
+from pdf2md.core.ocr_engine import MotorOCR
+from pdf2md.core.ocr_processor import OCR_AUTOMATICO, OCR_REGIOES
+from pdf2md.core.pdf_reader import LeitorPDF
+from pdf2md.core.supervisor import SupervisorConversao
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
+# Custos aproximados usados para ordenar o lote (segundos)
+SEGUNDOS_POR_PAGINA_TEXTO = 0.02
+SEGUNDOS_POR_PAGINA_TABELAS = 0.06
+SEGUNDOS_POR_PAGINA_OCR = 2.0
+SEGUNDOS_POR_MB = 0.05
+
 
 class BatchConverter:
     """Conversor em lote de PDFs para Markdown."""
@@ -17,11 +31,32 @@ class BatchConverter:
         self,
         diretorio_entrada: Path,
         diretorio_saida: Path,
-        ocr_habilitado: bool = False,
+        ocr_habilitado=False,
         extrair_imagens: bool = True,
         extrair_tabelas: bool = True,
         idioma_ocr: str = 'por',
-        verbose: bool = False
+        verbose: bool = False,
+        diretorio_cache: Optional[Path] = None,
+        max_workers: int = 1,
+        retomar: bool = False,
+        tempo_limite: Optional[float] = None,
+        limite_memoria_mb: Optional[int] = None,
+        forcar: bool = False,
+        workers_ocr: int = 1,
+        ocr_escala_cinza: bool = False,
+        diretorio_cache_ocr: Optional[Path] = None,
+        ocr_preprocessar: bool = False,
+        ocr_memoria_maxima_mb: Optional[int] = None,
+        ocr_tamanho_lote: int = 1,
+        imagens_originais: bool = False,
+        deduplicar_imagens: bool = False,
+        threads_imagens: int = 0,
+        filtrar_imagens: bool = False,
+        dimensao_maxima_imagem: Optional[int] = None,
+        formato_imagem: str = "png",
+        qualidade_imagem: int = QUALIDADE_PADRAO,
+        adiar_imagens: bool = False,
+        prefiltrar_tabelas: bool = True
     ):
         """
         Inicializa o conversor em lote.
@@ -29,11 +64,48 @@ class BatchConverter:
         Args:
             diretorio_entrada: Pasta contendo os PDFs
             diretorio_saida: Pasta onde salvar os Markdowns
-            ocr_habilitado: Ativar OCR
+            ocr_habilitado: Ativar OCR (True, False, "auto" ou "regioes")
             extrair_imagens: Extrair imagens
             extrair_tabelas: Extrair tabelas
             idioma_ocr: Idioma para OCR
             verbose: Modo detalhado
+            diretorio_cache: Diretório do cache de conversões (None desativa)
+            max_workers: Número de processos convertendo PDFs em paralelo
+            retomar: Pular PDFs já convertidos com sucesso segundo o jornal
+                do diretório de saída (se a entrada não mudou)
+            tempo_limite: Tempo máximo de conversão por PDF, em segundos
+            limite_memoria_mb: Memória residente máxima do processo que
+                converte um PDF, em MB
+            forcar: Converter também os PDFs em quarentena
+            workers_ocr: Processos do MotorOCR compartilhado pelos PDFs na
+                conversão serial (na conversão em processos, o paralelismo
+                já vem dos PDFs convertidos simultaneamente)
+            ocr_escala_cinza: Renderizar as páginas do OCR em tons de cinza
+            diretorio_cache_ocr: Diretório do cache de OCR por página,
+                compartilhado por todos os PDFs (None desativa)
+            ocr_preprocessar: Binarizar, endireitar e recortar as margens das
+                páginas antes do OCR
+            ocr_memoria_maxima_mb: Memória máxima das imagens de uma página
+                em OCR, em MB (páginas maiores são reconhecidas em faixas)
+            ocr_tamanho_lote: Páginas reconhecidas por execução do Tesseract
+            imagens_originais: Gravar as imagens JPEG, JPEG 2000 e PNG com
+                os bytes do PDF, sem recodificá-las em PNG
+            deduplicar_imagens: Gravar cada imagem uma única vez na pasta
+                ``imagens/`` comum ao lote, com o nome dado pelo hash do
+                conteúdo (logotipos repetidos entre os PDFs viram um arquivo)
+            threads_imagens: Threads que codificam e gravam as imagens de
+                cada PDF em segundo plano (0 grava no laço das páginas)
+            filtrar_imagens: Ignorar imagens pequenas, quase invisíveis na
+                página ou de uma cor só
+            dimensao_maxima_imagem: Maior lado das imagens gravadas, em
+                pixels (None mantém a resolução)
+            formato_imagem: Formato das imagens convertidas ('png', 'jpeg'
+                ou 'webp')
+            qualidade_imagem: Qualidade (1-100) de JPEG e WebP
+            adiar_imagens: Só referenciar as imagens, com um manifesto por
+                PDF para gravá-las depois (ver ``materializar_imagens``)
+            prefiltrar_tabelas: Procurar tabelas só nas páginas cujos
+                desenhos formam uma grade de linhas
         """
         self.diretorio_entrada = Path(diretorio_entrada)
         self.diretorio_saida = Path(diretorio_saida)
@@ -42,6 +114,27 @@ class BatchConverter:
         self.extrair_tabelas = extrair_tabelas
         self.idioma_ocr = idioma_ocr
         self.verbose = verbose
+        self.diretorio_cache = diretorio_cache
+        self.max_workers = max(1, int(max_workers))
+        self.retomar = retomar
+        self.tempo_limite = tempo_limite
+        self.limite_memoria_mb = limite_memoria_mb
+        self.forcar = forcar
+        self.workers_ocr = max(1, int(workers_ocr))
+        self.ocr_escala_cinza = ocr_escala_cinza
+        self.diretorio_cache_ocr = diretorio_cache_ocr
+        self.ocr_preprocessar = ocr_preprocessar
+        self.ocr_memoria_maxima_mb = ocr_memoria_maxima_mb
+        self.ocr_tamanho_lote = max(1, int(ocr_tamanho_lote))
+        self.imagens_originais = imagens_originais
+        self.deduplicar_imagens = deduplicar_imagens
+        self.threads_imagens = max(0, int(threads_imagens))
+        self.filtrar_imagens = filtrar_imagens
+        self.dimensao_maxima_imagem = dimensao_maxima_imagem
+        self.formato_imagem = formato_imagem
+        self.qualidade_imagem = qualidade_imagem
+        self.adiar_imagens = adiar_imagens
+        self.prefiltrar_tabelas = prefiltrar_tabelas
 
         # Validações
         if not self.diretorio_entrada.exists():
@@ -92,6 +185,8 @@ class BatchConverter:
                 'total_pdfs': 0,
                 'sucesso': 0,
                 'falhas': 0,
+                'retomados': 0,
+                'quarentena': 0,
                 'resultados': []
             }
 
@@ -99,51 +194,420 @@ class BatchConverter:
 
         sucesso = 0
         falhas = 0
+        makespan_estimado = None
+        inicio = datetime.now()
 
-        for i, pdf in enumerate(pdfs, start=1):
-            logger.info(f"[{i}/{len(pdfs)}] Convertendo: {pdf.name}")
+        with JornalLote(self.diretorio_saida) as jornal:
+            registros = jornal.carregar()
+            retomados = self._verificar_retomada(pdfs, registros) if self.retomar else {}
+            quarentena = {} if self.forcar else self._verificar_quarentena(
+                pdfs, registros, jornal.carregar_quarentena()
+            )
+            a_converter = [
+                pdf for pdf in pdfs
+                if pdf.name not in retomados and pdf.name not in quarentena
+            ]
 
-            try:
-                # 👉 Agora o diretório de saída é sempre o mesmo (sem subpastas)
-                pasta_saida = self.diretorio_saida
-
-                conversor = PDFConverter(
-                    caminho_pdf=pdf,
-                    diretorio_saida=pasta_saida,
-                    ocr_habilitado=self.ocr_habilitado,
-                    extrair_imagens=self.extrair_imagens,
-                    extrair_tabelas=self.extrair_tabelas,
-                    idioma_ocr=self.idioma_ocr,
-                    verbose=self.verbose
+            if retomados:
+                logger.info(
+                    f"Retomando lote: {len(retomados)} PDFs já convertidos serão pulados"
+                )
+            if quarentena:
+                logger.warning(
+                    f"{len(quarentena)} PDFs em quarentena serão pulados "
+                    "(use --force para convertê-los)"
                 )
 
-                arquivo_md = conversor.converter()
-                stats = conversor.obter_estatisticas()
+            custos = {}
+            if self.max_workers > 1 and len(a_converter) > 1:
+                custos = self.estimar_custos(a_converter)
+                makespan_estimado = estimar_makespan(
+                    list(custos.values()), self.max_workers
+                )
+                logger.info(f"Makespan estimado: {makespan_estimado:.1f}s")
+
+            if self.max_workers > 1 or self.tempo_limite or self.limite_memoria_mb:
+                convertidos = self._converter_supervisionado(
+                    a_converter, custos, registros, jornal
+                )
+            else:
+                convertidos = self._converter_serial(a_converter, registros, jornal)
 
-                self.resultados.append({
-                    'pdf': pdf.name,
-                    'status': 'sucesso',
-                    'markdown': arquivo_md,
-                    'estatisticas': stats
-                })
+            for i, pdf in enumerate(pdfs, start=1):
+                if pdf.name in retomados:
+                    self.resultados.append(retomados[pdf.name])
+                    sucesso += 1
+                    continue
 
-                sucesso += 1
-                logger.info(f"✓ {pdf.name} convertido com sucesso")
+                if pdf.name in quarentena:
+                    self.resultados.append(quarentena[pdf.name])
+                    continue
 
-            except Exception as e:
-                self.resultados.append({
-                    'pdf': pdf.name,
-                    'status': 'falha',
-                    'erro': str(e)
-                })
+                resultado = next(convertidos)
+                self.resultados.append(resultado)
+                nome = resultado['pdf']
 
-                falhas += 1
-                logger.error(f"✗ Erro ao converter {pdf.name}: {e}")
+                if resultado['status'] == 'sucesso':
+                    sucesso += 1
+                    logger.info(f"✓ [{i}/{len(pdfs)}] {nome} convertido com sucesso")
+                else:
+                    falhas += 1
+                    logger.error(
+                        f"✗ [{i}/{len(pdfs)}] Erro ao converter {nome}: {resultado['erro']}"
+                    )
 
         return {
             'total_pdfs': len(pdfs),
             'sucesso': sucesso,
             'falhas': falhas,
-            'resultados': self.resultados
+            'retomados': len(retomados),
+            'quarentena': len(quarentena),
+            'resultados': self.resultados,
+            'makespan_estimado': makespan_estimado,
+            'makespan_real': (datetime.now() - inicio).total_seconds()
+        }
+
+    def _verificar_retomada(
+        self, pdfs: List[Path], registros: Dict[str, Dict]
+    ) -> Dict[str, Dict]:
+        """
+        Seleciona os PDFs que podem ser pulados ao retomar um lote.
+
+        Um PDF é pulado se o jornal o registra como convertido com
+        sucesso, o hash da entrada não mudou e o Markdown ainda existe.
+        Falhas anteriores são sempre refeitas.
+
+        Args:
+            pdfs: PDFs do lote
+            registros: Registros carregados do jornal
+
+        Returns:
+            Dicionário nome do PDF → resultado reaproveitado
+        """
+        retomados = {}
+
+        for pdf in pdfs:
+            registro = registros.get(pdf.name)
+            if not registro or registro['status'] != 'sucesso':
+                continue
+
+            try:
+                entrada = calcular_impressao_arquivo(pdf, registro)
+            except OSError:
+                continue
+
+            markdown = Path(registro['markdown']) if registro['markdown'] else None
+            if entrada['hash'] != registro['hash'] or not (markdown and markdown.exists()):
+                continue
+
+            retomados[pdf.name] = {
+                'pdf': pdf.name,
+                'status': 'sucesso',
+                'markdown': markdown,
+                'estatisticas': registro['estatisticas'],
+                'entrada': entrada,
+                'retomado': True
+            }
+
+        return retomados
+
+    def _verificar_quarentena(
+        self,
+        pdfs: List[Path],
+        registros: Dict[str, Dict],
+        quarentena: Dict[str, Dict],
+    ) -> Dict[str, Dict]:
+        """
+        Seleciona os PDFs em quarentena que devem ser pulados.
+
+        Um PDF só continua em quarentena enquanto o conteúdo for o mesmo
+        que causou a falha; uma versão nova é convertida normalmente.
+
+        Args:
+            pdfs: PDFs do lote
+            registros: Registros carregados do jornal
+            quarentena: PDFs em quarentena segundo o jornal
+
+        Returns:
+            Dicionário nome do PDF → resultado com status 'quarentena'
+        """
+        pulados = {}
+
+        for pdf in pdfs:
+            item = quarentena.get(pdf.name)
+            if not item:
+                continue
+
+            try:
+                entrada = calcular_impressao_arquivo(pdf, registros.get(pdf.name))
+            except OSError:
+                continue
+
+            if entrada['hash'] != item['hash']:
+                continue
+
+            pulados[pdf.name] = {
+                'pdf': pdf.name,
+                'status': 'quarentena',
+                'erro': item['motivo'],
+                'entrada': entrada
+            }
+
+        return pulados
+
+    def estimar_custos(self, pdfs: List[Path]) -> Dict[Path, float]:
+        """
+        Estima o custo (em segundos) de converter cada PDF.
+
+        Faz uma passada rápida de metadados com LeitorPDF (número de
+        páginas e tamanho em bytes), sem extrair conteúdo. O OCR, quando
+        ativo, domina o custo por página; nos modos automático e por
+        regiões, a fração de páginas escaneadas é estimada por
+        amostragem. PDFs que não abrem recebem custo zero.
+
+        Args:
+            pdfs: PDFs do lote
+
+        Returns:
+            Dicionário PDF → custo estimado
+        """
+        custos = {}
+
+        for pdf in pdfs:
+            try:
+                with LeitorPDF(pdf) as leitor:
+                    info = leitor.obter_informacoes()
+                    if self.ocr_habilitado in (OCR_AUTOMATICO, OCR_REGIOES):
+                        fracao_ocr = leitor.estimar_necessidade_ocr()
+                    else:
+                        fracao_ocr = 1.0 if self.ocr_habilitado else 0.0
+            except Exception:
+                custos[pdf] = 0.0
+                continue
+
+            custos[pdf] = estimar_custo(
+                total_paginas=info['total_paginas'],
+                tamanho=info['tamanho'],
+                ocr=fracao_ocr,
+                tabelas=self.extrair_tabelas,
+            )
+
+        return custos
+
+    def _opcoes_conversor(self) -> Dict:
+        """Retorna as opções repassadas a cada PDFConverter."""
+        return {
+            'ocr_habilitado': self.ocr_habilitado,
+            'extrair_imagens': self.extrair_imagens,
+            'extrair_tabelas': self.extrair_tabelas,
+            'idioma_ocr': self.idioma_ocr,
+            'verbose': self.verbose,
+            'diretorio_cache': self.diretorio_cache,
+            'ocr_escala_cinza': self.ocr_escala_cinza,
+            'diretorio_cache_ocr': self.diretorio_cache_ocr,
+            'ocr_preprocessar': self.ocr_preprocessar,
+            'ocr_memoria_maxima_mb': self.ocr_memoria_maxima_mb,
+            'ocr_tamanho_lote': self.ocr_tamanho_lote,
+            'imagens_originais': self.imagens_originais,
+            'deduplicar_imagens': self.deduplicar_imagens,
+            'threads_imagens': self.threads_imagens,
+            'filtrar_imagens': self.filtrar_imagens,
+            'dimensao_maxima_imagem': self.dimensao_maxima_imagem,
+            'formato_imagem': self.formato_imagem,
+            'qualidade_imagem': self.qualidade_imagem,
+            'adiar_imagens': self.adiar_imagens,
+            'prefiltrar_tabelas': self.prefiltrar_tabelas,
+        }
+
+    def _converter_serial(
+        self, pdfs: List[Path], registros: Dict[str, Dict], jornal: JornalLote
+    ):
+        """
+        Converte os PDFs um a um no processo atual.
+
+        Com OCR e ``workers_ocr`` > 1, um único MotorOCR atende o lote
+        inteiro, sem recriar os processos do Tesseract a cada PDF. Cada
+        resultado é registrado no jornal assim que o PDF termina.
+
+        Yields:
+            Resultado de cada PDF, na ordem da lista
+        """
+        opcoes = self._opcoes_conversor()
+        motor = None
+
+        if self.ocr_habilitado and self.workers_ocr > 1:
+            motor = MotorOCR(self.idioma_ocr, self.workers_ocr)
+            opcoes['motor_ocr'] = motor
+
+        try:
+            for i, pdf in enumerate(pdfs, start=1):
+                logger.info(f"[{i}/{len(pdfs)}] Convertendo: {pdf.name}")
+                resultado = _converter_pdf(
+                    pdf, self.diretorio_saida, opcoes, registros.get(pdf.name)
+                )
+                jornal.registrar(resultado)
+                yield resultado
+        finally:
+            if motor is not None:
+                motor.fechar()
+
+    def _converter_supervisionado(
+        self,
+        pdfs: List[Path],
+        custos: Dict[Path, float],
+        registros: Dict[str, Dict],
+        jornal: JornalLote,
+    ):
+        """
+        Converte os PDFs em processos filhos supervisionados.
+
+        Os PDFs são submetidos do mais caro para o mais barato (LPT), para
+        que um documento grande não fique por último e domine o tempo
+        total. Cada resultado é registrado no jornal assim que o PDF
+        termina, para que um lote interrompido não refaça conversões
+        concluídas atrás de um PDF lento; ao chamador, os resultados são
+        devolvidos na ordem da lista, independentemente da ordem de
+        submissão e de término. Um PDF que
+        derruba o processo ou excede o tempo limite ou o limite de memória
+        é registrado como falha e colocado em quarentena, sem afetar os
+        demais (ver SupervisorConversao).
+
+        Yields:
+            Resultado de cada PDF, na ordem da lista
+        """
+        logger.info(f"Convertendo com {self.max_workers} processos")
+
+        supervisor = SupervisorConversao(
+            self.diretorio_saida,
+            self._opcoes_conversor(),
+            max_workers=self.max_workers,
+            tempo_limite=self.tempo_limite,
+            limite_memoria=(
+                self.limite_memoria_mb * 1024 * 1024 if self.limite_memoria_mb else None
+            ),
+        )
+
+        # Submeter do maior para o menor custo (Longest Processing Time first)
+        ordem_submissao = sorted(
+            range(len(pdfs)), key=lambda i: custos.get(pdfs[i], 0.0), reverse=True
+        )
+        tarefas = [
+            (indice, pdfs[indice], registros.get(pdfs[indice].name))
+            for indice in ordem_submissao
+        ]
+
+        resultados = [None] * len(pdfs)
+        entregues = 0
+
+        for indice, resultado in supervisor.executar(tarefas):
+            if resultado.get('quarentena') and resultado.get('entrada') is None:
+                # O processo foi encerrado antes de devolver a impressão
+                pdf = pdfs[indice]
+                try:
+                    resultado['entrada'] = calcular_impressao_arquivo(
+                        pdf, registros.get(pdf.name)
+                    )
+                except OSError:
+                    pass
+
+            jornal.registrar(resultado)
+            resultados[indice] = resultado
+
+            # Entregar em ordem tudo o que já estiver pronto
+            while entregues < len(pdfs) and resultados[entregues] is not None:
+                yield resultados[entregues]
+                entregues += 1
+
+
+def estimar_custo(total_paginas: int, tamanho: int, ocr: float, tabelas: bool) -> float:
+    """
+    Estima o tempo de conversão de um PDF a partir dos seus metadados.
+
+    Args:
+        total_paginas: Número de páginas
+        tamanho: Tamanho do arquivo em bytes
+        ocr: Fração das páginas que passarão por OCR (True/False valem 1/0)
+        tabelas: Se a detecção de tabelas está ativa
+
+    Returns:
+        Custo estimado em segundos
+    """
+    por_pagina = ocr * SEGUNDOS_POR_PAGINA_OCR + (1 - ocr) * SEGUNDOS_POR_PAGINA_TEXTO
+    if tabelas:
+        por_pagina += SEGUNDOS_POR_PAGINA_TABELAS
+
+    return total_paginas * por_pagina + tamanho / (1024 * 1024) * SEGUNDOS_POR_MB
+
+
+def estimar_makespan(custos: List[float], workers: int) -> float:
+    """
+    Estima o tempo total do lote com escalonamento LPT.
+
+    Atribui cada tarefa, da mais cara para a mais barata, ao worker com
+    menor carga acumulada e retorna a maior carga final.
+
+    Args:
+        custos: Custo estimado de cada tarefa
+        workers: Número de workers
+
+    Returns:
+        Makespan estimado (mesma unidade dos custos)
+    """
+    cargas = [0.0] * max(1, workers)
+
+    for custo in sorted(custos, reverse=True):
+        menor = heapq.heappop(cargas)
+        heapq.heappush(cargas, menor + custo)
+
+    return max(cargas)
+
+
+def _converter_pdf(
+    pdf: Path,
+    diretorio_saida: Path,
+    opcoes: Dict,
+    anterior: Optional[Dict] = None,
+) -> Dict:
+    """
+    Converte um PDF e devolve o resultado no formato do relatório do lote.
+
+    Exceções são capturadas e registradas como falha, para que um PDF com
+    problema não interrompa os demais.
+
+    Args:
+        pdf: Caminho do PDF
+        diretorio_saida: Diretório de saída (comum a todo o lote)
+        opcoes: Opções repassadas ao PDFConverter
+        anterior: Registro do jornal para o PDF, se houver
+
+    Returns:
+        Dicionário com o resultado da conversão
+    """
+    entrada = None
+
+    try:
+        entrada = calcular_impressao_arquivo(pdf, anterior)
+
+        conversor = PDFConverter(
+            caminho_pdf=pdf,
+            diretorio_saida=diretorio_saida,
+            **opcoes
+        )
+
+        arquivo_md = conversor.converter()
+
+        return {
+            'pdf': pdf.name,
+            'status': 'sucesso',
+            'markdown': arquivo_md,
+            'estatisticas': conversor.obter_estatisticas(),
+            'entrada': entrada
         }
 
+    except Exception as e:
+        return {
+            'pdf': pdf.name,
+            'status': 'falha',
+            'erro': str(e),
+            'entrada': entrada
+        }
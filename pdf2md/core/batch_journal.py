@@ -0,0 +1,231 @@
+"""
+Jornal persistente de conversões em lote (SQLite).
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pdf2md.core.conversion_cache import calcular_hash_arquivo
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+
+def calcular_impressao_arquivo(
+    caminho: Path, anterior: Optional[Dict] = None
+) -> Dict:
+    """
+    Identifica o conteúdo de um arquivo de entrada.
+
+    O hash SHA-256 só é recalculado quando o tamanho ou a data de
+    modificação mudaram em relação à impressão anterior.
+
+    Args:
+        caminho: Caminho do arquivo
+        anterior: Impressão registrada anteriormente (opcional)
+
+    Returns:
+        Dicionário com tamanho, mtime_ns e hash
+    """
+    info = Path(caminho).stat()
+
+    if (
+        anterior
+        and anterior.get("tamanho") == info.st_size
+        and anterior.get("mtime_ns") == info.st_mtime_ns
+        and anterior.get("hash")
+    ):
+        hash_arquivo = anterior["hash"]
+    else:
+        hash_arquivo = calcular_hash_arquivo(caminho)
+
+    return {
+        "tamanho": info.st_size,
+        "mtime_ns": info.st_mtime_ns,
+        "hash": hash_arquivo,
+    }
+
+
+class JornalLote:
+    """
+    Registra o status de cada PDF de um lote em um banco SQLite.
+
+    O jornal fica no diretório de saída (``.pdf2md-jornal.sqlite``) e
+    guarda, por arquivo, o status, a impressão da entrada, o Markdown
+    gerado e as estatísticas. As gravações são acumuladas e enviadas em
+    uma única transação a cada ``tamanho_lote`` registros ou
+    ``intervalo`` segundos, para não limitar lotes com milhares de
+    arquivos por minuto.
+
+    PDFs que derrubaram ou excederam os limites do processo de conversão
+    ficam na tabela ``quarentena``, com o hash da entrada e o motivo, até
+    serem convertidos com sucesso.
+    """
+
+    NOME_ARQUIVO = ".pdf2md-jornal.sqlite"
+
+    def __init__(
+        self,
+        diretorio_saida: Path,
+        tamanho_lote: int = 200,
+        intervalo: float = 2.0,
+    ):
+        """
+        Abre (ou cria) o jornal do diretório de saída.
+
+        Args:
+            diretorio_saida: Diretório de saída do lote
+            tamanho_lote: Registros acumulados antes de gravar
+            intervalo: Tempo máximo, em segundos, entre gravações
+        """
+        self.caminho = Path(diretorio_saida) / self.NOME_ARQUIVO
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+
+        self._pendentes: List[tuple] = []
+        self._quarentena_pendente: List[tuple] = []
+        self._liberados: List[tuple] = []
+        self._ultima_gravacao = time.monotonic()
+
+        self.conexao = sqlite3.connect(str(self.caminho))
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.execute(
+            """
+            CREATE TABLE IF NOT EXISTS arquivos (
+                pdf TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                tamanho INTEGER,
+                mtime_ns INTEGER,
+                hash TEXT,
+                markdown TEXT,
+                estatisticas TEXT,
+                erro TEXT,
+                atualizado REAL
+            )
+            """
+        )
+        self.conexao.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quarentena (
+                pdf TEXT PRIMARY KEY,
+                hash TEXT,
+                motivo TEXT,
+                atualizado REAL
+            )
+            """
+        )
+        self.conexao.commit()
+
+    def carregar(self) -> Dict[str, Dict]:
+        """
+        Lê todos os registros do jornal.
+
+        Returns:
+            Dicionário nome do PDF → registro
+        """
+        cursor = self.conexao.execute(
+            "SELECT pdf, status, tamanho, mtime_ns, hash, markdown, "
+            "estatisticas, erro FROM arquivos"
+        )
+
+        registros = {}
+        for pdf, status, tamanho, mtime_ns, hash_, markdown, estatisticas, erro in cursor:
+            registros[pdf] = {
+                "pdf": pdf,
+                "status": status,
+                "tamanho": tamanho,
+                "mtime_ns": mtime_ns,
+                "hash": hash_,
+                "markdown": markdown,
+                "estatisticas": json.loads(estatisticas) if estatisticas else {},
+                "erro": erro,
+            }
+        return registros
+
+    def carregar_quarentena(self) -> Dict[str, Dict]:
+        """
+        Lê os PDFs em quarentena.
+
+        Returns:
+            Dicionário nome do PDF → {'hash', 'motivo'}
+        """
+        cursor = self.conexao.execute("SELECT pdf, hash, motivo FROM quarentena")
+        return {pdf: {"hash": hash_, "motivo": motivo} for pdf, hash_, motivo in cursor}
+
+    def registrar(self, resultado: Dict) -> None:
+        """
+        Acumula o resultado de um PDF para gravação.
+
+        Resultados marcados com ``quarentena`` também entram na tabela de
+        quarentena; um sucesso retira o PDF dela.
+
+        Args:
+            resultado: Resultado do lote (com 'entrada' contendo a impressão)
+        """
+        entrada = resultado.get("entrada") or {}
+        markdown = resultado.get("markdown")
+
+        if resultado.get("quarentena"):
+            self._quarentena_pendente.append(
+                (resultado["pdf"], entrada.get("hash"), resultado.get("erro"), time.time())
+            )
+        elif resultado["status"] == "sucesso":
+            self._liberados.append((resultado["pdf"],))
+
+        self._pendentes.append(
+            (
+                resultado["pdf"],
+                resultado["status"],
+                entrada.get("tamanho"),
+                entrada.get("mtime_ns"),
+                entrada.get("hash"),
+                str(markdown) if markdown else None,
+                json.dumps(resultado.get("estatisticas") or {}),
+                resultado.get("erro"),
+                time.time(),
+            )
+        )
+
+        if (
+            len(self._pendentes) >= self.tamanho_lote
+            or time.monotonic() - self._ultima_gravacao >= self.intervalo
+        ):
+            self.descarregar()
+
+    def descarregar(self) -> None:
+        """Grava os registros acumulados em uma única transação."""
+        if self._pendentes:
+            with self.conexao:
+                self.conexao.executemany(
+                    "INSERT OR REPLACE INTO arquivos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._pendentes,
+                )
+                self.conexao.executemany(
+                    "INSERT OR REPLACE INTO quarentena VALUES (?, ?, ?, ?)",
+                    self._quarentena_pendente,
+                )
+                self.conexao.executemany(
+                    "DELETE FROM quarentena WHERE pdf = ?", self._liberados
+                )
+            self._pendentes = []
+            self._quarentena_pendente = []
+            self._liberados = []
+
+        self._ultima_gravacao = time.monotonic()
+
+    def fechar(self) -> None:
+        """Grava o que estiver pendente e fecha o banco."""
+        try:
+            self.descarregar()
+        finally:
+            self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.fechar()
@@ -0,0 +1,169 @@
+"""
+Cache de conversões endereçado pelo conteúdo do PDF.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+from pdf2md import __version__
+from pdf2md.utils.cache_lru import CacheDiscoLRU
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+# Tamanho máximo padrão do cache de conversões (2 GiB)
+TAMANHO_MAXIMO_PADRAO = 2 * 1024 ** 3
+
+
+def calcular_hash_arquivo(caminho: Path, tamanho_bloco: int = 1024 * 1024) -> str:
+    """
+    Calcula o SHA-256 do conteúdo de um arquivo.
+
+    Args:
+        caminho: Caminho do arquivo
+        tamanho_bloco: Tamanho dos blocos lidos do disco
+
+    Returns:
+        Hash hexadecimal
+    """
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b""):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+class CacheConversao(CacheDiscoLRU):
+    """
+    Guarda o resultado de conversões (Markdown, imagens e estatísticas).
+
+    A chave combina o hash do conteúdo do PDF, as opções que alteram a
+    saída e a versão do pdf2md. O título do documento (nome do arquivo)
+    não faz parte da entrada: ele é reescrito na restauração, para que o
+    mesmo PDF enviado com outro nome também seja aproveitado.
+    """
+
+    ARQUIVO_MARKDOWN = "documento.md"
+    ARQUIVO_ESTATISTICAS = "estatisticas.json"
+    DIRETORIO_IMAGENS = "imagens"
+
+    def __init__(self, diretorio: Path, tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO):
+        """
+        Inicializa o cache de conversões.
+
+        Args:
+            diretorio: Diretório raiz do cache
+            tamanho_maximo: Tamanho máximo em bytes
+        """
+        super().__init__(diretorio, tamanho_maximo)
+
+    def calcular_chave(self, caminho_pdf: Path, opcoes: dict) -> str:
+        """
+        Calcula a chave de cache de um PDF.
+
+        Args:
+            caminho_pdf: Caminho do PDF
+            opcoes: Opções que afetam a saída da conversão
+
+        Returns:
+            Chave hexadecimal
+        """
+        descricao = json.dumps(
+            {
+                "pdf": calcular_hash_arquivo(caminho_pdf),
+                "opcoes": opcoes,
+                "versao": __version__,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(descricao.encode("utf-8")).hexdigest()
+
+    def restaurar(
+        self,
+        chave: str,
+        arquivo_saida: Path,
+        cabecalho: str,
+    ) -> Optional[dict]:
+        """
+        Restaura uma conversão do cache para o diretório de saída.
+
+        Args:
+            chave: Chave calculada por ``calcular_chave``
+            arquivo_saida: Caminho do Markdown a gerar
+            cabecalho: Cabeçalho (título) do documento atual
+
+        Returns:
+            Estatísticas da conversão original, ou None se não houver entrada
+        """
+        entrada = self.obter(chave)
+        if entrada is None:
+            return None
+
+        try:
+            corpo = (entrada / self.ARQUIVO_MARKDOWN).read_text(encoding="utf-8")
+            estatisticas = json.loads(
+                (entrada / self.ARQUIVO_ESTATISTICAS).read_text(encoding="utf-8")
+            )
+
+            origem_imagens = entrada / self.DIRETORIO_IMAGENS
+            if origem_imagens.is_dir():
+                destino_imagens = arquivo_saida.parent / self.DIRETORIO_IMAGENS
+                destino_imagens.mkdir(parents=True, exist_ok=True)
+                for imagem in origem_imagens.iterdir():
+                    shutil.copy2(imagem, destino_imagens / imagem.name)
+
+            with open(arquivo_saida, "w", encoding="utf-8") as f:
+                f.write(cabecalho)
+                f.write(corpo)
+
+        except (OSError, ValueError) as e:
+            logger.warning(f"Entrada de cache inválida ({chave[:12]}): {e}")
+            return None
+
+        return estatisticas
+
+    def armazenar(
+        self,
+        chave: str,
+        arquivo_markdown: Path,
+        cabecalho: str,
+        imagens: List[Path],
+        estatisticas: dict,
+    ) -> None:
+        """
+        Grava o resultado de uma conversão no cache.
+
+        Args:
+            chave: Chave calculada por ``calcular_chave``
+            arquivo_markdown: Markdown gerado
+            cabecalho: Cabeçalho (título) incluído no início do Markdown
+            imagens: Arquivos de imagem gerados pela conversão
+            estatisticas: Estatísticas da conversão
+        """
+        temporario = self.novo_temporario()
+
+        try:
+            conteudo = arquivo_markdown.read_text(encoding="utf-8")
+            if conteudo.startswith(cabecalho):
+                conteudo = conteudo[len(cabecalho):]
+
+            (temporario / self.ARQUIVO_MARKDOWN).write_text(conteudo, encoding="utf-8")
+            (temporario / self.ARQUIVO_ESTATISTICAS).write_text(
+                json.dumps(estatisticas), encoding="utf-8"
+            )
+
+            if imagens:
+                diretorio_imagens = temporario / self.DIRETORIO_IMAGENS
+                diretorio_imagens.mkdir()
+                for imagem in imagens:
+                    shutil.copy2(imagem, diretorio_imagens / Path(imagem).name)
+
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar no cache: {e}")
+            self._remover(temporario)
+            return
+
+        self.confirmar(chave, temporario)
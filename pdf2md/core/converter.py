@@ -1,20 +1,43 @@
 """
 Conversor principal de PDF para Markdown.
 """
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 import fitz  # PyMuPDF
 from colorama import init, Fore, Style
 
 # Inicializa colorama para Windows
 init(autoreset=True)
 
-from pdf2md.core.image_extractor import ExtratorImagens
-from pdf2md.core.ocr_processor import ProcessadorOCR
+from pdf2md.core.conversion_cache import CacheConversao, TAMANHO_MAXIMO_PADRAO
+from pdf2md.core.image_extractor import (
+    AREA_MINIMA_IMAGEM,
+    LADO_MINIMO_IMAGEM,
+    QUALIDADE_PADRAO,
+    ExtratorImagens,
+)
+from pdf2md.core.image_manifest import ManifestoImagens
+from pdf2md.core.incremental import ManifestoIncremental, calcular_impressao_pagina
+from pdf2md.core.ocr_cache import CacheOCR, TAMANHO_MAXIMO_PADRAO_OCR
+from pdf2md.core.ocr_engine import MotorOCR
+from pdf2md.core.ocr_processor import (
+    OCR_AUTOMATICO,
+    OCR_REGIOES,
+    ProcessadorOCR,
+    diagnosticar_pagina,
+)
+from pdf2md.core.page_context import ContextoPagina
 from pdf2md.core.table_extractor import ExtratorTabelas
-from pdf2md.core.text_extractor import ExtratorTexto
+from pdf2md.core.text_extractor import ExtratorTexto, mesclar_em_ordem_leitura
 from pdf2md.markdown.formatter import FormataadorMarkdown
 
+# Lotes de páginas em andamento ou prontos por processo na conversão
+# paralela; limita os resultados retidos atrás de um lote lento
+LOTES_PENDENTES_POR_WORKER = 2
+
 
 class PDFConverter:
     """Conversor completo de PDF → Markdown."""
@@ -23,11 +46,35 @@ class PDFConverter:
         self,
         caminho_pdf: Path,
         diretorio_saida: Path,
-        ocr_habilitado: bool = False,
+        ocr_habilitado=False,
         extrair_imagens: bool = False,
         extrair_tabelas: bool = True,
         idioma_ocr: str = "por",
         verbose: bool = False,
+        workers: int = 1,
+        streaming: bool = False,
+        diretorio_cache: Optional[Path] = None,
+        tamanho_maximo_cache: int = TAMANHO_MAXIMO_PADRAO,
+        incremental: bool = False,
+        workers_ocr: int = 1,
+        motor_ocr: Optional[MotorOCR] = None,
+        ocr_escala_cinza: bool = False,
+        diretorio_cache_ocr: Optional[Path] = None,
+        tamanho_maximo_cache_ocr: int = TAMANHO_MAXIMO_PADRAO_OCR,
+        ocr_preprocessar: bool = False,
+        ocr_memoria_maxima_mb: Optional[int] = None,
+        ocr_tamanho_lote: int = 1,
+        imagens_originais: bool = False,
+        deduplicar_imagens: bool = False,
+        threads_imagens: int = 0,
+        filtrar_imagens: bool = False,
+        lado_minimo_imagem: int = LADO_MINIMO_IMAGEM,
+        area_minima_imagem: float = AREA_MINIMA_IMAGEM,
+        dimensao_maxima_imagem: Optional[int] = None,
+        formato_imagem: str = "png",
+        qualidade_imagem: int = QUALIDADE_PADRAO,
+        adiar_imagens: bool = False,
+        prefiltrar_tabelas: bool = True,
     ):
         """
         Inicializa o conversor.
@@ -35,11 +82,67 @@ class PDFConverter:
         Args:
             caminho_pdf: Caminho do PDF
             diretorio_saida: Diretório de saída
-            ocr_habilitado: Ativar OCR
+            ocr_habilitado: Ativar OCR (True), desativar (False),
+                decidir página a página ("auto"): só páginas que parecem
+                escaneadas passam pelo OCR, ou reconhecer só as imagens
+                ("regioes"), mesclando o texto delas ao texto nativo
             extrair_imagens: Extrair imagens
             extrair_tabelas: Extrair tabelas
             idioma_ocr: Idioma para OCR
             verbose: Modo verbose
+            workers: Número de processos para converter páginas em paralelo
+            streaming: Escrever o Markdown no arquivo à medida que cada
+                página é concluída, em vez de acumular tudo em memória
+                (com ``workers`` > 1, ficam em memória no máximo os lotes
+                de páginas pendentes da conversão paralela)
+            diretorio_cache: Diretório do cache de conversões (None desativa)
+            tamanho_maximo_cache: Tamanho máximo do cache, em bytes
+            incremental: Reaproveitar os fragmentos das páginas que não
+                mudaram desde a última conversão para o mesmo diretório
+            workers_ocr: Número de processos do MotorOCR criado para o
+                documento (1 executa o OCR no processo atual)
+            motor_ocr: MotorOCR compartilhado (por exemplo, entre os PDFs
+                de um lote); tem precedência sobre ``workers_ocr``
+            ocr_escala_cinza: Renderizar as páginas do OCR em tons de cinza
+            diretorio_cache_ocr: Diretório do cache de textos de OCR por
+                página (None desativa)
+            tamanho_maximo_cache_ocr: Tamanho máximo do cache de OCR, em bytes
+            ocr_preprocessar: Binarizar, endireitar e recortar as margens das
+                páginas antes do OCR
+            ocr_memoria_maxima_mb: Memória máxima das imagens de uma página
+                em OCR, em MB; páginas maiores (plantas, pôsteres) são
+                reconhecidas em faixas
+            ocr_tamanho_lote: Páginas reconhecidas por execução do
+                Tesseract; lotes maiores diluem o custo de iniciar o
+                processo e carregar o modelo do idioma
+            imagens_originais: Gravar as imagens JPEG, JPEG 2000 e PNG com
+                os bytes do PDF, sem recodificá-las em PNG
+            deduplicar_imagens: Gravar cada imagem uma única vez em
+                ``imagens/``, com o nome dado pelo hash do conteúdo; as
+                repetições (no documento ou entre PDFs com a mesma saída)
+                apontam para o mesmo arquivo
+            threads_imagens: Threads que codificam e gravam as imagens
+                enquanto as páginas seguintes são processadas (0 grava no
+                próprio laço das páginas)
+            filtrar_imagens: Ignorar imagens decorativas antes de
+                decodificá-las: pequenas, quase invisíveis na página ou de
+                uma cor só
+            lado_minimo_imagem: Menor lado declarado, em pixels, de uma
+                imagem mantida pelo filtro
+            area_minima_imagem: Menor área na página, em pt², de uma imagem
+                mantida pelo filtro
+            dimensao_maxima_imagem: Maior lado das imagens gravadas, em
+                pixels; imagens maiores são reduzidas (None mantém)
+            formato_imagem: Formato das imagens convertidas: 'png', 'jpeg'
+                ou 'webp'
+            qualidade_imagem: Qualidade (1-100) de JPEG e WebP
+            adiar_imagens: Referenciar as imagens no Markdown sem gravá-las:
+                o manifesto ``<nome>.imagens.json`` liga cada referência ao
+                xref e à posição da imagem no PDF, e ``materializar_imagens``
+                grava as que forem pedidas depois (o cache de conversões não
+                é usado neste modo)
+            prefiltrar_tabelas: Procurar tabelas só nas páginas cujos
+                desenhos formam uma grade de linhas
 
         Raises:
             FileNotFoundError: Se o arquivo PDF não existir
@@ -61,6 +164,41 @@ class PDFConverter:
         self.extrair_tabelas = extrair_tabelas
         self.idioma_ocr = idioma_ocr
         self.verbose = verbose
+        self.workers = max(1, int(workers))
+        self.streaming = streaming
+        self.cache = (
+            CacheConversao(diretorio_cache, tamanho_maximo_cache)
+            if diretorio_cache is not None
+            else None
+        )
+        self.incremental = incremental
+        self.manifesto = None
+        self._impressoes = {}
+        self.workers_ocr = max(1, int(workers_ocr))
+        self.motor_ocr = motor_ocr
+        self.ocr_escala_cinza = ocr_escala_cinza
+        self.diretorio_cache_ocr = diretorio_cache_ocr
+        self.tamanho_maximo_cache_ocr = tamanho_maximo_cache_ocr
+        self.ocr_preprocessar = ocr_preprocessar
+        self.ocr_memoria_maxima_mb = ocr_memoria_maxima_mb
+        self.ocr_tamanho_lote = max(1, int(ocr_tamanho_lote))
+        self.imagens_originais = imagens_originais
+        self.deduplicar_imagens = deduplicar_imagens
+        self.threads_imagens = max(0, int(threads_imagens))
+        self.filtrar_imagens = filtrar_imagens
+        self.lado_minimo_imagem = lado_minimo_imagem
+        self.area_minima_imagem = area_minima_imagem
+        self.dimensao_maxima_imagem = dimensao_maxima_imagem
+        self.formato_imagem = formato_imagem
+        self.qualidade_imagem = qualidade_imagem
+        self.adiar_imagens = adiar_imagens
+        self.prefiltrar_tabelas = prefiltrar_tabelas
+        self.cache_ocr = (
+            CacheOCR(diretorio_cache_ocr, tamanho_maximo_cache_ocr)
+            if diretorio_cache_ocr is not None and ocr_habilitado
+            else None
+        )
+        self._diagnosticos = {}
 
         # Criar diretório de saída
         self.diretorio_saida.mkdir(parents=True, exist_ok=True)
@@ -69,13 +207,30 @@ class PDFConverter:
             titulo=self.caminho_pdf.stem, verbose=verbose
         )
 
+        # Extratores (criados uma vez por documento em _preparar_extratores)
+        self.extrator_texto = None
+        self.extrator_tabelas = None
+        self.extrator_imagens = None
+        self.processador_ocr = None
+
+        # Arquivos de imagem gravados (guardados no cache de conversões)
+        self.imagens_geradas = []
+
+        # Referências às imagens adiadas (ver ManifestoImagens)
+        self.imagens_manifesto = []
+
         self.estatisticas = {
             "paginas_processadas": 0,
             "imagens_extraidas": 0,
+            "imagens_unicas": 0,
+            "imagens_referencias": 0,
             "tabelas_extraidas": 0,
             "caracteres_extraidos": 0,
             "tempo_conversao": 0,
             "tamanho_arquivo_saida": 0,
+            "cache_acerto": False,
+            "paginas_reutilizadas": 0,
+            "paginas_reconvertidas": 0,
         }
 
     def _log(self, mensagem: str, tipo: str = 'info'):
@@ -126,13 +281,29 @@ class PDFConverter:
             Caminho do arquivo Markdown gerado
         """
         inicio = datetime.now()
+        arquivo_saida = self.diretorio_saida / f"{self.caminho_pdf.stem}.md"
+        arquivo_streaming = None
+        chave_cache = None
 
         try:
             self._log(f'📄 Iniciando conversão: {self.caminho_pdf.name}', 'file')
 
+            # O cache não guarda o manifesto das imagens adiadas
+            if self.cache is not None and not self.adiar_imagens:
+                chave_cache = self.cache.calcular_chave(
+                    self.caminho_pdf, self._opcoes_saida()
+                )
+                if self._restaurar_do_cache(chave_cache, arquivo_saida):
+                    return self._finalizar(inicio, arquivo_saida)
+
+            if self.streaming:
+                arquivo_streaming = open(arquivo_saida, "w", encoding="utf-8")
+                self.formatador.destino = arquivo_streaming
+
             # Adicionar título principal
             self.formatador.adicionar_titulo(self.caminho_pdf.stem, nivel=1)
             self.formatador.adicionar_quebra_pagina()
+            self.formatador.descarregar()
 
             # Abrir PDF
             documento = fitz.open(str(self.caminho_pdf))
@@ -141,99 +312,673 @@ class PDFConverter:
                 total_paginas = len(documento)
                 self._log(f'PDF aberto: {total_paginas} páginas', 'info')
 
-                # Processar cada página
-                for num_pagina in range(total_paginas):
-                    self._log(
-                        f'⚙️ Processando página {num_pagina + 1}/{total_paginas}...',
-                        'processing'
-                    )
-
-                    self._processar_pagina(documento, num_pagina)
-                    self.estatisticas["paginas_processadas"] += 1
+                resultados = self._gerar_resultados_paginas(
+                    documento, total_paginas, arquivo_saida
+                )
+                for resultado in resultados:
+                    self._registrar_pagina(resultado)
 
             finally:
+                # As imagens precisam estar no disco antes do cache e do retorno
+                self._concluir_imagens(self.estatisticas)
                 documento.close()
 
             # Gerar arquivo Markdown
-            arquivo_saida = self._gerar_arquivo_markdown()
+            if arquivo_streaming is not None:
+                arquivo_streaming.close()
+                self._log(f'Arquivo Markdown salvo: {arquivo_saida}', 'info')
+            else:
+                arquivo_saida = self._gerar_arquivo_markdown()
 
-            # Calcular estatísticas finais
-            self.estatisticas["tempo_conversao"] = (
-                datetime.now() - inicio
-            ).total_seconds()
-
-            if arquivo_saida.exists():
-                self.estatisticas["tamanho_arquivo_saida"] = (
-                    arquivo_saida.stat().st_size
+            if self.adiar_imagens and self.extrair_imagens:
+                ManifestoImagens(arquivo_saida).salvar(
+                    self.caminho_pdf,
+                    self.imagens_manifesto,
+                    {
+                        "formato": self.formato_imagem,
+                        "qualidade": self.qualidade_imagem,
+                        "dimensao_maxima": self.dimensao_maxima_imagem,
+                    },
                 )
 
-            self._log(f'✅ Conversão concluída: {arquivo_saida}', 'success')
+            if self.manifesto is not None:
+                self.manifesto.salvar()
+                self._log(
+                    f"Páginas reutilizadas: {self.estatisticas['paginas_reutilizadas']}, "
+                    f"reconvertidas: {self.estatisticas['paginas_reconvertidas']}",
+                    'info'
+                )
 
-            # Exibir estatísticas
-            if self.verbose:
-                self._exibir_estatisticas()
+            if chave_cache is not None:
+                self.cache.armazenar(
+                    chave_cache,
+                    arquivo_saida,
+                    self._gerar_cabecalho(),
+                    # Imagens deduplicadas aparecem uma vez por referência
+                    list(dict.fromkeys(self.imagens_geradas)),
+                    self._estatisticas_para_cache(),
+                )
 
-            return arquivo_saida
+            return self._finalizar(inicio, arquivo_saida)
 
         except Exception as e:
             self._log(f'❌ Erro durante conversão: {e}', 'error')
             raise
 
+        finally:
+            if arquivo_streaming is not None:
+                arquivo_streaming.close()
+                self.formatador.destino = None
+
+    def _finalizar(self, inicio: datetime, arquivo_saida: Path) -> Path:
+        """
+        Calcula as estatísticas finais e encerra a conversão.
+
+        Args:
+            inicio: Momento de início da conversão
+            arquivo_saida: Markdown gerado
+
+        Returns:
+            Caminho do arquivo Markdown gerado
+        """
+        self.estatisticas["tempo_conversao"] = (
+            datetime.now() - inicio
+        ).total_seconds()
+
+        if arquivo_saida.exists():
+            self.estatisticas["tamanho_arquivo_saida"] = (
+                arquivo_saida.stat().st_size
+            )
+
+        # Páginas ignoradas pelo pré-filtro de tabelas, ao custo medido na
+        # página de amostra, menos o próprio pré-filtro
+        amostras = self.estatisticas.get("paginas_amostra_tabelas")
+        if amostras:
+            self.estatisticas["tempo_economizado_tabelas"] = (
+                self.estatisticas.get("paginas_sem_tabelas", 0)
+                * self.estatisticas["tempo_amostra_tabelas"] / amostras
+                - self.estatisticas.get("tempo_prefiltro_tabelas", 0)
+            )
+
+        self._log(f'✅ Conversão concluída: {arquivo_saida}', 'success')
+
+        # Exibir estatísticas
+        if self.verbose:
+            self._exibir_estatisticas()
+
+        return arquivo_saida
+
+    def _opcoes_saida(self) -> dict:
+        """Retorna as opções que alteram o Markdown gerado (chave do cache)."""
+        return {
+            "ocr_habilitado": self.ocr_habilitado,
+            "extrair_tabelas": self.extrair_tabelas,
+            "extrair_imagens": self.extrair_imagens,
+            "idioma_ocr": self.idioma_ocr,
+            "ocr_escala_cinza": self.ocr_escala_cinza,
+            "ocr_preprocessar": self.ocr_preprocessar,
+            "ocr_memoria_maxima_mb": self.ocr_memoria_maxima_mb,
+            "imagens_originais": self.imagens_originais,
+            "deduplicar_imagens": self.deduplicar_imagens,
+            "filtrar_imagens": self.filtrar_imagens,
+            "lado_minimo_imagem": self.lado_minimo_imagem,
+            "area_minima_imagem": self.area_minima_imagem,
+            "dimensao_maxima_imagem": self.dimensao_maxima_imagem,
+            "formato_imagem": self.formato_imagem,
+            "qualidade_imagem": self.qualidade_imagem,
+            "adiar_imagens": self.adiar_imagens,
+        }
+
+    def _gerar_cabecalho(self) -> str:
+        """Retorna o título principal que abre o Markdown."""
+        formatador = FormataadorMarkdown(titulo=self.caminho_pdf.stem)
+        formatador.adicionar_titulo(self.caminho_pdf.stem, nivel=1)
+        formatador.adicionar_quebra_pagina()
+        return formatador.obter_conteudo()
+
+    def _restaurar_do_cache(self, chave: str, arquivo_saida: Path) -> bool:
+        """
+        Restaura a conversão do cache, sem abrir o PDF.
+
+        Args:
+            chave: Chave de cache do PDF
+            arquivo_saida: Markdown a gerar
+
+        Returns:
+            True se a conversão foi restaurada do cache
+        """
+        estatisticas = self.cache.restaurar(
+            chave, arquivo_saida, self._gerar_cabecalho()
+        )
+        if estatisticas is None:
+            return False
+
+        self.estatisticas.update(estatisticas)
+        self.estatisticas["cache_acerto"] = True
+        self._log(f'Conversão restaurada do cache: {arquivo_saida}', 'success')
+        return True
+
+    def _estatisticas_para_cache(self) -> dict:
+        """Retorna as estatísticas guardadas junto com a conversão."""
+        ignoradas = {
+            "tempo_conversao",
+            "tamanho_arquivo_saida",
+            "cache_acerto",
+            "paginas_reutilizadas",
+            "paginas_reconvertidas",
+            "ocr_cache_acertos",
+            "ocr_cache_falhas",
+            "ocr_preprocessamento",
+            "lotes_ocr",
+            "tempo_prefiltro_tabelas",
+            "tempo_amostra_tabelas",
+            "paginas_amostra_tabelas",
+            "tempo_economizado_tabelas",
+        }
+        return {
+            chave: valor
+            for chave, valor in self.estatisticas.items()
+            if chave not in ignoradas
+        }
+
+    def _gerar_resultados_paginas(
+        self, documento: fitz.Document, total_paginas: int, arquivo_saida: Path
+    ):
+        """
+        Produz o resultado de cada página, na ordem do documento.
+
+        No modo incremental, as páginas cuja impressão digital não mudou
+        vêm do manifesto da conversão anterior; só as demais são
+        convertidas, em série ou em paralelo conforme ``workers``.
+
+        Args:
+            documento: Documento PDF aberto
+            total_paginas: Total de páginas do documento
+            arquivo_saida: Markdown a gerar
+
+        Yields:
+            Resultados de página (ver ``_converter_pagina``)
+        """
+        reaproveitados = {}
+        self._impressoes = {}
+
+        if self.incremental:
+            self.manifesto = ManifestoIncremental(arquivo_saida, self._opcoes_saida())
+            self.manifesto.carregar()
+
+            for num_pagina in range(total_paginas):
+                impressao = calcular_impressao_pagina(documento, num_pagina)
+                self._impressoes[num_pagina] = impressao
+
+                anterior = self.manifesto.buscar(num_pagina, impressao)
+                if anterior is not None:
+                    reaproveitados[num_pagina] = anterior
+
+        pendentes = [n for n in range(total_paginas) if n not in reaproveitados]
+
+        if self.workers > 1 and len(pendentes) > 1:
+            novos = self._converter_paginas_paralelo(pendentes)
+        else:
+            novos = self._converter_paginas_serial(documento, pendentes, total_paginas)
+
+        for num_pagina in range(total_paginas):
+            if num_pagina in reaproveitados:
+                resultado = dict(reaproveitados[num_pagina], reaproveitada=True)
+            else:
+                resultado = next(novos)
+            yield resultado
+
+    def _converter_paginas_serial(
+        self, documento: fitz.Document, paginas: list, total_paginas: int
+    ):
+        """
+        Converte as páginas no processo atual, na ordem do documento.
+
+        Com um MotorOCR, as páginas que passarão pelo OCR são renderizadas
+        e enviadas ao motor antes de serem processadas, mantendo até
+        ``tamanho_fila`` páginas à frente; o Tesseract trabalha em paralelo
+        enquanto as páginas anteriores são montadas. Com lotes de OCR, a
+        janela cresce para ``tamanho_lote`` páginas por vaga da fila.
+
+        Args:
+            documento: Documento PDF aberto
+            paginas: Números das páginas a converter, em ordem crescente
+            total_paginas: Total de páginas do documento
+
+        Yields:
+            Resultados de página (ver ``_converter_pagina``)
+        """
+        self._preparar_extratores(documento)
+
+        motor = self.motor_ocr
+        motor_proprio = None
+        if (
+            motor is None
+            and self.workers_ocr > 1
+            and self.processador_ocr is not None
+            and self.processador_ocr.ocr_disponivel
+        ):
+            motor = motor_proprio = MotorOCR(self.idioma_ocr, self.workers_ocr)
+
+        if self.processador_ocr is None or (
+            motor is None and self.ocr_tamanho_lote == 1
+        ):
+            for num_pagina in paginas:
+                yield self._converter_pagina(documento, num_pagina, total_paginas)
+            return
+
+        self.processador_ocr.motor = motor
+        tamanho_janela = (motor.tamanho_fila if motor else 1) * self.ocr_tamanho_lote
+        janela = deque()
+
+        try:
+            for num_pagina in paginas:
+                with ContextoPagina(documento, num_pagina) as contexto:
+                    if self._decidir_ocr(num_pagina, contexto, registrar=False):
+                        self.processador_ocr.antecipar(num_pagina, contexto)
+                janela.append(num_pagina)
+
+                if len(janela) >= tamanho_janela:
+                    yield self._converter_pagina(
+                        documento, janela.popleft(), total_paginas
+                    )
+
+            while janela:
+                yield self._converter_pagina(documento, janela.popleft(), total_paginas)
+
+        finally:
+            self.processador_ocr.motor = None
+            if motor_proprio is not None:
+                motor_proprio.fechar()
+
+    def _converter_paginas_paralelo(self, paginas: list):
+        """
+        Distribui as páginas entre processos e devolve os resultados em ordem.
+
+        Cada processo abre o seu próprio documento e converte um lote
+        contíguo de páginas como na conversão serial (incluindo os lotes de
+        OCR). Os resultados voltam na ordem das páginas, de modo que o
+        Markdown final é idêntico ao da conversão serial. No máximo
+        ``LOTES_PENDENTES_POR_WORKER`` lotes por processo ficam submetidos
+        sem ter sido consumidos: um lote lento retém na memória só os
+        lotes seguintes dessa janela, e não o documento inteiro.
+
+        Args:
+            paginas: Números das páginas a converter, em ordem crescente
+
+        Yields:
+            Resultados de página (ver ``_converter_pagina``)
+        """
+        # Mais lotes que processos para equilibrar páginas de custo desigual
+        tamanho = max(1, -(-len(paginas) // (self.workers * 4)))
+        if self.ocr_habilitado and self.ocr_tamanho_lote > 1:
+            # Lotes de páginas múltiplos do lote de OCR, que não atravessa
+            # processos
+            tamanho = -(-tamanho // self.ocr_tamanho_lote) * self.ocr_tamanho_lote
+        lotes = [paginas[i:i + tamanho] for i in range(0, len(paginas), tamanho)]
+
+        self._log(
+            f'Processando {len(paginas)} páginas em {self.workers} processos '
+            f'({len(lotes)} lotes)',
+            'processing'
+        )
+
+        opcoes = self._opcoes_worker()
+
+        pendentes = deque()
+        a_submeter = iter(lotes)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+
+            def submeter_proximo() -> None:
+                lote = next(a_submeter, None)
+                if lote is not None:
+                    pendentes.append(executor.submit(
+                        _converter_paginas_worker,
+                        self.caminho_pdf,
+                        self.diretorio_saida,
+                        opcoes,
+                        lote,
+                    ))
+
+            for _ in range(self.workers * LOTES_PENDENTES_POR_WORKER):
+                submeter_proximo()
+
+            while pendentes:
+                resultados = pendentes.popleft().result()
+                # Repor a vaga antes de entregar o lote consumido
+                submeter_proximo()
+                yield from resultados
+
+    def _converter_pagina(
+        self, documento: fitz.Document, numero_pagina: int, total_paginas: int
+    ) -> dict:
+        """
+        Converte uma página isoladamente.
+
+        Args:
+            documento: Documento PDF aberto
+            numero_pagina: Número da página (0-indexed)
+            total_paginas: Total de páginas (usado nas mensagens)
+
+        Returns:
+            Dicionário com o número da página, o fragmento Markdown, as
+            estatísticas da página e as imagens gravadas
+        """
+        self._log(
+            f'⚙️ Processando página {numero_pagina + 1}/{total_paginas}...',
+            'processing'
+        )
+
+        # Isolar o conteúdo e as estatísticas da página
+        conteudo_documento = self.formatador.conteudo
+        estatisticas_documento = self.estatisticas
+        imagens_documento = self.imagens_geradas
+        manifesto_documento = self.imagens_manifesto
+
+        self.formatador.conteudo = []
+        self.estatisticas = defaultdict(int)
+        self.imagens_geradas = []
+        self.imagens_manifesto = []
+
+        try:
+            self._processar_pagina(documento, numero_pagina)
+            self.estatisticas["paginas_processadas"] += 1
+
+            return {
+                "numero": numero_pagina,
+                "fragmento": self.formatador.obter_conteudo(),
+                "estatisticas": dict(self.estatisticas),
+                "imagens": self.imagens_geradas,
+                "imagens_manifesto": self.imagens_manifesto,
+            }
+
+        finally:
+            self.formatador.conteudo = conteudo_documento
+            self.estatisticas = estatisticas_documento
+            self.imagens_geradas = imagens_documento
+            self.imagens_manifesto = manifesto_documento
+
+    def _registrar_pagina(self, resultado: dict) -> None:
+        """
+        Incorpora o resultado de uma página ao documento.
+
+        Args:
+            resultado: Resultado da página (ver ``_converter_pagina``)
+        """
+        self.formatador.conteudo.append(resultado["fragmento"])
+        self.formatador.descarregar()
+
+        _acumular_estatisticas(self.estatisticas, resultado["estatisticas"])
+        self.imagens_geradas.extend(Path(imagem) for imagem in resultado["imagens"])
+        self.imagens_manifesto.extend(resultado.get("imagens_manifesto", []))
+
+        if self.manifesto is not None:
+            if resultado.get("reaproveitada"):
+                self.estatisticas["paginas_reutilizadas"] += 1
+            else:
+                self.estatisticas["paginas_reconvertidas"] += 1
+
+            self.manifesto.registrar(resultado, self._impressoes[resultado["numero"]])
+
+    def _opcoes_worker(self) -> dict:
+        """Retorna as opções usadas para recriar o conversor em um worker."""
+        return {
+            "ocr_habilitado": self.ocr_habilitado,
+            "extrair_imagens": self.extrair_imagens,
+            "extrair_tabelas": self.extrair_tabelas,
+            "idioma_ocr": self.idioma_ocr,
+            "verbose": self.verbose,
+            "ocr_escala_cinza": self.ocr_escala_cinza,
+            "ocr_preprocessar": self.ocr_preprocessar,
+            "ocr_memoria_maxima_mb": self.ocr_memoria_maxima_mb,
+            "ocr_tamanho_lote": self.ocr_tamanho_lote,
+            "imagens_originais": self.imagens_originais,
+            "deduplicar_imagens": self.deduplicar_imagens,
+            "threads_imagens": self.threads_imagens,
+            "filtrar_imagens": self.filtrar_imagens,
+            "lado_minimo_imagem": self.lado_minimo_imagem,
+            "area_minima_imagem": self.area_minima_imagem,
+            "dimensao_maxima_imagem": self.dimensao_maxima_imagem,
+            "formato_imagem": self.formato_imagem,
+            "qualidade_imagem": self.qualidade_imagem,
+            "adiar_imagens": self.adiar_imagens,
+            "prefiltrar_tabelas": self.prefiltrar_tabelas,
+            "diretorio_cache_ocr": self.diretorio_cache_ocr,
+            "tamanho_maximo_cache_ocr": self.tamanho_maximo_cache_ocr,
+        }
+
+    def _preparar_extratores(self, documento: fitz.Document) -> None:
+        """
+        Cria os extratores uma única vez para o documento aberto.
+
+        Args:
+            documento: Documento PDF aberto
+        """
+        self.extrator_texto = ExtratorTexto(documento, self.verbose)
+
+        self.processador_ocr = (
+            ProcessadorOCR(
+                documento,
+                self.idioma_ocr,
+                self.verbose,
+                motor=self.motor_ocr,
+                escala_cinza=self.ocr_escala_cinza,
+                cache=self.cache_ocr,
+                preprocessar=self.ocr_preprocessar,
+                memoria_maxima=(
+                    self.ocr_memoria_maxima_mb * 1024 * 1024
+                    if self.ocr_memoria_maxima_mb
+                    else None
+                ),
+                tamanho_lote=self.ocr_tamanho_lote,
+            )
+            if self.ocr_habilitado
+            else None
+        )
+        self.extrator_tabelas = (
+            ExtratorTabelas(documento, self.verbose, prefiltrar=self.prefiltrar_tabelas)
+            if self.extrair_tabelas
+            else None
+        )
+        self.extrator_imagens = (
+            ExtratorImagens(
+                documento, self.diretorio_saida, self.verbose,
+                originais=self.imagens_originais,
+                deduplicar=self.deduplicar_imagens,
+                threads_gravacao=self.threads_imagens,
+                lado_minimo=self.lado_minimo_imagem if self.filtrar_imagens else 0,
+                area_minima=self.area_minima_imagem if self.filtrar_imagens else 0,
+                descartar_uniformes=self.filtrar_imagens,
+                dimensao_maxima=self.dimensao_maxima_imagem,
+                formato=self.formato_imagem,
+                qualidade=self.qualidade_imagem,
+                adiar=self.adiar_imagens,
+            )
+            if self.extrair_imagens
+            else None
+        )
+
+    def _concluir_imagens(self, estatisticas: dict) -> None:
+        """
+        Aguarda as imagens gravadas em segundo plano.
+
+        Args:
+            estatisticas: Estatísticas que recebem os bytes gravados e a
+                correção das imagens que outro processo gravou primeiro
+        """
+        if self.extrator_imagens is None:
+            return
+
+        gravados = self.extrator_imagens.fechar()
+        if gravados:
+            estatisticas["bytes_imagens"] = estatisticas.get("bytes_imagens", 0) + gravados
+        _acumular_estatisticas(estatisticas, self.extrator_imagens.coletar_contadores())
+
     def _processar_pagina(self, documento: fitz.Document, numero_pagina: int) -> None:
         """
         Processa uma página do PDF.
 
+        A página é carregada uma única vez em um ContextoPagina,
+        compartilhado por todos os extratores.
+
         Args:
             documento: Documento PDF aberto
             numero_pagina: Número da página
         """
+        if self.extrator_texto is None or self.extrator_texto.documento is not documento:
+            self._preparar_extratores(documento)
+
         # Adicionar separador de página
         if numero_pagina > 0:
             self.formatador.adicionar_linha_horizontal()
 
-        # Extrair texto
-        extrator_texto = ExtratorTexto(documento, self.verbose)
-
-        # Processar OCR se habilitado
-        if self.ocr_habilitado:
-            self._log('🔍 Aplicando OCR...', 'ocr')
-            processador_ocr = ProcessadorOCR(documento, self.idioma_ocr, self.verbose)
-            texto_ocr = processador_ocr.processar_pagina_ocr(numero_pagina)
-            if texto_ocr:
-                self.formatador.adicionar_paragrafo(texto_ocr)
-                self.estatisticas["caracteres_extraidos"] += len(texto_ocr)
-        else:
-            # Extrair texto normal
-            blocos = extrator_texto.extrair_blocos_estruturados(numero_pagina)
-            for bloco in blocos:
-                texto = bloco["texto"]
-                self.formatador.adicionar_paragrafo(texto)
-                self.estatisticas["caracteres_extraidos"] += len(texto)
-
-        # Extrair tabelas
-        if self.extrair_tabelas:
-            self._log(f'📊 Extraindo tabelas da página {numero_pagina + 1}...', 'table')
-            extrator_tabelas = ExtratorTabelas(documento, self.verbose)
-            tabelas = extrator_tabelas.detectar_tabelas_pagina(numero_pagina)
-            for tabela in tabelas:
-                md_tabela = extrator_tabelas.extrair_tabela_para_markdown(tabela)
-                if md_tabela:
-                    self.formatador.adicionar_tabela(md_tabela)
-                    self.estatisticas["tabelas_extraidas"] += 1
-
-        # Extrair imagens
-        if self.extrair_imagens:
-            self._log(f'🖼️ Extraindo imagens da página {numero_pagina + 1}...', 'image')
-            extrator_imagens = ExtratorImagens(
-                documento, self.diretorio_saida, self.verbose
-            )
-            imagens = extrator_imagens.extrair_imagens_pagina(numero_pagina)
-            for imagem in imagens:
-                self.formatador.adicionar_imagem(
-                    caminho_relativo=imagem["caminho_relativo"],
-                    titulo=f"Imagem {imagem['numero_pagina']}.{imagem['indice']}",
+        with ContextoPagina(documento, numero_pagina) as contexto:
+            texto_ocr = None
+
+            # Processar OCR se habilitado
+            if self._decidir_ocr(numero_pagina, contexto):
+                self._log('🔍 Aplicando OCR...', 'ocr')
+                texto_ocr = self.processador_ocr.processar_pagina_ocr(
+                    numero_pagina, contexto
+                )
+                _acumular_estatisticas(
+                    self.estatisticas, self.processador_ocr.coletar_contadores()
+                )
+                if texto_ocr:
+                    self.formatador.adicionar_paragrafo(texto_ocr)
+                    self.estatisticas["caracteres_extraidos"] += len(texto_ocr)
+
+            # No modo automático, um OCR sem resultado cai no texto nativo
+            if texto_ocr is None or (not texto_ocr and self.ocr_habilitado == OCR_AUTOMATICO):
+                # Extrair texto normal
+                blocos = self.extrator_texto.extrair_blocos_estruturados(
+                    numero_pagina, contexto
+                )
+                if self.ocr_habilitado == OCR_REGIOES:
+                    blocos = self._mesclar_regioes_ocr(numero_pagina, contexto, blocos)
+                for bloco in blocos:
+                    texto = bloco["texto"]
+                    self.formatador.adicionar_paragrafo(texto)
+                    self.estatisticas["caracteres_extraidos"] += len(texto)
+
+            # Extrair tabelas
+            if self.extrair_tabelas:
+                self._log(f'📊 Extraindo tabelas da página {numero_pagina + 1}...', 'table')
+                tabelas = self.extrator_tabelas.detectar_tabelas_pagina(
+                    numero_pagina, contexto
                 )
-                self.estatisticas["imagens_extraidas"] += 1
+                _acumular_estatisticas(
+                    self.estatisticas, self.extrator_tabelas.coletar_contadores()
+                )
+                for tabela in tabelas:
+                    md_tabela = self.extrator_tabelas.extrair_tabela_para_markdown(tabela)
+                    if md_tabela:
+                        self.formatador.adicionar_tabela(md_tabela)
+                        self.estatisticas["tabelas_extraidas"] += 1
+
+            # Extrair imagens
+            if self.extrair_imagens:
+                self._log(f'🖼️ Extraindo imagens da página {numero_pagina + 1}...', 'image')
+                imagens = self.extrator_imagens.extrair_imagens_pagina(
+                    numero_pagina, contexto
+                )
+                _acumular_estatisticas(
+                    self.estatisticas, self.extrator_imagens.coletar_contadores()
+                )
+                for imagem in imagens:
+                    self.formatador.adicionar_imagem(
+                        caminho_relativo=imagem["caminho_relativo"],
+                        titulo=f"Imagem {imagem['numero_pagina']}.{imagem['indice']}",
+                    )
+                    self.estatisticas["imagens_extraidas"] += 1
+                    if imagem["referencia"]:
+                        self.estatisticas["imagens_referencias"] += 1
+                    else:
+                        self.estatisticas["imagens_unicas"] += 1
+                        self.estatisticas["imagens_originais"] += int(imagem["original"])
+                    self.estatisticas["bytes_imagens"] += imagem["bytes"]
+                    self.estatisticas["bytes_imagens_origem"] += imagem["bytes_origem"]
+                    if imagem.get("adiada"):
+                        self.estatisticas["imagens_adiadas"] += int(not imagem["referencia"])
+                        self.imagens_manifesto.append({
+                            "imagem": imagem["caminho_relativo"],
+                            "pagina": imagem["numero_pagina"],
+                            "xref": imagem["xref"],
+                            "bbox": imagem["bbox"],
+                        })
+                    else:
+                        self.imagens_geradas.append(imagem["caminho"])
+
+    def _mesclar_regioes_ocr(
+        self, numero_pagina: int, contexto: ContextoPagina, blocos: list
+    ) -> list:
+        """
+        Reconhece as regiões de imagem da página e as insere entre os blocos
+        de texto nativo, na ordem de leitura.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página
+            blocos: Blocos de texto nativo
+
+        Returns:
+            Blocos nativos e de OCR, na ordem de leitura
+        """
+        blocos_ocr = self.processador_ocr.processar_regioes_ocr(
+            numero_pagina, contexto, blocos
+        )
+        _acumular_estatisticas(
+            self.estatisticas, self.processador_ocr.coletar_contadores()
+        )
+        if not blocos_ocr:
+            return blocos
+
+        self._log(f'🔍 OCR em {len(blocos_ocr)} região(ões) de imagem...', 'ocr')
+        return mesclar_em_ordem_leitura(blocos, blocos_ocr)
+
+    def _decidir_ocr(
+        self, numero_pagina: int, contexto: ContextoPagina, registrar: bool = True
+    ) -> bool:
+        """
+        Decide se a página passa pelo OCR.
+
+        No modo automático a decisão vem de ``diagnosticar_pagina`` e é
+        registrada em ``estatisticas["decisoes_ocr"]``, junto com a contagem
+        de páginas enviadas ao OCR.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página
+            registrar: Registrar a decisão nas estatísticas (False quando a
+                página só está sendo antecipada para o MotorOCR; o
+                diagnóstico é guardado e reaproveitado no processamento)
+
+        Returns:
+            True se a página deve passar pelo OCR
+        """
+        if self.ocr_habilitado == OCR_REGIOES:
+            # A página inteira nunca passa pelo OCR, só as suas imagens
+            return False
+        if self.ocr_habilitado != OCR_AUTOMATICO:
+            return bool(self.ocr_habilitado)
+
+        diagnostico = self._diagnosticos.pop(numero_pagina, None)
+        if diagnostico is None:
+            diagnostico = diagnosticar_pagina(contexto)
+
+        if not registrar:
+            self._diagnosticos[numero_pagina] = diagnostico
+            return diagnostico["ocr"]
+
+        self.estatisticas.setdefault("decisoes_ocr", []).append(
+            dict(diagnostico, pagina=numero_pagina + 1)
+        )
+
+        chave = "paginas_ocr" if diagnostico["ocr"] else "paginas_texto_nativo"
+        self.estatisticas[chave] = self.estatisticas.get(chave, 0) + 1
+
+        return diagnostico["ocr"]
 
     def _gerar_arquivo_markdown(self) -> Path:
         """
@@ -262,12 +1007,100 @@ class PDFConverter:
         print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
         print(f"  • Páginas processadas: {Fore.GREEN}{self.estatisticas['paginas_processadas']}{Style.RESET_ALL}")
         print(f"  • Imagens extraídas: {Fore.GREEN}{self.estatisticas['imagens_extraidas']}{Style.RESET_ALL}")
+        if self.estatisticas.get("imagens_extraidas"):
+            print(f"  • Imagens sem recodificar: {Fore.GREEN}{self.estatisticas.get('imagens_originais', 0)} "
+                  f"({self.estatisticas.get('bytes_imagens', 0)} bytes gravados){Style.RESET_ALL}")
+            print(f"  • Bytes das imagens (PDF → gravados): {Fore.GREEN}"
+                  f"{self.estatisticas.get('bytes_imagens_origem', 0)} → "
+                  f"{self.estatisticas.get('bytes_imagens', 0)}{Style.RESET_ALL}")
+            if self.estatisticas.get("imagens_adiadas"):
+                print(f"  • Imagens adiadas (no manifesto): {Fore.GREEN}"
+                      f"{self.estatisticas['imagens_adiadas']}{Style.RESET_ALL}")
+            print(f"  • Imagens únicas / referências: {Fore.GREEN}{self.estatisticas.get('imagens_unicas', 0)} / "
+                  f"{self.estatisticas.get('imagens_referencias', 0)}{Style.RESET_ALL}")
+        ignoradas = self.estatisticas.get("imagens_ignoradas")
+        if ignoradas:
+            motivos = ", ".join(f"{motivo} {total}" for motivo, total in sorted(ignoradas.items()))
+            print(f"  • Imagens ignoradas: {Fore.GREEN}{sum(ignoradas.values())} ({motivos}){Style.RESET_ALL}")
         print(f"  • Tabelas extraídas: {Fore.GREEN}{self.estatisticas['tabelas_extraidas']}{Style.RESET_ALL}")
+        if self.estatisticas.get("paginas_sem_tabelas"):
+            print(f"  • Páginas sem busca de tabelas: {Fore.GREEN}{self.estatisticas['paginas_sem_tabelas']} "
+                  f"(~{self.estatisticas.get('tempo_economizado_tabelas', 0):.2f}s economizados){Style.RESET_ALL}")
         print(f"  • Caracteres extraídos: {Fore.GREEN}{self.estatisticas['caracteres_extraidos']}{Style.RESET_ALL}")
         print(f"  • Tempo total: {Fore.GREEN}{self.estatisticas['tempo_conversao']:.2f}s{Style.RESET_ALL}")
         print(f"  • Tamanho do arquivo: {Fore.GREEN}{self.estatisticas['tamanho_arquivo_saida']} bytes{Style.RESET_ALL}")
+        preprocessamento = self.estatisticas.get("ocr_preprocessamento")
+        if preprocessamento:
+            paginas = preprocessamento["paginas"]
+            etapas = ", ".join(
+                f"{etapa} {preprocessamento[etapa] / paginas * 1000:.0f} ms"
+                for etapa in ("binarizacao", "inclinacao", "recorte")
+            )
+            reducao = 1 - preprocessamento["pixels_finais"] / preprocessamento["pixels_originais"]
+            print(f"  • Pré-processamento OCR (por página): {Fore.GREEN}{etapas}, "
+                  f"{reducao:.0%} menos pixels{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
 
     def obter_estatisticas(self) -> dict:
         """Retorna as estatísticas da conversão."""
         return self.estatisticas.copy()
+
+
+def _converter_paginas_worker(
+    caminho_pdf: Path,
+    diretorio_saida: Path,
+    opcoes: dict,
+    paginas: list,
+) -> list:
+    """
+    Converte um lote de páginas dentro de um processo worker.
+
+    As páginas passam por ``_converter_paginas_serial``, então o OCR em
+    lotes (``ocr_tamanho_lote``) também vale dentro de cada worker.
+
+    Args:
+        caminho_pdf: Caminho do PDF
+        diretorio_saida: Diretório de saída
+        opcoes: Opções do conversor (ver PDFConverter._opcoes_worker)
+        paginas: Números das páginas do lote (0-indexed)
+
+    Returns:
+        Lista de resultados de página (ver PDFConverter._converter_pagina)
+    """
+    conversor = PDFConverter(caminho_pdf, diretorio_saida, **opcoes)
+
+    documento = fitz.open(str(caminho_pdf))
+    try:
+        resultados = list(
+            conversor._converter_paginas_serial(documento, paginas, len(documento))
+        )
+        # Os bytes das imagens gravadas em segundo plano vão com a última página
+        conversor._concluir_imagens(resultados[-1]["estatisticas"])
+        return resultados
+    finally:
+        conversor._concluir_imagens({})
+        documento.close()
+
+
+def _acumular_estatisticas(destino: dict, origem: dict) -> None:
+    """
+    Soma as estatísticas de um worker nas estatísticas do conversor.
+
+    Contadores numéricos são somados, dicionários são combinados
+    recursivamente e listas são concatenadas.
+
+    Args:
+        destino: Estatísticas acumuladas (alteradas no lugar)
+        origem: Estatísticas parciais de um worker
+    """
+    for chave, valor in origem.items():
+        if isinstance(valor, bool):
+            destino[chave] = valor
+        elif isinstance(valor, (int, float)):
+            destino[chave] = destino.get(chave, 0) + valor
+        elif isinstance(valor, dict):
+            _acumular_estatisticas(destino.setdefault(chave, {}), valor)
+        elif isinstance(valor, list):
+            destino.setdefault(chave, []).extend(valor)
+        else:
+            destino[chave] = valor
@@ -2,22 +2,75 @@
 Extrator de imagens de PDFs.
 """
 
+import hashlib
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from io import BytesIO
 from pathlib import Path
+from typing import Callable, Optional
 
 import fitz
+import numpy as np
 from PIL import Image
 
+from pdf2md.core.page_context import ContextoPagina
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
+# Formatos (segundo Document.extract_image) gravados como estão no PDF
+FORMATOS_ORIGINAIS = {"jpeg", "jpx", "png"}
+
+# Imagens com mais componentes de cor (CMYK) precisam ser convertidas
+COMPONENTES_MAXIMOS_ORIGINAIS = 3
+
+# Dígitos hexadecimais do SHA-256 no nome das imagens deduplicadas
+TAMANHO_NOME_CONTEUDO = 32
+
+# Bytes de imagens (amostras ou fluxos) à espera de gravação em segundo plano
+MEMORIA_MAXIMA_GRAVACAO = 256 * 1024 * 1024
+
+# Modo do Pillow por (componentes de cor, alfa) das amostras de um Pixmap
+MODOS_PIL = {(1, 0): "L", (1, 1): "LA", (3, 0): "RGB", (3, 1): "RGBA"}
+
+# Formatos de saída das imagens convertidas: formato → extensão
+EXTENSOES_SAIDA = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+QUALIDADE_PADRAO = 85
+
+# Filtros de imagens decorativas (ver ``filtrar`` no ExtratorImagens):
+# menor lado declarado (pixels), área ocupada na página (pt²) e variação
+# máxima, por canal, para considerar uma imagem de cor única
+LADO_MINIMO_IMAGEM = 8
+AREA_MINIMA_IMAGEM = 100
+TOLERANCIA_UNIFORME = 2
+
+# Passo da amostragem que descarta rápido as imagens que não são uniformes
+PASSO_AMOSTRA_UNIFORME = 7
+
+# Redução da decodificação de JPEGs originais só para o teste de uniformidade
+REDUCAO_JPEG_UNIFORME = 8
+
 
 class ExtratorImagens:
     """Extrai imagens de PDFs."""
 
     def __init__(
-        self, documento: fitz.Document, diretorio_saida: Path, verbose: bool = False
+        self,
+        documento: fitz.Document,
+        diretorio_saida: Path,
+        verbose: bool = False,
+        originais: bool = False,
+        deduplicar: bool = False,
+        threads_gravacao: int = 0,
+        memoria_gravacao: int = MEMORIA_MAXIMA_GRAVACAO,
+        lado_minimo: int = 0,
+        area_minima: float = 0,
+        descartar_uniformes: bool = False,
+        dimensao_maxima: Optional[int] = None,
+        formato: str = "png",
+        qualidade: int = QUALIDADE_PADRAO,
+        adiar: bool = False,
     ):
         """
         Inicializa o extrator de imagens.
@@ -26,22 +79,102 @@ class ExtratorImagens:
             documento: Documento PDF aberto com fitz
             diretorio_saida: Diretório para salvar as imagens
             verbose: Modo verbose
+            originais: Gravar as imagens JPEG, JPEG 2000 e PNG com os bytes
+                do próprio PDF, sem decodificar e recodificar em PNG
+            deduplicar: Gravar cada imagem uma única vez, com o nome dado
+                pelo hash do conteúdo; repetições (o mesmo xref no
+                documento ou o mesmo conteúdo já gravado por outro PDF no
+                diretório) apenas referenciam o arquivo existente
+            threads_gravacao: Threads que codificam e gravam as imagens em
+                segundo plano (0 grava no próprio laço das páginas); chame
+                ``fechar`` para aguardar as gravações
+            memoria_gravacao: Bytes máximos à espera de gravação; acima
+                disso, a extração aguarda as threads
+            lado_minimo: Ignorar imagens com largura ou altura declarada
+                menor que isto, em pixels (espaçadores, pixels de
+                rastreamento, fios decorativos)
+            area_minima: Ignorar imagens que ocupam menos que isto da
+                página, em pt²
+            descartar_uniformes: Ignorar imagens de uma cor só (fundos e
+                máscaras em branco)
+            dimensao_maxima: Maior lado das imagens gravadas, em pixels;
+                imagens maiores são reduzidas (None mantém a resolução)
+            formato: Formato das imagens convertidas: 'png', 'jpeg' ou 'webp'
+            qualidade: Qualidade (1-100) dos formatos com perdas
+            adiar: Não decodificar nem gravar as imagens: cada uma recebe o
+                nome que teria e volta com o xref e a posição na página,
+                para ser gravada depois por ``materializar`` (os originais
+                e o filtro de cor única, que exigem ler a imagem, não se
+                aplicam)
+
+        Raises:
+            ValueError: Se o formato não for suportado
         """
+        if formato not in EXTENSOES_SAIDA:
+            raise ValueError(f"Formato de imagem não suportado: {formato}")
+
         self.documento = documento
         self.diretorio_saida = Path(diretorio_saida)
         self.verbose = verbose
+        self.originais = originais
         self.contador_imagens = 0
+        self.deduplicar = deduplicar
+        self.contador_originais = 0
+        self.contador_referencias = 0
+
+        self.lado_minimo = lado_minimo
+        self.area_minima = area_minima
+        self.descartar_uniformes = descartar_uniformes
+        self.dimensao_maxima = dimensao_maxima
+        self.formato = formato
+        self.qualidade = qualidade
+        self.adiar = adiar
+
+        # Com redução ou outro formato, o nome deduplicado inclui os
+        # parâmetros de saída (a mesma imagem gera arquivos diferentes)
+        self._converter = formato != "png" or dimensao_maxima is not None
+        self._parametros = (
+            f"{formato}:{qualidade}:{dimensao_maxima}:".encode()
+            if self._converter
+            else b""
+        )
+
+        # Imagens já gravadas neste documento: xref → dados do arquivo
+        self._gravadas = {}
+
+        # Imagens de cor única já encontradas (não são decodificadas de novo)
+        self._uniformes = set()
+
+        # Imagens ignoradas pelos filtros, por motivo (ver coletar_contadores)
+        self._ignoradas = {}
+
+        # Nomes gravados (ou em gravação) por este extrator, ao deduplicar
+        self._nomes_gravados = set()
+
+        # Imagens contadas como novas cujo arquivo outro processo criou
+        # primeiro (descontadas em coletar_contadores)
+        self._repetidas = 0
+        self._repetidas_originais = 0
+
+        self._gravador = (
+            GravadorImagens(threads_gravacao, memoria_gravacao)
+            if threads_gravacao > 0
+            else None
+        )
 
         # Criar diretório de imagens
         self.diretorio_imagens = self.diretorio_saida / "imagens"
         self.diretorio_imagens.mkdir(parents=True, exist_ok=True)
 
-    def extrair_imagens_pagina(self, numero_pagina: int) -> list:
+    def extrair_imagens_pagina(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina] = None
+    ) -> list:
         """
         Extrai imagens de uma página específica.
 
         Args:
             numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada
 
         Returns:
             Lista com informações das imagens extraídas
@@ -49,8 +182,17 @@ class ExtratorImagens:
         imagens_extraidas = []
 
         try:
-            pagina = self.documento[numero_pagina]
-            imagens = pagina.get_images()
+            if contexto is not None:
+                imagens = contexto.imagens
+                info_imagens = (
+                    contexto.info_imagens if self.area_minima or self.adiar else None
+                )
+            else:
+                pagina = self.documento[numero_pagina]
+                imagens = pagina.get_images()
+                info_imagens = (
+                    pagina.get_image_info() if self.area_minima or self.adiar else None
+                )
 
             if self.verbose:
                 logger.info(
@@ -59,35 +201,51 @@ class ExtratorImagens:
 
             for indice_img, img_ref in enumerate(imagens):
                 try:
-                    # Extrair imagem
                     xref = img_ref[0]
-                    pix = fitz.Pixmap(self.documento, xref)
+                    motivo = self._motivo_descarte(img_ref, info_imagens)
+                    if motivo is not None:
+                        self._ignoradas[motivo] = self._ignoradas.get(motivo, 0) + 1
+                        continue
 
-                    # Converter para RGB se necessário
-                    if pix.n - pix.alpha < 4:  # RGB
-                        pix_rgb = pix
-                    else:  # CMYK ou outro
-                        pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
+                    gravada = self._gravadas.get(xref)
+                    nova = False
+                    if gravada is None:
+                        nome_base = f"imagem_{numero_pagina + 1}_{indice_img + 1}"
+                        if self.adiar:
+                            gravada, nova = self._adiar_imagem(nome_base), True
+                        else:
+                            gravada, nova = self._gravar_imagem(xref, nome_base)
+                        if gravada is None:
+                            self._uniformes.add(xref)
+                            self._ignoradas["uniformes"] = (
+                                self._ignoradas.get("uniformes", 0) + 1
+                            )
+                            continue
+                        if self.deduplicar:
+                            self._gravadas[xref] = gravada
 
-                    # Salvar imagem
                     self.contador_imagens += 1
-                    nome_arquivo = f"imagem_{numero_pagina + 1}_{indice_img + 1}.png"
-                    caminho_imagem = self.diretorio_imagens / nome_arquivo
-
-                    pix_rgb.save(str(caminho_imagem))
-
+                    if not nova:
+                        self.contador_referencias += 1
                     imagens_extraidas.append(
                         {
                             "numero_pagina": numero_pagina + 1,
                             "indice": indice_img + 1,
-                            "caminho": caminho_imagem,
-                            "nome_arquivo": nome_arquivo,
-                            "caminho_relativo": f"imagens/{nome_arquivo}",
+                            **gravada,
+                            "referencia": not nova,
+                            # Gravações em segundo plano entram em ``fechar``
+                            "bytes": (gravada["tamanho"] or 0) if nova else 0,
+                            "bytes_origem": gravada["tamanho_origem"] if nova else 0,
                         }
                     )
+                    if self.adiar:
+                        imagens_extraidas[-1]["xref"] = xref
+                        imagens_extraidas[-1]["bbox"] = _bbox_na_pagina(
+                            img_ref, info_imagens
+                        )
 
-                    if self.verbose:
-                        logger.info(f"Imagem salva: {nome_arquivo}")
+                    if self.verbose and not self.adiar:
+                        logger.info(f"Imagem salva: {gravada['nome_arquivo']}")
 
                 except Exception as e:
                     logger.error(f"Erro ao extrair imagem {indice_img}: {e}")
@@ -98,6 +256,347 @@ class ExtratorImagens:
 
         return imagens_extraidas
 
+    def _motivo_descarte(self, img_ref: tuple, info_imagens: Optional[list]) -> Optional[str]:
+        """
+        Aplica os filtros que não exigem decodificar a imagem.
+
+        Args:
+            img_ref: Entrada de ``Page.get_images``
+            info_imagens: Resultado de ``Page.get_image_info`` (só com
+                ``area_minima``)
+
+        Returns:
+            'pequenas', 'area' ou 'uniformes' se a imagem deve ser
+            ignorada, ou None
+        """
+        xref, _, largura, altura = img_ref[:4]
+        if xref in self._uniformes:
+            return "uniformes"
+        if min(largura, altura) < self.lado_minimo:
+            return "pequenas"
+        if info_imagens is not None:
+            area = _area_na_pagina(img_ref, info_imagens)
+            if area is not None and area < self.area_minima:
+                return "area"
+        return None
+
+    def _extrair_original(self, xref: int) -> Optional[dict]:
+        """
+        Lê o fluxo original de uma imagem, se ele puder ser gravado como está.
+
+        Args:
+            xref: Referência da imagem no PDF
+
+        Returns:
+            Dicionário de ``Document.extract_image`` ('ext', 'image', ...),
+            ou None se o formato precisar de conversão
+        """
+        extraida = self.documento.extract_image(xref)
+        if (
+            not extraida
+            or extraida["ext"] not in FORMATOS_ORIGINAIS
+            or extraida["colorspace"] > COMPONENTES_MAXIMOS_ORIGINAIS
+        ):
+            return None
+        return extraida
+
+    def _gravar_imagem(self, xref: int, nome_base: str) -> tuple:
+        """
+        Grava uma imagem no diretório de imagens.
+
+        Args:
+            xref: Referência da imagem no PDF
+            nome_base: Nome do arquivo sem extensão (ignorado ao deduplicar,
+                quando o nome vem do hash do conteúdo)
+
+        Returns:
+            Tupla (dados do arquivo, nova) em que dados traz 'caminho',
+            'nome_arquivo', 'caminho_relativo', 'original', 'tamanho'
+            (None se a gravação ficou para as threads) e 'tamanho_origem'
+            (bytes da imagem no PDF), e nova é False se o arquivo já
+            existia; (None, False) se a imagem for de uma cor só e
+            ``descartar_uniformes`` estiver ativo
+        """
+        preparada = self._preparar(xref, self.originais)
+        if preparada is None:
+            return None, False
+        conteudo, extensao, codificar, original, origem, assinatura = preparada
+
+        if codificar is not None and self._gravador is None:
+            conteudo, codificar = codificar(conteudo), None
+
+        if assinatura is not None:
+            nome_base = assinatura
+        nome_arquivo = f"{nome_base}.{extensao}"
+        caminho = self.diretorio_imagens / nome_arquivo
+
+        nova = not (
+            self.deduplicar
+            and (nome_arquivo in self._nomes_gravados or caminho.exists())
+        )
+        tamanho = None
+        if nova:
+            self._nomes_gravados.add(nome_arquivo)
+            if self._gravador is not None:
+                # Se outro processo criar o arquivo antes, a imagem é
+                # descontada depois (ver _descontar_repetidas)
+                self._gravador.enviar(
+                    caminho, conteudo, codificar, exclusivo=self.deduplicar,
+                    original=original,
+                )
+            else:
+                # Nova só se esta gravação criou o arquivo
+                nova = _gravar_arquivo(caminho, conteudo, exclusivo=self.deduplicar)
+                tamanho = len(conteudo) if nova else None
+            if nova and original:
+                self.contador_originais += 1
+
+        return {
+            "caminho": caminho,
+            "nome_arquivo": nome_arquivo,
+            "caminho_relativo": f"imagens/{nome_arquivo}",
+            "original": original,
+            "tamanho": tamanho,
+            "tamanho_origem": origem,
+        }, nova
+
+    def _adiar_imagem(self, nome_base: str) -> dict:
+        """
+        Reserva o nome de uma imagem sem lê-la do PDF.
+
+        Args:
+            nome_base: Nome do arquivo sem extensão
+
+        Returns:
+            Dados do arquivo, como em ``_gravar_imagem``, com tamanhos zero
+        """
+        nome_arquivo = f"{nome_base}.{EXTENSOES_SAIDA[self.formato]}"
+        return {
+            "caminho": self.diretorio_imagens / nome_arquivo,
+            "nome_arquivo": nome_arquivo,
+            "caminho_relativo": f"imagens/{nome_arquivo}",
+            "original": False,
+            "tamanho": 0,
+            "tamanho_origem": 0,
+            "adiada": True,
+        }
+
+    def materializar(self, xref: int, caminho: Path) -> int:
+        """
+        Grava uma imagem adiada no caminho reservado na conversão.
+
+        Usa o formato, a qualidade e a dimensão máxima deste extrator, que
+        devem ser os mesmos da conversão.
+
+        Args:
+            xref: Referência da imagem no PDF
+            caminho: Arquivo a gravar
+
+        Returns:
+            Bytes gravados
+        """
+        conteudo, _, codificar, *_ = self._preparar(xref, originais=False)
+        if codificar is not None:
+            conteudo = codificar(conteudo)
+        _gravar_arquivo(Path(caminho), conteudo)
+        return len(conteudo)
+
+    def _preparar(self, xref: int, originais: bool) -> Optional[tuple]:
+        """
+        Obtém o conteúdo a gravar de uma imagem.
+
+        Args:
+            xref: Referência da imagem no PDF
+            originais: Usar os bytes do PDF quando o formato permitir
+
+        Returns:
+            Tupla (conteúdo, extensão, codificar, original, bytes no PDF,
+            nome deduplicado) em que codificar, se não for None, converte o
+            conteúdo nos bytes do arquivo; None se a imagem for de uma cor
+            só e ``descartar_uniformes`` estiver ativo
+        """
+        extraida = self._extrair_original(xref) if originais else None
+        if extraida is not None and not self._cabe(extraida["width"], extraida["height"]):
+            extraida = None
+
+        codificar = None
+        jpeg = None if extraida is not None else self._jpeg_para_converter(xref)
+        if extraida is not None:
+            conteudo, extensao = extraida["image"], extraida["ext"]
+            if self.descartar_uniformes and _uniforme(_amostras_original(extraida)):
+                return None
+            origem = len(conteudo)
+            assinatura = self._assinatura(conteudo)
+        elif jpeg is not None:
+            # O Pillow decodifica o JPEG já reduzido (ver _codificador_imagem)
+            if self.descartar_uniformes and _uniforme(_amostras_original({"image": jpeg})):
+                return None
+            conteudo, origem = jpeg, len(jpeg)
+            extensao = EXTENSOES_SAIDA[self.formato]
+            assinatura = self._assinatura(self._parametros, jpeg)
+            codificar = _codificador_imagem(
+                None, 0, 0, self.formato, self.qualidade, self.dimensao_maxima
+            )
+        else:
+            pix = self._decodificar(xref)
+            if self.descartar_uniformes and _uniforme(_amostras_pixmap(pix)):
+                return None
+            origem = len(self.documento.xref_stream_raw(xref))
+            # O nome deduplicado vem das amostras, não do arquivo, para ser o
+            # mesmo com e sem as threads de gravação
+            assinatura = self._assinatura(
+                self._parametros,
+                f"{pix.width}x{pix.height}x{pix.n}x{pix.alpha}".encode(),
+                pix.samples_mv,
+            )
+            pix = self._reduzir_pixmap(pix)
+            modo = MODOS_PIL.get((pix.n - pix.alpha, pix.alpha))
+            if modo is not None and (self._converter or self._gravador is not None):
+                # A cópia das amostras é feita aqui: o Pixmap não sai desta thread
+                conteudo = pix.samples
+                extensao = EXTENSOES_SAIDA[self.formato]
+                codificar = _codificador_imagem(
+                    modo, pix.width, pix.height, self.formato, self.qualidade,
+                    self.dimensao_maxima,
+                )
+            else:
+                conteudo, extensao = pix.tobytes("png"), "png"
+
+        return conteudo, extensao, codificar, extraida is not None, origem, assinatura
+
+    def _assinatura(self, *partes) -> Optional[str]:
+        """Retorna o nome do arquivo deduplicado, ou None sem deduplicação."""
+        if not self.deduplicar:
+            return None
+        sha = hashlib.sha256()
+        for parte in partes:
+            sha.update(parte)
+        return sha.hexdigest()[:TAMANHO_NOME_CONTEUDO]
+
+    def _cabe(self, largura: int, altura: int) -> bool:
+        """Indica se a imagem respeita a dimensão máxima."""
+        return self.dimensao_maxima is None or max(largura, altura) <= self.dimensao_maxima
+
+    def _jpeg_para_converter(self, xref: int) -> Optional[bytes]:
+        """
+        Retorna o fluxo JPEG de uma imagem que será reduzida ou convertida.
+
+        O Pillow decodifica JPEGs direto em 1/2, 1/4 ou 1/8 da resolução,
+        bem mais rápido que decodificar tudo e reduzir depois.
+
+        Args:
+            xref: Referência da imagem no PDF
+
+        Returns:
+            Bytes do JPEG, ou None se a imagem não for um JPEG em tons de
+            cinza ou RGB, ou se não houver conversão a fazer
+        """
+        if not self._converter:
+            return None
+        if self.documento.xref_get_key(xref, "Filter") != ("name", "/DCTDecode"):
+            return None
+
+        extraida = self.documento.extract_image(xref)
+        if not extraida or extraida["colorspace"] not in (1, 3):
+            return None
+        return extraida["image"]
+
+    def _reduzir_pixmap(self, pix: fitz.Pixmap) -> fitz.Pixmap:
+        """
+        Reduz o Pixmap até a dimensão máxima, mantendo a proporção.
+
+        A reamostragem é feita pelo MuPDF, sobre as amostras já
+        decodificadas, sem copiá-las antes para o Pillow.
+
+        Args:
+            pix: Pixmap decodificado
+
+        Returns:
+            Um Pixmap reduzido, ou o próprio se ele couber no limite
+        """
+        if self._cabe(pix.width, pix.height):
+            return pix
+
+        escala = self.dimensao_maxima / max(pix.width, pix.height)
+        largura = max(1, round(pix.width * escala))
+        altura = max(1, round(pix.height * escala))
+        return fitz.Pixmap(pix, largura, altura, None)
+
+    def _decodificar(self, xref: int) -> fitz.Pixmap:
+        """
+        Decodifica uma imagem (em RGB se for CMYK).
+
+        Args:
+            xref: Referência da imagem no PDF
+
+        Returns:
+            Pixmap da imagem
+        """
+        pix = fitz.Pixmap(self.documento, xref)
+
+        # Converter para RGB se necessário
+        if pix.n - pix.alpha < 4:  # RGB
+            return pix
+        return fitz.Pixmap(fitz.csRGB, pix)
+
+    def coletar_contadores(self) -> dict:
+        """
+        Retorna e zera os contadores de imagens ignoradas pelos filtros e
+        as correções das imagens gravadas em segundo plano.
+
+        Com deduplicação e threads de gravação, uma imagem é contada como
+        nova ao ser enviada às threads; se outro processo tiver criado o
+        arquivo antes, ela passa a ser uma referência.
+
+        Returns:
+            Dicionário com 'imagens_ignoradas' (por motivo: 'pequenas',
+            'area', 'uniformes') e, se houver imagens repetidas, os ajustes
+            (negativos ou positivos) de 'imagens_unicas',
+            'imagens_referencias' e 'imagens_originais'; vazio se não houver
+            nada a relatar
+        """
+        self._descontar_repetidas()
+        contadores = {}
+
+        ignoradas, self._ignoradas = self._ignoradas, {}
+        if ignoradas:
+            contadores["imagens_ignoradas"] = ignoradas
+
+        if self._repetidas:
+            contadores["imagens_unicas"] = -self._repetidas
+            contadores["imagens_referencias"] = self._repetidas
+            contadores["imagens_originais"] = -self._repetidas_originais
+            self._repetidas = self._repetidas_originais = 0
+
+        return contadores
+
+    def _descontar_repetidas(self) -> None:
+        """Passa a referências as gravações que encontraram o arquivo pronto."""
+        if self._gravador is None:
+            return
+        repetidas, originais = self._gravador.coletar_repetidas()
+        self.contador_referencias += repetidas
+        self.contador_originais -= originais
+        self._repetidas += repetidas
+        self._repetidas_originais += originais
+
+    def fechar(self) -> int:
+        """
+        Aguarda as imagens em gravação e encerra as threads de gravação.
+
+        As imagens que outro processo gravou primeiro ficam para o próximo
+        ``coletar_contadores``.
+
+        Returns:
+            Bytes gravados em segundo plano (0 sem threads de gravação)
+        """
+        if self._gravador is None:
+            return 0
+        gravados = self._gravador.fechar()
+        self._descontar_repetidas()
+        self._gravador = None
+        return gravados
+
     def extrair_todas_imagens(self) -> list:
         """
         Extrai todas as imagens do documento.
@@ -117,5 +616,332 @@ class ExtratorImagens:
         """Retorna estatísticas sobre as imagens extraídas."""
         return {
             "total_imagens": self.contador_imagens,
+            "imagens_originais": self.contador_originais,
+            "imagens_unicas": self.contador_imagens - self.contador_referencias,
+            "imagens_referencias": self.contador_referencias,
             "diretorio_imagens": str(self.diretorio_imagens),
         }
+
+
+def _area_na_pagina(img_ref: tuple, info_imagens: list) -> Optional[float]:
+    """
+    Estima a área ocupada por uma imagem na página.
+
+    ``get_image_info`` só informa o xref de cada ocorrência calculando o
+    hash das imagens (o que as decodifica), então as ocorrências são
+    associadas pelas dimensões declaradas. Entre as candidatas, vale a
+    maior área, para que uma imagem só seja ignorada se nenhuma ocorrência
+    possível for grande.
+
+    Args:
+        img_ref: Entrada de ``Page.get_images``
+        info_imagens: Resultado de ``Page.get_image_info``
+
+    Returns:
+        Área em pt², ou None se nenhuma ocorrência corresponder
+    """
+    retangulos = _ocorrencias(img_ref, info_imagens)
+    return max(abs(retangulo) for retangulo in retangulos) if retangulos else None
+
+
+def _bbox_na_pagina(img_ref: tuple, info_imagens: list) -> Optional[list]:
+    """
+    Retorna a posição da maior ocorrência de uma imagem na página.
+
+    As ocorrências são associadas como em ``_area_na_pagina``.
+
+    Args:
+        img_ref: Entrada de ``Page.get_images``
+        info_imagens: Resultado de ``Page.get_image_info``
+
+    Returns:
+        [x0, y0, x1, y1] em pt, ou None se nenhuma ocorrência corresponder
+    """
+    retangulos = _ocorrencias(img_ref, info_imagens)
+    if not retangulos:
+        return None
+    return [round(c, 2) for c in max(retangulos, key=abs)]
+
+
+def _ocorrencias(img_ref: tuple, info_imagens: list) -> list:
+    """Retângulos das ocorrências com as dimensões declaradas da imagem."""
+    _, _, largura, altura, bpc = img_ref[:5]
+    return [
+        fitz.Rect(info["bbox"])
+        for info in info_imagens
+        if (info["width"], info["height"], info["bpc"]) == (largura, altura, bpc)
+    ]
+
+
+def _amostras_pixmap(pix: fitz.Pixmap) -> np.ndarray:
+    """Amostras do Pixmap como matriz (pixels, canais), sem cópia."""
+    return np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(-1, pix.n)
+
+
+def _amostras_original(extraida: dict) -> Optional[np.ndarray]:
+    """
+    Decodifica o fluxo original de uma imagem para o teste de uniformidade.
+
+    JPEGs são decodificados em resolução reduzida (só os coeficientes DC),
+    o que basta para ver se há mais de uma cor.
+
+    Args:
+        extraida: Resultado de ``Document.extract_image``
+
+    Returns:
+        Matriz (pixels, canais), ou None se o Pillow não ler o formato
+    """
+    try:
+        imagem = Image.open(BytesIO(extraida["image"]))
+        if imagem.format == "JPEG":
+            imagem.draft(imagem.mode, (
+                max(1, imagem.width // REDUCAO_JPEG_UNIFORME),
+                max(1, imagem.height // REDUCAO_JPEG_UNIFORME),
+            ))
+        matriz = np.asarray(imagem)
+    except Exception:
+        return None
+    return matriz.reshape(matriz.shape[0] * matriz.shape[1], -1)
+
+
+def _uniforme(amostras: Optional[np.ndarray]) -> bool:
+    """
+    Indica se todos os pixels têm (quase) a mesma cor.
+
+    Uma amostra espaçada dos pixels é testada antes, o que descarta rápido
+    as imagens comuns sem percorrer todas as amostras.
+
+    Args:
+        amostras: Matriz (pixels, canais) em uint8, ou None
+
+    Returns:
+        True se a variação de cada canal não passa de ``TOLERANCIA_UNIFORME``
+    """
+    if amostras is None or len(amostras) == 0:
+        return False
+
+    for parte in (amostras[::PASSO_AMOSTRA_UNIFORME], amostras):
+        if (np.ptp(parte, axis=0) > TOLERANCIA_UNIFORME).any():
+            return False
+    return True
+
+
+class GravadorImagens:
+    """
+    Codifica e grava imagens em threads, fora do laço das páginas.
+
+    A compressão (zlib, no Pillow) e a escrita liberam o GIL, então as
+    threads trabalham enquanto a próxima página é extraída. O total de
+    bytes à espera de gravação é limitado: ``enviar`` aguarda quando o
+    limite seria ultrapassado.
+    """
+
+    def __init__(self, threads: int, memoria_maxima: int = MEMORIA_MAXIMA_GRAVACAO):
+        """
+        Inicializa o gravador.
+
+        Args:
+            threads: Número de threads de gravação
+            memoria_maxima: Bytes máximos à espera de gravação (uma imagem
+                maior que o limite é aceita quando não há outras pendentes)
+        """
+        self.memoria_maxima = memoria_maxima
+        self.bytes_gravados = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="pdf2md-imagens"
+        )
+        # Gravações em andamento: Future → bytes retidos
+        self._pendentes = {}
+        # Gravações de imagens originais (sem recodificar) em andamento
+        self._originais = set()
+
+        # Gravações exclusivas que encontraram o arquivo já criado
+        self._repetidas = 0
+        self._repetidas_originais = 0
+
+    @property
+    def bytes_pendentes(self) -> int:
+        """Bytes retidos pelas gravações em andamento."""
+        return sum(self._pendentes.values())
+
+    def enviar(
+        self,
+        caminho: Path,
+        conteudo: bytes,
+        codificar: Optional[Callable[[bytes], bytes]] = None,
+        exclusivo: bool = False,
+        original: bool = False,
+    ) -> None:
+        """
+        Agenda a gravação de uma imagem, aguardando se houver bytes demais
+        pendentes.
+
+        Args:
+            caminho: Arquivo de destino
+            conteudo: Bytes da imagem (ou amostras, com ``codificar``)
+            codificar: Função que transforma ``conteudo`` nos bytes do
+                arquivo, executada na thread de gravação
+            exclusivo: Não substituir o arquivo se ele já existir (a
+                gravação é contada em ``coletar_repetidas``)
+            original: A imagem é gravada sem recodificar (só para a
+                contagem de ``coletar_repetidas``)
+        """
+        self._recolher()
+        while self._pendentes and self.bytes_pendentes + len(conteudo) > self.memoria_maxima:
+            wait(self._pendentes, return_when=FIRST_COMPLETED)
+            self._recolher()
+
+        futuro = self._executor.submit(
+            _codificar_e_gravar, caminho, conteudo, codificar, exclusivo
+        )
+        self._pendentes[futuro] = len(conteudo)
+        if original:
+            self._originais.add(futuro)
+
+    def fechar(self) -> int:
+        """
+        Aguarda todas as gravações e encerra as threads.
+
+        Returns:
+            Total de bytes gravados
+        """
+        self._recolher(todas=True)
+        self._executor.shutdown()
+        return self.bytes_gravados
+
+    def coletar_repetidas(self) -> tuple:
+        """
+        Retorna e zera as gravações exclusivas concluídas sem criar o arquivo.
+
+        Returns:
+            Tupla (repetidas, das quais originais)
+        """
+        self._recolher()
+        repetidas = (self._repetidas, self._repetidas_originais)
+        self._repetidas = self._repetidas_originais = 0
+        return repetidas
+
+    def _recolher(self, todas: bool = False) -> None:
+        """Contabiliza as gravações concluídas (aguardando todas, com ``todas``)."""
+        if todas:
+            wait(self._pendentes)
+
+        for futuro in [f for f in self._pendentes if f.done()]:
+            del self._pendentes[futuro]
+            original = futuro in self._originais
+            self._originais.discard(futuro)
+            try:
+                gravados, criado = futuro.result()
+            except Exception as e:
+                logger.error(f"Erro ao gravar imagem: {e}")
+                continue
+            if criado:
+                self.bytes_gravados += gravados
+            else:
+                self._repetidas += 1
+                self._repetidas_originais += int(original)
+
+
+def _codificador_imagem(
+    modo: Optional[str],
+    largura: int,
+    altura: int,
+    formato: str,
+    qualidade: int,
+    dimensao_maxima: Optional[int],
+) -> Callable[[bytes], bytes]:
+    """
+    Retorna uma função que reduz e codifica uma imagem com o Pillow.
+
+    Args:
+        modo: Modo do Pillow das amostras cruas (ver ``MODOS_PIL``), ou
+            None se o conteúdo for um arquivo de imagem (JPEG)
+        largura: Largura das amostras em pixels
+        altura: Altura das amostras em pixels
+        formato: 'png', 'jpeg' ou 'webp'
+        qualidade: Qualidade (1-100) dos formatos com perdas
+        dimensao_maxima: Maior lado da imagem gravada (None mantém)
+
+    Returns:
+        Função conteúdo → bytes do arquivo
+    """
+    def codificar(conteudo: bytes) -> bytes:
+        if modo is None:
+            imagem = Image.open(BytesIO(conteudo))
+        else:
+            imagem = Image.frombytes(modo, (largura, altura), conteudo)
+
+        if dimensao_maxima is not None and max(imagem.size) > dimensao_maxima:
+            # Em JPEGs, thumbnail usa draft: a decodificação já sai reduzida
+            imagem.thumbnail((dimensao_maxima, dimensao_maxima))
+
+        if formato == "jpeg" and imagem.mode not in ("L", "RGB"):
+            imagem = imagem.convert("L" if imagem.mode in ("1", "LA") else "RGB")
+        elif formato == "webp" and imagem.mode not in ("RGB", "RGBA"):
+            imagem = imagem.convert("RGBA" if "A" in imagem.mode else "RGB")
+
+        buffer = BytesIO()
+        if formato == "png":
+            imagem.save(buffer, format="PNG")
+        else:
+            imagem.save(buffer, format=formato.upper(), quality=qualidade)
+        return buffer.getvalue()
+
+    return codificar
+
+
+def _codificar_e_gravar(
+    caminho: Path,
+    conteudo: bytes,
+    codificar: Optional[Callable[[bytes], bytes]],
+    exclusivo: bool = False,
+) -> tuple:
+    """
+    Codifica (se preciso) e grava uma imagem na thread de gravação.
+
+    Returns:
+        Tupla (bytes do arquivo, criado), em que criado é False se a
+        gravação exclusiva encontrou o arquivo já existente
+    """
+    dados = codificar(conteudo) if codificar is not None else conteudo
+    return len(dados), _gravar_arquivo(caminho, dados, exclusivo)
+
+
+def _gravar_arquivo(caminho: Path, dados: bytes, exclusivo: bool = False) -> bool:
+    """
+    Grava um arquivo de forma atômica.
+
+    Outro processo (ou thread) pode gravar o mesmo arquivo deduplicado ao
+    mesmo tempo; o arquivo final nunca fica pela metade. Com ``exclusivo``,
+    o arquivo completo é ligado ao destino só se ele ainda não existir, de
+    modo que exatamente uma das gravações concorrentes o cria.
+
+    Args:
+        caminho: Arquivo de destino
+        dados: Conteúdo
+        exclusivo: Manter o arquivo existente em vez de substituí-lo
+
+    Returns:
+        True se esta gravação criou (ou substituiu) o arquivo
+    """
+    temporario = caminho.with_name(
+        f".{caminho.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    temporario.write_bytes(dados)
+    if not exclusivo:
+        os.replace(temporario, caminho)
+        return True
+
+    try:
+        os.link(temporario, caminho)
+    except FileExistsError:
+        return False
+    except OSError:
+        # Sistema de arquivos sem links: a verificação não é atômica
+        if caminho.exists():
+            return False
+        os.replace(temporario, caminho)
+        return True
+    finally:
+        temporario.unlink(missing_ok=True)
+    return True
@@ -0,0 +1,142 @@
+"""
+Imagens adiadas: manifesto das referências e gravação sob demanda.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import fitz
+
+from pdf2md import __version__
+from pdf2md.core.conversion_cache import calcular_hash_arquivo
+from pdf2md.core.image_extractor import ExtratorImagens
+
+
+class ManifestoImagens:
+    """
+    Imagens referenciadas pelo Markdown e ainda não gravadas.
+
+    Fica ao lado do Markdown gerado (``<nome>.imagens.json``) e associa
+    cada referência de imagem ao PDF de origem (caminho e hash), ao xref
+    da imagem, à página e à posição nela, junto com as opções de saída
+    (formato, qualidade e dimensão máxima) usadas para gravá-la depois.
+    """
+
+    def __init__(self, arquivo_markdown: Path):
+        """
+        Inicializa o manifesto.
+
+        Args:
+            arquivo_markdown: Markdown que referencia as imagens
+        """
+        arquivo_markdown = Path(arquivo_markdown)
+        self.caminho = arquivo_markdown.with_name(f"{arquivo_markdown.stem}.imagens.json")
+
+    def salvar(self, caminho_pdf: Path, imagens: List[dict], opcoes: dict) -> None:
+        """
+        Grava o manifesto de forma atômica.
+
+        Args:
+            caminho_pdf: PDF de onde as imagens serão lidas
+            imagens: Uma entrada por referência no Markdown, com 'imagem'
+                (caminho relativo ao Markdown), 'pagina', 'xref' e 'bbox'
+            opcoes: Opções do ExtratorImagens ('formato', 'qualidade' e
+                'dimensao_maxima')
+        """
+        caminho_pdf = Path(caminho_pdf).resolve()
+        dados = {
+            "versao": __version__,
+            "pdf": {"caminho": str(caminho_pdf), "hash": calcular_hash_arquivo(caminho_pdf)},
+            "opcoes": opcoes,
+            "imagens": imagens,
+        }
+
+        temporario = self.caminho.with_name(self.caminho.name + ".tmp")
+        temporario.write_text(json.dumps(dados, separators=(",", ":")), encoding="utf-8")
+        os.replace(temporario, self.caminho)
+
+    def carregar(self) -> dict:
+        """
+        Lê o manifesto.
+
+        Returns:
+            Conteúdo do manifesto (ver ``salvar``)
+
+        Raises:
+            FileNotFoundError: Se o Markdown não tiver manifesto de imagens
+        """
+        return json.loads(self.caminho.read_text(encoding="utf-8"))
+
+
+def materializar_imagens(
+    arquivo_markdown: Path,
+    imagens: Optional[Iterable[str]] = None,
+    caminho_pdf: Optional[Path] = None,
+) -> List[Path]:
+    """
+    Grava imagens adiadas de uma conversão.
+
+    As imagens já presentes no disco não são gravadas de novo.
+
+    Args:
+        arquivo_markdown: Markdown gerado com as imagens adiadas
+        imagens: Referências a gravar, como aparecem no Markdown
+            ('imagens/imagem_1_1.png') ou só o nome do arquivo; None grava
+            todas
+        caminho_pdf: PDF de origem, se não estiver mais no caminho
+            registrado no manifesto
+
+    Returns:
+        Caminhos das imagens pedidas (sem repetições), na ordem do pedido
+        ou, sem pedido, na do manifesto
+
+    Raises:
+        FileNotFoundError: Se o manifesto ou o PDF não existirem
+        ValueError: Se o PDF não for o da conversão ou uma referência não
+            constar do manifesto
+    """
+    arquivo_markdown = Path(arquivo_markdown)
+    dados = ManifestoImagens(arquivo_markdown).carregar()
+
+    caminho_pdf = Path(caminho_pdf or dados["pdf"]["caminho"])
+    if calcular_hash_arquivo(caminho_pdf) != dados["pdf"]["hash"]:
+        raise ValueError(f"O PDF não é o da conversão: {caminho_pdf}")
+
+    # Referências repetidas (imagens deduplicadas) apontam para o mesmo xref
+    xrefs = {}
+    for entrada in dados["imagens"]:
+        xrefs.setdefault(entrada["imagem"], entrada["xref"])
+
+    if imagens is None:
+        pedidas = list(xrefs)
+    else:
+        por_nome = {Path(referencia).name: referencia for referencia in xrefs}
+        pedidas = []
+        for imagem in imagens:
+            referencia = imagem if imagem in xrefs else por_nome.get(Path(imagem).name)
+            if referencia is None:
+                raise ValueError(f"Imagem fora do manifesto: {imagem}")
+            pedidas.append(referencia)
+        pedidas = list(dict.fromkeys(pedidas))
+
+    diretorio = arquivo_markdown.parent
+    caminhos = [diretorio / referencia for referencia in pedidas]
+    faltantes = [
+        (xrefs[referencia], caminho)
+        for referencia, caminho in zip(pedidas, caminhos)
+        if not caminho.exists()
+    ]
+    if not faltantes:
+        return caminhos
+
+    documento = fitz.open(str(caminho_pdf))
+    try:
+        extrator = ExtratorImagens(documento, diretorio, **dados["opcoes"])
+        for xref, caminho in faltantes:
+            extrator.materializar(xref, caminho)
+    finally:
+        documento.close()
+
+    return caminhos
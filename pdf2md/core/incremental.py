@@ -0,0 +1,152 @@
+"""
+Reconversão incremental: impressões digitais de páginas e manifesto.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import fitz
+
+from pdf2md import __version__
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+
+def calcular_impressao_pagina(documento: fitz.Document, numero_pagina: int) -> str:
+    """
+    Calcula a impressão digital de uma página.
+
+    Combina o content stream da página, sua geometria e os recursos que
+    ela referencia (dicionário de recursos, fontes, imagens e XObjects).
+    Editar qualquer um deles altera a impressão; páginas intocadas mantêm
+    a mesma impressão entre versões do PDF.
+
+    Args:
+        documento: Documento PDF aberto
+        numero_pagina: Número da página (0-indexed)
+
+    Returns:
+        Hash hexadecimal da página
+    """
+    pagina = documento[numero_pagina]
+    sha = hashlib.sha256()
+
+    sha.update(pagina.read_contents())
+    sha.update(repr((tuple(pagina.rect), pagina.rotation)).encode())
+
+    if documento.is_pdf:
+        sha.update(str(documento.xref_get_key(pagina.xref, "Resources")).encode())
+
+        for fonte in pagina.get_fonts(full=True):
+            if fonte[0] > 0:
+                sha.update(documento.xref_object(fonte[0], compressed=True).encode())
+
+        xrefs_streams = [img[0] for img in pagina.get_images(full=True)]
+        xrefs_streams += [xobj[0] for xobj in pagina.get_xobjects()]
+        for xref in xrefs_streams:
+            if xref > 0:
+                sha.update(documento.xref_stream_raw(xref) or b"")
+
+    return sha.hexdigest()
+
+
+class ManifestoIncremental:
+    """
+    Fragmentos Markdown por página de uma conversão anterior.
+
+    Fica ao lado do Markdown gerado (``.<nome>.paginas.json``) e guarda,
+    para cada página, a impressão digital, o fragmento, as estatísticas
+    e as imagens gravadas. Só é reaproveitado quando as opções de saída e
+    a versão do pdf2md são as mesmas da conversão anterior.
+    """
+
+    def __init__(self, arquivo_markdown: Path, opcoes: dict):
+        """
+        Inicializa o manifesto.
+
+        Args:
+            arquivo_markdown: Markdown gerado pela conversão
+            opcoes: Opções que afetam a saída da conversão
+        """
+        arquivo_markdown = Path(arquivo_markdown)
+        self.caminho = arquivo_markdown.with_name(f".{arquivo_markdown.stem}.paginas.json")
+        self.opcoes = opcoes
+        self.paginas_anteriores: List[dict] = []
+        self.paginas: List[Optional[dict]] = []
+
+    def carregar(self) -> None:
+        """Carrega o manifesto anterior, se compatível com as opções atuais."""
+        if not self.caminho.exists():
+            return
+
+        try:
+            dados = json.loads(self.caminho.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifesto incremental ignorado: {e}")
+            return
+
+        if dados.get("versao") != __version__ or dados.get("opcoes") != self.opcoes:
+            return
+
+        self.paginas_anteriores = dados.get("paginas", [])
+
+    def buscar(self, numero_pagina: int, impressao: str) -> Optional[dict]:
+        """
+        Retorna o resultado anterior da página se ela não mudou.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            impressao: Impressão digital atual da página
+
+        Returns:
+            Resultado da página ou None se precisar ser reconvertida
+        """
+        if numero_pagina >= len(self.paginas_anteriores):
+            return None
+
+        anterior = self.paginas_anteriores[numero_pagina]
+        if anterior.get("impressao") != impressao:
+            return None
+
+        # As imagens da página precisam continuar no diretório de saída
+        if not all(Path(imagem).exists() for imagem in anterior.get("imagens", [])):
+            return None
+
+        return anterior
+
+    def registrar(self, resultado: dict, impressao: str) -> None:
+        """
+        Registra o resultado atual de uma página.
+
+        Args:
+            resultado: Resultado da página (ver PDFConverter._converter_pagina)
+            impressao: Impressão digital da página
+        """
+        numero = resultado["numero"]
+        while len(self.paginas) <= numero:
+            self.paginas.append(None)
+
+        self.paginas[numero] = {
+            "numero": numero,
+            "impressao": impressao,
+            "fragmento": resultado["fragmento"],
+            "estatisticas": resultado["estatisticas"],
+            "imagens": [str(imagem) for imagem in resultado["imagens"]],
+            "imagens_manifesto": resultado.get("imagens_manifesto", []),
+        }
+
+    def salvar(self) -> None:
+        """Grava o manifesto de forma atômica."""
+        dados = {
+            "versao": __version__,
+            "opcoes": self.opcoes,
+            "paginas": self.paginas,
+        }
+
+        temporario = self.caminho.with_name(self.caminho.name + ".tmp")
+        temporario.write_text(json.dumps(dados), encoding="utf-8")
+        os.replace(temporario, self.caminho)
@@ -0,0 +1,99 @@
+"""
+Cache de resultados de OCR endereçado pela imagem renderizada da página.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from pdf2md.utils.cache_lru import CacheDiscoLRU
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+# Tamanho máximo padrão do cache de OCR (256 MiB de texto)
+TAMANHO_MAXIMO_PADRAO_OCR = 256 * 1024 ** 2
+
+
+class CacheOCR(CacheDiscoLRU):
+    """
+    Guarda o texto reconhecido de cada página renderizada.
+
+    A chave combina o hash das amostras da imagem (com modo e dimensões),
+    o idioma e o zoom da renderização. Uma página idêntica, em qualquer
+    documento, é servida do cache sem passar pelo Tesseract.
+    """
+
+    ARQUIVO_TEXTO = "texto.txt"
+
+    def __init__(self, diretorio: Path, tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO_OCR):
+        """
+        Inicializa o cache de OCR.
+
+        Args:
+            diretorio: Diretório raiz do cache
+            tamanho_maximo: Tamanho máximo em bytes
+        """
+        super().__init__(diretorio, tamanho_maximo)
+
+    def calcular_chave(self, renderizada: dict, idioma: str) -> str:
+        """
+        Calcula a chave de uma página renderizada.
+
+        Args:
+            renderizada: Página renderizada (ver ProcessadorOCR.renderizar_pagina)
+            idioma: Idioma do OCR
+
+        Returns:
+            Chave hexadecimal
+        """
+        sha = hashlib.sha256()
+        sha.update(
+            repr((
+                renderizada["modo"],
+                renderizada["largura"],
+                renderizada["altura"],
+                renderizada["zoom"],
+                idioma,
+            )).encode()
+        )
+        sha.update(renderizada["amostras"])
+        return sha.hexdigest()
+
+    def buscar(self, chave: str) -> Optional[str]:
+        """
+        Retorna o texto guardado para a chave.
+
+        Args:
+            chave: Chave calculada por ``calcular_chave``
+
+        Returns:
+            Texto reconhecido ou None se não estiver no cache
+        """
+        entrada = self.obter(chave)
+        if entrada is None:
+            return None
+
+        try:
+            return (entrada / self.ARQUIVO_TEXTO).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def guardar(self, chave: str, texto: str) -> None:
+        """
+        Grava o texto reconhecido de uma página.
+
+        Args:
+            chave: Chave calculada por ``calcular_chave``
+            texto: Texto reconhecido
+        """
+        temporario = self.novo_temporario()
+
+        try:
+            (temporario / self.ARQUIVO_TEXTO).write_text(texto, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar no cache de OCR: {e}")
+            self._remover(temporario)
+            return
+
+        self.confirmar(chave, temporario)
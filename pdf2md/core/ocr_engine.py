@@ -0,0 +1,147 @@
+"""
+Motor de OCR com um pool de processos de longa duração.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, Optional
+
+from pdf2md.core.ocr_processor import ProcessadorOCR
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+# ProcessadorOCR de cada processo worker (criado uma vez no inicializador)
+_processador_worker: Optional[ProcessadorOCR] = None
+
+
+def _inicializar_worker(idioma: str) -> None:
+    """
+    Prepara um processo worker do motor.
+
+    Limita o Tesseract a uma thread (cada worker já ocupa um núcleo) e
+    cria o ProcessadorOCR do processo, importando o pytesseract uma vez.
+
+    Args:
+        idioma: Idioma para OCR
+    """
+    global _processador_worker
+
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _processador_worker = ProcessadorOCR(None, idioma)
+
+
+def _reconhecer(renderizada: dict) -> str:
+    """Reconhece uma página renderizada no processo worker."""
+    return _processador_worker.reconhecer_imagem(renderizada)
+
+
+def _reconhecer_lote(renderizadas: list) -> list:
+    """Reconhece um lote de páginas com uma execução do Tesseract."""
+    return _processador_worker.reconhecer_lote(renderizadas)
+
+
+class MotorOCR:
+    """
+    Executa o Tesseract em um pool de processos que vive enquanto o motor
+    estiver aberto (um documento ou um lote inteiro).
+
+    As páginas renderizadas entram por uma fila limitada: ``enviar``
+    bloqueia enquanto houver ``tamanho_fila`` páginas em andamento, o que
+    limita a memória ocupada por imagens à espera de OCR.
+    """
+
+    def __init__(
+        self,
+        idioma: str = "por",
+        workers: Optional[int] = None,
+        tamanho_fila: Optional[int] = None,
+    ):
+        """
+        Inicializa o motor.
+
+        Args:
+            idioma: Idioma para OCR
+            workers: Número de processos (padrão: número de núcleos)
+            tamanho_fila: Páginas em andamento ao mesmo tempo
+                (padrão: o dobro de ``workers``)
+        """
+        self.idioma = idioma
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.tamanho_fila = max(1, tamanho_fila or self.workers * 2)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_inicializar_worker,
+            initargs=(idioma,),
+        )
+        self._pendentes = set()
+
+    def enviar(self, renderizada: dict) -> Future:
+        """
+        Envia uma página para OCR, aguardando vaga na fila se necessário.
+
+        Args:
+            renderizada: Página renderizada, com as amostras em bytes
+                (ver ProcessadorOCR.renderizar_pagina)
+
+        Returns:
+            Future com o texto reconhecido
+        """
+        return self._submeter(_reconhecer, renderizada)
+
+    def enviar_lote(self, renderizadas: list) -> Future:
+        """
+        Envia um lote de páginas para uma única execução do Tesseract.
+
+        O lote ocupa uma vaga da fila.
+
+        Args:
+            renderizadas: Páginas renderizadas, com as amostras em bytes
+
+        Returns:
+            Future com a lista de textos, na ordem do lote
+        """
+        return self._submeter(_reconhecer_lote, renderizadas)
+
+    def _submeter(self, funcao, argumento) -> Future:
+        """Submete uma tarefa ao pool, aguardando vaga na fila."""
+        self._pendentes = {f for f in self._pendentes if not f.done()}
+        while len(self._pendentes) >= self.tamanho_fila:
+            _, self._pendentes = wait(self._pendentes, return_when=FIRST_COMPLETED)
+
+        futuro = self._executor.submit(funcao, argumento)
+        self._pendentes.add(futuro)
+        return futuro
+
+    def reconhecer(self, paginas: Iterable[dict]) -> Iterator[str]:
+        """
+        Reconhece uma sequência de páginas e devolve os textos na mesma ordem.
+
+        Args:
+            paginas: Páginas renderizadas, consumidas à medida que há vaga
+                na fila
+
+        Yields:
+            Texto de cada página, na ordem de entrada
+        """
+        fila = deque()
+
+        for renderizada in paginas:
+            fila.append(self.enviar(renderizada))
+            if len(fila) >= self.tamanho_fila:
+                yield fila.popleft().result()
+
+        while fila:
+            yield fila.popleft().result()
+
+    def fechar(self) -> None:
+        """Encerra os processos do motor."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.fechar()
@@ -2,34 +2,479 @@
 Processador OCR para PDFs escaneados.
 """
 
-from io import BytesIO
+import difflib
+import math
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import fitz
+import numpy as np
 from PIL import Image
 
+from pdf2md.core.ocr_preprocessing import preprocessar
+from pdf2md.core.page_context import ContextoPagina
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
+# Valor de ``ocr_habilitado`` que decide o OCR página a página
+OCR_AUTOMATICO = "auto"
+
+# Valor de ``ocr_habilitado`` que reconhece apenas as regiões de imagem,
+# mantendo a camada de texto nativa do restante da página
+OCR_REGIOES = "regioes"
+
+# Limiares do modo automático: páginas com pouco texto nativo e cobertas
+# em boa parte por imagens são tratadas como escaneadas
+MINIMO_CARACTERES_TEXTO = 50
+COBERTURA_MINIMA_IMAGENS = 0.5
+
+# Resolução das páginas entregues ao OCR (DPI efetivo)
+DPI_MINIMO_OCR = 150
+DPI_MAXIMO_OCR = 300
+DPI_PADRAO_OCR = 300
+
+# Altura, em pixels, de uma linha de texto na imagem entregue ao Tesseract
+ALTURA_LINHA_ALVO = 32
+
+# Limite de pixels da página renderizada (páginas muito grandes)
+MAXIMO_PIXELS_OCR = 40_000_000
+
+# Fração da página que uma imagem precisa cobrir para ser a página inteira
+COBERTURA_PAGINA_INTEIRA = 0.9
+
+# Menor lado, em pontos, de uma imagem reconhecida no modo por regiões
+# (ícones e logotipos menores são ignorados)
+LADO_MINIMO_REGIAO_OCR = 32
+
+# Fração de uma região já coberta por outra para ser considerada repetida
+SOBREPOSICAO_MAXIMA_REGIOES = 0.9
+
+# Páginas em faixas: sobreposição entre faixas vizinhas (pontos; maior que
+# uma linha de texto, para que cada linha apareça inteira em alguma faixa)
+SOBREPOSICAO_FAIXAS = 48
+
+# Faixas de uma página em OCR ao mesmo tempo (o orçamento de memória da
+# página é dividido entre elas e a faixa em renderização)
+FAIXAS_SIMULTANEAS = 4
+
+# Linhas examinadas em cada lado da emenda entre duas faixas
+LINHAS_EMENDA = 8
+
+# Semelhança mínima para duas linhas da emenda serem a mesma linha
+SEMELHANCA_LINHAS_EMENDA = 0.9
+
+# Linhas de resto (linhas cortadas pela borda) toleradas em cada lado da
+# emenda
+RESTOS_EMENDA = 2
+
+# Memória estimada por pixel no pré-processamento (matrizes int64 da
+# binarização), somada aos bytes das amostras
+MEMORIA_PREPROCESSAMENTO_POR_PIXEL = 28
+
+
+def diagnosticar_pagina(contexto: ContextoPagina) -> dict:
+    """
+    Avalia se uma página parece escaneada (sem camada de texto útil).
+
+    Conta os caracteres não brancos da camada de texto e, quando há
+    pouco texto, mede a fração da área da página coberta por imagens.
+
+    Args:
+        contexto: Contexto da página
+
+    Returns:
+        Dicionário com 'caracteres', 'cobertura_imagens' e 'ocr' (bool)
+    """
+    pagina = contexto.pagina
+    caracteres = sum(1 for c in contexto.obter_texto("text") if not c.isspace())
+
+    area_pagina = abs(pagina.rect) or 1.0
+    area_imagens = 0.0
+    if caracteres < MINIMO_CARACTERES_TEXTO:
+        for imagem in contexto.imagens:
+            for retangulo in pagina.get_image_rects(imagem[0]):
+                area_imagens += abs(retangulo & pagina.rect)
+    cobertura = min(1.0, area_imagens / area_pagina)
+
+    return {
+        "caracteres": caracteres,
+        "cobertura_imagens": round(cobertura, 3),
+        "ocr": (
+            caracteres < MINIMO_CARACTERES_TEXTO
+            and cobertura >= COBERTURA_MINIMA_IMAGENS
+        ),
+    }
+
+
+def calcular_zoom_ocr(
+    pagina: fitz.Page,
+    imagens: list,
+    maximo_pixels: Optional[int] = MAXIMO_PIXELS_OCR,
+) -> float:
+    """
+    Escolhe o zoom de renderização de uma página para o OCR.
+
+    Se a página é uma única imagem que a cobre inteira (página
+    escaneada), usa a resolução nativa da imagem. Caso contrário, uma
+    sonda de baixa resolução mede a altura das linhas de texto e o zoom é
+    escolhido para que elas tenham ``ALTURA_LINHA_ALVO`` pixels. O
+    resultado fica entre ``DPI_MINIMO_OCR`` e ``DPI_MAXIMO_OCR`` e é
+    reduzido se a página renderizada passar de ``maximo_pixels``.
+
+    Args:
+        pagina: Página do PDF
+        imagens: Imagens da página (``get_images``)
+        maximo_pixels: Limite de pixels da página renderizada (None não
+            limita; usado quando a página pode ser dividida em faixas)
+
+    Returns:
+        Zoom (1.0 = 72 DPI)
+    """
+    dpi = _dpi_imagem_pagina_inteira(pagina, imagens)
+
+    if dpi is None:
+        altura_linha = _estimar_altura_linha(pagina)
+        if altura_linha is None:
+            dpi = DPI_PADRAO_OCR
+        elif altura_linha == 0:
+            # Página sem tinta: não há o que ampliar
+            dpi = DPI_MINIMO_OCR
+        else:
+            dpi = ALTURA_LINHA_ALVO / altura_linha * 72
+
+    return _limitar_zoom(dpi, abs(pagina.rect), maximo_pixels)
+
+
+def _limitar_zoom(
+    dpi: float, area: float, maximo_pixels: Optional[int] = MAXIMO_PIXELS_OCR
+) -> float:
+    """
+    Converte um DPI em zoom, respeitando os limites de resolução do OCR.
+
+    Args:
+        dpi: Resolução desejada
+        area: Área renderizada, em pontos quadrados
+        maximo_pixels: Limite de pixels da imagem (None não limita)
+
+    Returns:
+        Zoom entre ``DPI_MINIMO_OCR`` e ``DPI_MAXIMO_OCR``, reduzido se a
+        imagem passar de ``maximo_pixels``
+    """
+    zoom = min(max(dpi, DPI_MINIMO_OCR), DPI_MAXIMO_OCR) / 72
+
+    pixels = area * zoom * zoom
+    if maximo_pixels is not None and pixels > maximo_pixels:
+        zoom *= (maximo_pixels / pixels) ** 0.5
+
+    return round(zoom, 3)
+
+
+def localizar_regioes_ocr(contexto: ContextoPagina, blocos: list) -> list:
+    """
+    Localiza as regiões de imagem de uma página que precisam de OCR.
+
+    Usa as posições de ``get_image_info`` (cada ocorrência de cada
+    imagem). Descarta imagens pequenas, regiões repetidas e imagens que já
+    têm texto nativo por cima (por exemplo, escaneamentos com camada de
+    texto).
+
+    Args:
+        contexto: Contexto da página
+        blocos: Blocos de texto nativo da página
+            (ver ExtratorTexto.extrair_blocos_estruturados)
+
+    Returns:
+        Lista de tuplas (retângulo, DPI nativo da imagem)
+    """
+    pagina = contexto.pagina
+    regioes = []
+
+    for info in contexto.info_imagens:
+        caixa = fitz.Rect(info["bbox"])
+        retangulo = caixa & pagina.rect
+        lado = min(retangulo.width, retangulo.height)
+        if retangulo.is_empty or lado < LADO_MINIMO_REGIAO_OCR:
+            continue
+
+        if any(
+            abs(retangulo & anterior) >= abs(retangulo) * SOBREPOSICAO_MAXIMA_REGIOES
+            for anterior, _ in regioes
+        ):
+            continue
+
+        caracteres = sum(
+            sum(1 for c in bloco["texto"] if not c.isspace())
+            for bloco in blocos
+            if fitz.Point(
+                (bloco["x0"] + bloco["x1"]) / 2, (bloco["y0"] + bloco["y1"]) / 2
+            ) in retangulo
+        )
+        if caracteres >= MINIMO_CARACTERES_TEXTO:
+            continue
+
+        # Pela área, o DPI não depende de a imagem estar girada
+        dpi = (info["width"] * info["height"] / abs(caixa)) ** 0.5 * 72
+        regioes.append((retangulo, dpi))
+
+    return regioes
+
+
+def _dpi_imagem_pagina_inteira(pagina: fitz.Page, imagens: list) -> Optional[float]:
+    """
+    Retorna a resolução nativa de uma página formada por uma única imagem.
+
+    Args:
+        pagina: Página do PDF
+        imagens: Imagens da página (``get_images``)
+
+    Returns:
+        DPI da imagem ou None se a página não for uma imagem inteira
+    """
+    if len(imagens) != 1:
+        return None
+
+    xref, _, largura, altura = imagens[0][:4]
+    retangulos = pagina.get_image_rects(xref)
+    if len(retangulos) != 1:
+        return None
+
+    retangulo = retangulos[0] & pagina.rect
+    if abs(retangulo) < abs(pagina.rect) * COBERTURA_PAGINA_INTEIRA:
+        return None
+
+    dpi_x = largura / (retangulo.width / 72)
+    dpi_y = altura / (retangulo.height / 72)
+    return (dpi_x + dpi_y) / 2
+
+
+def _estimar_altura_linha(pagina: fitz.Page) -> Optional[float]:
+    """
+    Estima a altura das linhas de texto com uma sonda a 72 DPI.
+
+    A página é renderizada em tons de cinza e as linhas com tinta são
+    agrupadas em faixas (perfil de projeção horizontal); a altura típica
+    é a mediana das faixas.
+
+    Args:
+        pagina: Página do PDF
+
+    Returns:
+        Altura em pontos, 0 se a página não tem tinta, ou None se não
+        foi possível identificar linhas de texto
+    """
+    pix = pagina.get_pixmap(colorspace=fitz.csGRAY, alpha=False)
+    amostras = np.frombuffer(pix.samples, dtype=np.uint8)
+    amostras = amostras.reshape(pix.height, pix.stride)[:, :pix.width]
+
+    tinta_por_linha = (amostras < 128).sum(axis=1)
+    if not tinta_por_linha.any():
+        return 0
+
+    com_tinta = tinta_por_linha > max(1, pix.width * 0.002)
+
+    # Bordas das faixas de linhas consecutivas com tinta
+    bordas = np.diff(np.concatenate(([0], com_tinta.astype(np.int8), [0])))
+    alturas = np.flatnonzero(bordas == -1) - np.flatnonzero(bordas == 1)
+    alturas = alturas[alturas >= 2]
+
+    if len(alturas) < 3:
+        return None
+
+    return float(np.median(alturas))
+
+
+def planejar_faixas(
+    retangulo: fitz.Rect, zoom: float, bytes_por_pixel: float, orcamento: int
+) -> tuple:
+    """
+    Divide uma página em faixas horizontais sobrepostas que cabem no
+    orçamento de memória.
+
+    As faixas ocupam a largura inteira da página (as linhas de texto não
+    são cortadas na horizontal) e se sobrepõem em ``SOBREPOSICAO_FAIXAS``.
+    Se nem uma faixa de três sobreposições de altura couber no orçamento
+    (páginas larguíssimas), o zoom é reduzido.
+
+    Args:
+        retangulo: Área da página, em pontos
+        zoom: Zoom de renderização
+        bytes_por_pixel: Memória ocupada por pixel renderizado
+        orcamento: Memória máxima de uma faixa, em bytes
+
+    Returns:
+        Tupla (zoom, lista de retângulos das faixas de cima para baixo)
+    """
+    altura_minima = 3 * SOBREPOSICAO_FAIXAS
+
+    def bytes_por_linha(zoom):
+        # Um pixel de folga na largura para o arredondamento do recorte
+        return (retangulo.width * zoom + 1) * bytes_por_pixel
+
+    # Duas linhas de pixels de folga para o arredondamento do recorte
+    altura = (orcamento / bytes_por_linha(zoom) - 2) / zoom
+    while altura < altura_minima:
+        zoom *= 0.95
+        altura = (orcamento / bytes_por_linha(zoom) - 2) / zoom
+
+    faixas = []
+    topo = retangulo.y0
+    while True:
+        base = min(topo + altura, retangulo.y1)
+        faixas.append(fitz.Rect(retangulo.x0, topo, retangulo.x1, base))
+        if base >= retangulo.y1:
+            break
+        topo = base - SOBREPOSICAO_FAIXAS
+
+    # Arredondado para baixo, como os demais zooms, sem passar do orçamento
+    return math.floor(zoom * 1000) / 1000, faixas
+
+
+def costurar_faixas(textos: list) -> str:
+    """
+    Junta os textos das faixas de uma página, removendo as linhas repetidas
+    nas emendas.
+
+    Nas emendas, as linhas inteiras da área sobreposta aparecem nas duas
+    faixas, e as linhas cortadas pela borda de uma faixa aparecem inteiras
+    na outra. A maior sequência de linhas semelhantes entre o fim de uma
+    faixa e o início da seguinte marca a emenda: o que vem depois dela na
+    primeira faixa e antes dela na segunda são restos de linhas cortadas.
+
+    Args:
+        textos: Texto reconhecido de cada faixa, de cima para baixo
+
+    Returns:
+        Texto da página
+    """
+    linhas = []
+
+    for texto in textos:
+        novas = [linha for linha in texto.splitlines() if linha.strip()]
+        if not linhas:
+            linhas = novas
+            continue
+
+        inicio_fim = max(0, len(linhas) - LINHAS_EMENDA)
+        fim, inicio, tamanho = _maior_emenda(
+            linhas[inicio_fim:], novas[:LINHAS_EMENDA]
+        )
+        if tamanho:
+            linhas = linhas[:inicio_fim + fim + tamanho] + novas[inicio + tamanho:]
+        else:
+            linhas = linhas + novas
+
+    return "\n".join(linhas)
+
+
+def _maior_emenda(fim: list, inicio: list) -> tuple:
+    """
+    Procura a maior sequência de linhas semelhantes entre o fim de uma
+    faixa e o início da próxima.
+
+    A sequência precisa terminar no fim da faixa de cima e começar no
+    início da de baixo, tolerando ``RESTOS_EMENDA`` linhas cortadas em
+    cada lado. Linhas semelhantes têm os mesmos dígitos, para que "Linha
+    10" e "Linha 11" não passem pela mesma linha.
+
+    Args:
+        fim: Últimas linhas da faixa de cima
+        inicio: Primeiras linhas da faixa de baixo
+
+    Returns:
+        Tupla (posição em ``fim``, posição em ``inicio``, número de linhas)
+    """
+    def normalizar(linha: str) -> str:
+        return " ".join(linha.split())
+
+    fim = [normalizar(linha) for linha in fim]
+    inicio = [normalizar(linha) for linha in inicio]
+
+    def semelhantes(a: str, b: str) -> bool:
+        if a == b:
+            return True
+        if [c for c in a if c.isdigit()] != [c for c in b if c.isdigit()]:
+            return False
+        return difflib.SequenceMatcher(None, a, b).ratio() >= SEMELHANCA_LINHAS_EMENDA
+
+    melhor = (0, 0, 0)
+    for i in range(len(fim)):
+        for j in range(min(len(inicio), RESTOS_EMENDA + 1)):
+            tamanho = 0
+            while (
+                i + tamanho < len(fim)
+                and j + tamanho < len(inicio)
+                and semelhantes(fim[i + tamanho], inicio[j + tamanho])
+            ):
+                tamanho += 1
+            if tamanho > melhor[2] and i + tamanho >= len(fim) - RESTOS_EMENDA:
+                melhor = (i, j, tamanho)
+
+    return melhor
+
 
 class ProcessadorOCR:
     """Processa OCR em PDFs escaneados."""
 
     def __init__(
-        self, documento: fitz.Document, idioma: str = "por", verbose: bool = False
+        self,
+        documento: Optional[fitz.Document],
+        idioma: str = "por",
+        verbose: bool = False,
+        motor=None,
+        escala_cinza: bool = False,
+        cache=None,
+        preprocessar: bool = False,
+        memoria_maxima: Optional[int] = None,
+        tamanho_lote: int = 1,
     ):
         """
         Inicializa o processador OCR.
 
         Args:
-            documento: Documento PDF aberto com fitz
+            documento: Documento PDF aberto com fitz (None nos workers do
+                MotorOCR, que só reconhecem imagens já renderizadas)
             idioma: Idioma para OCR (por, eng, spa, fra)
             verbose: Modo verbose
+            motor: MotorOCR que executa o Tesseract em processos separados
+                (opcional; sem ele o OCR roda no processo atual)
+            escala_cinza: Renderizar as páginas em tons de cinza (um terço
+                da memória de RGB)
+            cache: CacheOCR com os textos de páginas já reconhecidas
+                (opcional)
+            preprocessar: Binarizar, endireitar e recortar as margens das
+                páginas antes do OCR (ver ocr_preprocessing)
+            memoria_maxima: Memória máxima, em bytes, das imagens de uma
+                página em OCR. Páginas maiores são renderizadas e
+                reconhecidas em faixas, sem perder resolução; None mantém
+                a página inteira, com o zoom limitado a
+                ``MAXIMO_PIXELS_OCR``
+            tamanho_lote: Páginas antecipadas reconhecidas por uma única
+                execução do Tesseract (1 executa uma vez por página)
         """
         self.documento = documento
         self.idioma = idioma
         self.verbose = verbose
+        self.motor = motor
+        self.escala_cinza = escala_cinza
+        self.cache = cache
+        self.preprocessar = preprocessar
+        self.memoria_maxima = memoria_maxima
+        self.tamanho_lote = max(1, int(tamanho_lote))
+
+        # Páginas já enviadas ao motor: número → (Future, chave, acerto)
+        self._antecipadas = {}
+
+        # Páginas à espera de completar um lote: (renderizada, Future)
+        self._lote = []
+
+        # Contadores do cache e do pré-processamento desde a última coleta
+        # (ver coletar_contadores)
+        self._contadores = {}
 
         # Tentar importar pytesseract
         try:
@@ -41,32 +486,448 @@ class ProcessadorOCR:
             logger.warning("pytesseract não instalado. OCR desabilitado.")
             self.ocr_disponivel = False
 
-    def processar_pagina_ocr(self, numero_pagina: int) -> str:
+    def renderizar_pagina(
+        self,
+        numero_pagina: int,
+        contexto: Optional[ContextoPagina] = None,
+        copiar: bool = False,
+    ) -> dict:
         """
-        Processa OCR em uma página específica.
+        Renderiza uma página para o OCR, sem codificá-la em PNG.
+
+        O zoom é escolhido por página (ver ``calcular_zoom_ocr``). Com
+        ``preprocessar``, a página sai binarizada, endireitada e recortada,
+        sempre no modo "L".
+
+        Por padrão as amostras são uma memoryview sobre o buffer do
+        Pixmap (que é mantido no dicionário para continuar válido); imagens
+        montadas sobre elas não devem sobreviver ao dicionário. Com
+        ``copiar``, as amostras são copiadas para ``bytes``, necessário
+        para enviá-las a outro processo.
 
         Args:
             numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada
+            copiar: Copiar as amostras para bytes
 
         Returns:
-            Texto extraído via OCR
+            Dicionário com 'modo' ("L" ou "RGB"), 'largura', 'altura',
+            'stride', 'zoom' e 'amostras'
+        """
+        pagina, imagens = self._carregar_pagina(numero_pagina, contexto)
+        zoom = self._zoom_pagina(pagina, imagens)
+        return self._renderizar(pagina, zoom, None, copiar)
+
+    def _carregar_pagina(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina]
+    ) -> tuple:
+        """Retorna a página e as suas imagens, do contexto se houver."""
+        if contexto is not None:
+            return contexto.pagina, contexto.imagens
+
+        pagina = self.documento[numero_pagina]
+        return pagina, pagina.get_images()
+
+    def _zoom_pagina(self, pagina: fitz.Page, imagens: list) -> float:
+        """Zoom da página; com memória máxima, a resolução não é reduzida."""
+        if self.memoria_maxima is not None:
+            return calcular_zoom_ocr(pagina, imagens, maximo_pixels=None)
+        return calcular_zoom_ocr(pagina, imagens)
+
+    def _planejar_faixas(self, pagina: fitz.Page, zoom: float) -> Optional[tuple]:
+        """
+        Decide se a página precisa ser reconhecida em faixas.
+
+        Args:
+            pagina: Página do PDF
+            zoom: Zoom de renderização
+
+        Returns:
+            None se a página inteira cabe em ``memoria_maxima``; senão a
+            tupla (zoom, faixas) de ``planejar_faixas``
+        """
+        if self.memoria_maxima is None:
+            return None
+
+        bytes_por_pixel = 1 if self.escala_cinza else 3
+        if self.preprocessar:
+            bytes_por_pixel += MEMORIA_PREPROCESSAMENTO_POR_PIXEL
+
+        if abs(pagina.rect) * zoom * zoom * bytes_por_pixel <= self.memoria_maxima:
+            return None
+
+        # O orçamento de cada faixa não depende do número de workers, para
+        # que o texto costurado seja o mesmo com ou sem motor
+        orcamento = self.memoria_maxima // (FAIXAS_SIMULTANEAS + 1)
+        return planejar_faixas(pagina.rect, zoom, bytes_por_pixel, orcamento)
+
+    def _faixas_simultaneas(self) -> int:
+        """Número de faixas de uma página em OCR ao mesmo tempo."""
+        if self.motor is not None:
+            return min(FAIXAS_SIMULTANEAS, self.motor.tamanho_fila)
+        return min(FAIXAS_SIMULTANEAS, os.cpu_count() or 1)
+
+    def _reconhecer_faixas(self, pagina: fitz.Page, zoom: float, faixas: list) -> str:
+        """
+        Reconhece uma página faixa a faixa e costura o texto.
+
+        Cada faixa é renderizada com um recorte e enviada ao OCR (ao motor
+        ou, sem motor, a um pool de threads, já que o Tesseract roda em
+        processos próprios); no máximo ``_faixas_simultaneas`` faixas
+        ficam em memória à espera do OCR.
+
+        Args:
+            pagina: Página do PDF
+            zoom: Zoom das faixas
+            faixas: Retângulos das faixas, de cima para baixo
+
+        Returns:
+            Texto da página
+        """
+        simultaneas = self._faixas_simultaneas()
+        pool = None
+        if self.motor is not None:
+            enviar = self.motor.enviar
+        else:
+            pool = ThreadPoolExecutor(max_workers=simultaneas)
+
+            def enviar(renderizada):
+                return pool.submit(self.reconhecer_imagem, renderizada)
+
+        textos = []
+        pendentes = deque()
+        try:
+            for faixa in faixas:
+                if len(pendentes) >= simultaneas:
+                    textos.append(self._recolher(pendentes.popleft()))
+                renderizada = self._renderizar(
+                    pagina, zoom, faixa, copiar=self.motor is not None
+                )
+                pendentes.append(self._enviar(renderizada, enviar))
+                del renderizada
+
+            while pendentes:
+                textos.append(self._recolher(pendentes.popleft()))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        contadores = self._contadores
+        contadores["paginas_em_faixas"] = contadores.get("paginas_em_faixas", 0) + 1
+        contadores["faixas_ocr"] = contadores.get("faixas_ocr", 0) + len(faixas)
+
+        return costurar_faixas(textos)
+
+    def renderizar_regiao(
+        self,
+        numero_pagina: int,
+        retangulo: fitz.Rect,
+        dpi: float,
+        contexto: Optional[ContextoPagina] = None,
+        copiar: bool = False,
+    ) -> dict:
+        """
+        Renderiza apenas uma região da página para o OCR.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            retangulo: Região a renderizar, em pontos
+            dpi: Resolução desejada (limitada como a das páginas inteiras)
+            contexto: Contexto da página já carregada
+            copiar: Copiar as amostras para bytes
+
+        Returns:
+            Dicionário no formato de ``renderizar_pagina``
+        """
+        if contexto is not None:
+            pagina = contexto.pagina
+        else:
+            pagina = self.documento[numero_pagina]
+
+        zoom = _limitar_zoom(dpi, abs(retangulo))
+        return self._renderizar(pagina, zoom, retangulo, copiar)
+
+    def _renderizar(
+        self,
+        pagina: fitz.Page,
+        zoom: float,
+        recorte: Optional[fitz.Rect],
+        copiar: bool,
+    ) -> dict:
+        """Renderiza a página (ou um recorte dela) no formato entregue ao OCR."""
+        pix = pagina.get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom),
+            colorspace=fitz.csGRAY if self.escala_cinza else fitz.csRGB,
+            alpha=False,
+            clip=recorte,
+        )
+
+        renderizada = {
+            "modo": "L" if pix.n == 1 else "RGB",
+            "largura": pix.width,
+            "altura": pix.height,
+            "stride": pix.stride,
+            "zoom": zoom,
+        }
+        if self.preprocessar:
+            return self._preprocessar_pixmap(pix, renderizada, copiar)
+
+        if copiar:
+            renderizada["amostras"] = pix.samples
+        else:
+            renderizada["amostras"] = pix.samples_mv
+            renderizada["pixmap"] = pix
+
+        return renderizada
+
+    def _preprocessar_pixmap(
+        self, pix: fitz.Pixmap, renderizada: dict, copiar: bool
+    ) -> dict:
+        """
+        Pré-processa as amostras do Pixmap e registra os tempos de cada etapa.
+
+        Args:
+            pix: Pixmap da página
+            renderizada: Dicionário de ``renderizar_pagina`` sem as amostras
+            copiar: Copiar as amostras para bytes
+
+        Returns:
+            O dicionário com a imagem pré-processada
+        """
+        matriz = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+        matriz = matriz.reshape(pix.height, pix.stride)[:, :pix.width * pix.n]
+        if pix.n > 1:
+            matriz = matriz.reshape(pix.height, pix.width, pix.n)
+
+        binaria, tempos = preprocessar(matriz)
+        del matriz
+
+        altura, largura = binaria.shape
+        renderizada.update(modo="L", largura=largura, altura=altura, stride=largura)
+        if copiar:
+            renderizada["amostras"] = binaria.tobytes()
+        else:
+            # A memoryview mantém a matriz viva enquanto for usada
+            renderizada["amostras"] = binaria.reshape(-1).data
+
+        contadores = self._contadores.setdefault("ocr_preprocessamento", {})
+        contadores["paginas"] = contadores.get("paginas", 0) + 1
+        for etapa in ("binarizacao", "inclinacao", "recorte",
+                      "pixels_originais", "pixels_finais"):
+            contadores[etapa] = contadores.get(etapa, 0) + tempos[etapa]
+
+        return renderizada
+
+    def reconhecer_imagem(self, renderizada: dict) -> str:
+        """
+        Executa o Tesseract sobre uma página renderizada.
+
+        A imagem PIL é montada diretamente sobre as amostras, sem cópia, e
+        o pytesseract a grava para o Tesseract sem compressão (PGM/PPM).
+
+        Args:
+            renderizada: Página renderizada (ver ``renderizar_pagina``)
+
+        Returns:
+            Texto reconhecido
         """
         if not self.ocr_disponivel:
-            logger.warning("OCR não disponível")
             return ""
 
+        imagem = _imagem_pil(renderizada)
+        return self.pytesseract.image_to_string(imagem, lang=self._mapear_idioma())
+
+    def reconhecer_lote(self, renderizadas: list) -> list:
+        """
+        Reconhece várias páginas com uma única execução do Tesseract.
+
+        As imagens são gravadas sem compressão (PGM/PPM) em um diretório
+        temporário e o Tesseract recebe um arquivo com a lista delas,
+        carregando o modelo do idioma uma vez só. A saída traz as páginas
+        separadas por form feed; se o número de páginas não bater, o lote é
+        refeito página a página.
+
+        Args:
+            renderizadas: Páginas renderizadas (ver ``renderizar_pagina``)
+
+        Returns:
+            Texto de cada página, na mesma ordem
+        """
+        if not self.ocr_disponivel:
+            return ["" for _ in renderizadas]
+        if len(renderizadas) == 1:
+            return [self.reconhecer_imagem(renderizadas[0])]
+
+        with tempfile.TemporaryDirectory(prefix="pdf2md_ocr_") as temp:
+            temp = Path(temp)
+            caminhos = []
+            for indice, renderizada in enumerate(renderizadas):
+                caminho = temp / f"{indice:05d}.pnm"
+                imagem = _imagem_pil(renderizada)
+                imagem.save(caminho, format="PPM")
+                del imagem
+                caminhos.append(str(caminho))
+
+            lista = temp / "lista.txt"
+            lista.write_text("\n".join(caminhos) + "\n", encoding="utf-8")
+
+            self.pytesseract.pytesseract.run_tesseract(
+                str(lista), str(temp / "saida"), extension="txt",
+                lang=self._mapear_idioma(),
+            )
+            saida = (temp / "saida.txt").read_text(encoding="utf-8")
+
+        textos = saida.split("\f")
+        if len(textos) < len(renderizadas):
+            logger.warning(
+                f"Tesseract devolveu {len(textos)} página(s) para um lote de "
+                f"{len(renderizadas)}; reconhecendo página a página"
+            )
+            return [self.reconhecer_imagem(r) for r in renderizadas]
+
+        return textos[:len(renderizadas)]
+
+    def antecipar(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina] = None
+    ) -> None:
+        """
+        Renderiza a página e a envia ao motor sem esperar o resultado.
+
+        Com ``tamanho_lote`` > 1, a página entra no lote em formação, que é
+        reconhecido (pelo motor, se houver) quando fica completo ou quando
+        uma página dele é pedida. O texto é recolhido depois por
+        ``processar_pagina_ocr``. Sem motor e sem lotes, não faz nada.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada
+        """
+        if (self.motor is None and self.tamanho_lote == 1) or not self.ocr_disponivel:
+            return
+
         try:
-            pagina = self.documento[numero_pagina]
+            pagina, imagens = self._carregar_pagina(numero_pagina, contexto)
+            zoom = self._zoom_pagina(pagina, imagens)
+            # Páginas em faixas são reconhecidas em processar_pagina_ocr,
+            # sem ocupar a fila com a página inteira
+            if self._planejar_faixas(pagina, zoom) is not None:
+                return
+            renderizada = self._renderizar(
+                pagina, zoom, None, copiar=self.motor is not None
+            )
+        except Exception as e:
+            logger.error(f"Erro ao renderizar a página {numero_pagina} para OCR: {e}")
+            return
 
-            # Renderizar página como imagem
-            pix = pagina.get_pixmap(matrix=fitz.Matrix(2, 2))
-            img_data = pix.tobytes("png")
+        enviar = self._enviar_ao_lote if self.tamanho_lote > 1 else None
+        self._antecipadas[numero_pagina] = self._enviar(renderizada, enviar)
 
-            # Converter para PIL Image
-            imagem = Image.open(BytesIO(img_data))
+    def _enviar_ao_lote(self, renderizada: dict) -> Future:
+        """
+        Acrescenta uma página ao lote em formação.
 
-            # Executar OCR
-            texto = self.pytesseract.image_to_string(imagem, lang=self._mapear_idioma())
+        Args:
+            renderizada: Página renderizada
+
+        Returns:
+            Future com o texto, resolvido quando o lote for reconhecido
+        """
+        futuro = Future()
+        self._lote.append((renderizada, futuro))
+        if len(self._lote) >= self.tamanho_lote:
+            self._descarregar_lote()
+        return futuro
+
+    def _descarregar_lote(self) -> None:
+        """Reconhece o lote em formação (no motor, se houver)."""
+        lote, self._lote = self._lote, []
+        if not lote:
+            return
+
+        renderizadas = [renderizada for renderizada, _ in lote]
+        futuros = [futuro for _, futuro in lote]
+        self._contadores["lotes_ocr"] = self._contadores.get("lotes_ocr", 0) + 1
+
+        if self.motor is not None:
+            self.motor.enviar_lote(renderizadas).add_done_callback(
+                lambda futuro_lote: _distribuir_lote(futuro_lote, futuros)
+            )
+            return
+
+        resultado = Future()
+        try:
+            resultado.set_result(self.reconhecer_lote(renderizadas))
+        except Exception as e:
+            resultado.set_exception(e)
+        _distribuir_lote(resultado, futuros)
+
+    def _enviar(self, renderizada: dict, enviar=None) -> tuple:
+        """
+        Envia uma página renderizada ao motor, salvo se já estiver no cache.
+
+        Args:
+            renderizada: Página renderizada com as amostras em bytes
+            enviar: Função que recebe a página e devolve um Future com o
+                texto (padrão: ``self.motor.enviar``)
+
+        Returns:
+            Tupla (Future com o texto, chave do cache, acerto do cache)
+        """
+        chave = None
+        if self.cache is not None:
+            chave = self.cache.calcular_chave(renderizada, self._mapear_idioma())
+            texto = self.cache.buscar(chave)
+            if texto is not None:
+                futuro = Future()
+                futuro.set_result(texto)
+                return futuro, chave, True
+
+        if enviar is None:
+            enviar = self.motor.enviar
+        return enviar(renderizada), chave, False
+
+    def _recolher(self, enviada: tuple) -> str:
+        """
+        Aguarda o texto de uma página enviada por ``_enviar``.
+
+        Args:
+            enviada: Tupla devolvida por ``_enviar``
+
+        Returns:
+            Texto reconhecido
+        """
+        futuro, chave, acerto = enviada
+        if not futuro.done() and self._lote:
+            # A página pode estar no lote ainda incompleto
+            self._descarregar_lote()
+        texto = futuro.result()
+        if chave is not None:
+            self._registrar_cache(chave, texto, acerto)
+        return texto
+
+    def processar_pagina_ocr(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina] = None
+    ) -> str:
+        """
+        Processa OCR em uma página específica.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada
+
+        Returns:
+            Texto extraído via OCR
+        """
+        if not self.ocr_disponivel:
+            logger.warning("OCR não disponível")
+            return ""
+
+        try:
+            antecipada = self._antecipadas.pop(numero_pagina, None)
+            if antecipada is not None:
+                texto = self._recolher(antecipada)
+            else:
+                texto = self._reconhecer_pagina(numero_pagina, contexto)
 
             if self.verbose:
                 logger.info(f"Página {numero_pagina + 1}: OCR processado")
@@ -77,6 +938,138 @@ class ProcessadorOCR:
             logger.error(f"Erro ao processar OCR na página {numero_pagina}: {e}")
             return ""
 
+    def _reconhecer_pagina(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina]
+    ) -> str:
+        """Renderiza e reconhece a página, inteira ou em faixas."""
+        pagina, imagens = self._carregar_pagina(numero_pagina, contexto)
+        zoom = self._zoom_pagina(pagina, imagens)
+
+        plano = self._planejar_faixas(pagina, zoom)
+        if plano is not None:
+            return self._reconhecer_faixas(pagina, *plano)
+
+        return self._reconhecer_com_cache(self._renderizar(pagina, zoom, None, False))
+
+    def processar_regioes_ocr(
+        self,
+        numero_pagina: int,
+        contexto: ContextoPagina,
+        blocos: list,
+    ) -> list:
+        """
+        Reconhece apenas as regiões de imagem de uma página com texto nativo.
+
+        Cada região (ver ``localizar_regioes_ocr``) é renderizada com um
+        recorte e reconhecida à parte; com motor, as regiões da página são
+        reconhecidas em paralelo.
+
+        Args:
+            numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página
+            blocos: Blocos de texto nativo da página
+
+        Returns:
+            Blocos no formato de ExtratorTexto.extrair_blocos_estruturados,
+            com 'ocr' = True, um por região com texto reconhecido
+        """
+        if not self.ocr_disponivel:
+            return []
+
+        regioes = localizar_regioes_ocr(contexto, blocos)
+        if not regioes:
+            return []
+
+        try:
+            if self.motor is None:
+                textos = [
+                    self._reconhecer_com_cache(
+                        self.renderizar_regiao(numero_pagina, retangulo, dpi, contexto)
+                    )
+                    for retangulo, dpi in regioes
+                ]
+            else:
+                enviadas = [
+                    self._enviar(
+                        self.renderizar_regiao(
+                            numero_pagina, retangulo, dpi, contexto, copiar=True
+                        )
+                    )
+                    for retangulo, dpi in regioes
+                ]
+                textos = [self._recolher(enviada) for enviada in enviadas]
+        except Exception as e:
+            logger.error(
+                f"Erro ao processar OCR nas regiões da página {numero_pagina}: {e}"
+            )
+            return []
+
+        total = self._contadores.get("regioes_ocr", 0)
+        self._contadores["regioes_ocr"] = total + len(regioes)
+
+        if self.verbose:
+            logger.info(
+                f"Página {numero_pagina + 1}: OCR em {len(regioes)} região(ões)"
+            )
+
+        return [
+            {
+                "x0": retangulo.x0,
+                "y0": retangulo.y0,
+                "x1": retangulo.x1,
+                "y1": retangulo.y1,
+                "texto": texto.strip(),
+                "largura": retangulo.width,
+                "altura": retangulo.height,
+                "ocr": True,
+            }
+            for (retangulo, _), texto in zip(regioes, textos)
+            if texto and texto.strip()
+        ]
+
+    def _reconhecer_com_cache(self, renderizada: dict) -> str:
+        """
+        Reconhece uma página renderizada, consultando o cache antes.
+
+        Args:
+            renderizada: Página renderizada (ver ``renderizar_pagina``)
+
+        Returns:
+            Texto reconhecido
+        """
+        if self.cache is None:
+            return self.reconhecer_imagem(renderizada)
+
+        chave = self.cache.calcular_chave(renderizada, self._mapear_idioma())
+        texto = self.cache.buscar(chave)
+        acerto = texto is not None
+        if not acerto:
+            texto = self.reconhecer_imagem(renderizada)
+
+        self._registrar_cache(chave, texto, acerto)
+        return texto
+
+    def _registrar_cache(self, chave: str, texto: str, acerto: bool) -> None:
+        """Conta o acesso ao cache e grava o texto novo em caso de falha."""
+        contador = "ocr_cache_acertos" if acerto else "ocr_cache_falhas"
+        self._contadores[contador] = self._contadores.get(contador, 0) + 1
+
+        if not acerto:
+            self.cache.guardar(chave, texto)
+
+    def coletar_contadores(self) -> dict:
+        """
+        Retorna e zera os contadores do cache de OCR e do pré-processamento.
+
+        Returns:
+            Dicionário com 'ocr_cache_acertos', 'ocr_cache_falhas',
+            'regioes_ocr', 'paginas_em_faixas', 'faixas_ocr', 'lotes_ocr' e
+            'ocr_preprocessamento' (páginas, segundos por etapa e pixels
+            antes e depois), conforme o que ocorreu
+        """
+        contadores, self._contadores = self._contadores, {}
+        return contadores
+
     def _mapear_idioma(self) -> str:
         """Mapeia código de idioma para código do Tesseract."""
         mapeamento = {"por": "por", "eng": "eng", "spa": "spa", "fra": "fra"}
@@ -97,3 +1090,48 @@ class ProcessadorOCR:
                 texto_completo.append(texto)
 
         return "\n\n".join(texto_completo)
+
+
+def _distribuir_lote(futuro_lote: Future, futuros: list) -> None:
+    """
+    Repassa os textos de um lote (ou o seu erro) aos Futures das páginas.
+
+    Args:
+        futuro_lote: Future com a lista de textos do lote
+        futuros: Future de cada página, na ordem do lote
+    """
+    erro = futuro_lote.exception()
+    if erro is not None:
+        for futuro in futuros:
+            futuro.set_exception(erro)
+        return
+
+    for futuro, texto in zip(futuros, futuro_lote.result()):
+        futuro.set_result(texto)
+
+
+def _imagem_pil(renderizada: dict) -> Image.Image:
+    """
+    Monta uma imagem PIL sobre as amostras de uma página renderizada.
+
+    A imagem é marcada como PPM: sem formato, o pytesseract a gravaria em
+    PNG (com compressão) no arquivo temporário entregue ao Tesseract.
+
+    Args:
+        renderizada: Página renderizada (ver ProcessadorOCR.renderizar_pagina)
+
+    Returns:
+        Imagem que compartilha o buffer das amostras
+    """
+    modo = renderizada["modo"]
+    imagem = Image.frombuffer(
+        modo,
+        (renderizada["largura"], renderizada["altura"]),
+        renderizada["amostras"],
+        "raw",
+        modo,
+        renderizada["stride"],
+        1,
+    )
+    imagem.format = "PPM"
+    return imagem
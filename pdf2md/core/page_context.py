@@ -0,0 +1,90 @@
+"""
+Contexto de página compartilhado entre os extratores.
+"""
+
+import fitz
+
+
+class ContextoPagina:
+    """
+    Carrega uma página do PDF uma única vez e compartilha os dados
+    derivados dela (TextPage, desenhos e imagens) entre os extratores.
+
+    Os dados são obtidos sob demanda e guardados na primeira leitura,
+    de modo que cada um deles é analisado no máximo uma vez por página.
+    """
+
+    def __init__(self, documento: fitz.Document, numero_pagina: int):
+        """
+        Inicializa o contexto.
+
+        Args:
+            documento: Documento PDF aberto com fitz
+            numero_pagina: Número da página (0-indexed)
+        """
+        self.documento = documento
+        self.numero_pagina = numero_pagina
+        self.pagina = documento[numero_pagina]
+
+        self._textpage = None
+        self._desenhos = None
+        self._imagens = None
+        self._info_imagens = None
+
+    @property
+    def textpage(self) -> fitz.TextPage:
+        """
+        TextPage única da página, criada na primeira leitura.
+
+        Usa as mesmas flags de ``get_text("blocks")`` (iguais às de
+        "text"), para que o texto seja o mesmo da extração sem contexto.
+        """
+        if self._textpage is None:
+            self._textpage = self.pagina.get_textpage(flags=fitz.TEXTFLAGS_BLOCKS)
+        return self._textpage
+
+    @property
+    def desenhos(self) -> list:
+        """Desenhos vetoriais da página (``get_drawings``)."""
+        if self._desenhos is None:
+            self._desenhos = self.pagina.get_drawings()
+        return self._desenhos
+
+    @property
+    def imagens(self) -> list:
+        """Imagens referenciadas pela página (``get_images``)."""
+        if self._imagens is None:
+            self._imagens = self.pagina.get_images()
+        return self._imagens
+
+    @property
+    def info_imagens(self) -> list:
+        """Posição de cada ocorrência das imagens da página (``get_image_info``)."""
+        if self._info_imagens is None:
+            self._info_imagens = self.pagina.get_image_info()
+        return self._info_imagens
+
+    def obter_texto(self, opcao: str = "text"):
+        """
+        Extrai texto da página reutilizando a TextPage compartilhada.
+
+        Args:
+            opcao: Formato aceito por ``fitz.Page.get_text`` ("text", "blocks"...)
+
+        Returns:
+            Resultado de ``get_text`` no formato pedido
+        """
+        return self.pagina.get_text(opcao, textpage=self.textpage)
+
+    def liberar(self) -> None:
+        """Libera a TextPage e os dados em cache da página."""
+        self._textpage = None
+        self._desenhos = None
+        self._imagens = None
+        self._info_imagens = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.liberar()
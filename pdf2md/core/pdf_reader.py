@@ -6,6 +6,9 @@ from pathlib import Path
 
 import fitz  # PyMuPDF
 
+from pdf2md.core.ocr_processor import diagnosticar_pagina
+from pdf2md.core.page_context import ContextoPagina
+
 
 class LeitorPDF:
     """Classe para leitura e extração de informações de PDFs."""
@@ -43,6 +46,34 @@ class LeitorPDF:
             "criptografado": self.documento.is_pdf and self.documento.is_encrypted,
         }
 
+    def estimar_necessidade_ocr(self, amostra: int = 10) -> float:
+        """
+        Estima a fração de páginas que o modo OCR automático enviaria ao OCR.
+
+        Analisa até ``amostra`` páginas distribuídas pelo documento com o
+        mesmo critério usado na conversão (ver ``diagnosticar_pagina``).
+
+        Args:
+            amostra: Número máximo de páginas analisadas
+
+        Returns:
+            Fração entre 0 e 1
+        """
+        total = self.documento.page_count
+        if total == 0:
+            return 0.0
+
+        passo = max(1, total // max(1, amostra))
+        paginas = range(0, total, passo)[:amostra]
+
+        escaneadas = 0
+        for numero_pagina in paginas:
+            with ContextoPagina(self.documento, numero_pagina) as contexto:
+                if diagnosticar_pagina(contexto)["ocr"]:
+                    escaneadas += 1
+
+        return escaneadas / len(paginas)
+
     def fechar(self):
         """Fecha o documento PDF."""
         if self.documento:
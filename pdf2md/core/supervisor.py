@@ -0,0 +1,252 @@
+"""
+Supervisão de conversões em processos filhos (tempo limite, memória e falhas).
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+
+def obter_rss(pid: int) -> Optional[int]:
+    """
+    Lê a memória residente (RSS) de um processo, em bytes.
+
+    Usa ``/proc/<pid>/statm``; em sistemas sem /proc retorna None e o
+    limite de memória não é aplicado.
+
+    Args:
+        pid: Identificador do processo
+
+    Returns:
+        RSS em bytes ou None se não for possível medir
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _executar_worker(conexao, diretorio_saida: Path, opcoes: Dict) -> None:
+    """
+    Laço de um processo worker: recebe PDFs e devolve os resultados.
+
+    Args:
+        conexao: Extremidade do Pipe ligada ao supervisor
+        diretorio_saida: Diretório de saída do lote
+        opcoes: Opções repassadas ao PDFConverter
+    """
+    # Importado aqui para evitar import circular com batch_converter
+    from pdf2md.core.batch_converter import _converter_pdf
+
+    while True:
+        try:
+            tarefa = conexao.recv()
+        except EOFError:
+            break
+
+        if tarefa is None:
+            break
+
+        indice, pdf, anterior = tarefa
+        conexao.send((indice, _converter_pdf(pdf, diretorio_saida, opcoes, anterior)))
+
+
+class _Worker:
+    """Processo worker e a tarefa que ele está executando."""
+
+    def __init__(self, contexto, diretorio_saida: Path, opcoes: Dict):
+        self.conexao, conexao_filho = contexto.Pipe()
+        self.processo = contexto.Process(
+            target=_executar_worker,
+            args=(conexao_filho, diretorio_saida, opcoes),
+            daemon=True,
+        )
+        self.processo.start()
+        conexao_filho.close()
+
+        self.tarefa = None
+        self.inicio = 0.0
+
+    def enviar(self, tarefa: Tuple) -> None:
+        self.tarefa = tarefa
+        self.inicio = time.monotonic()
+        self.conexao.send(tarefa)
+
+    def encerrar(self, forcar: bool = False) -> None:
+        if forcar:
+            self.processo.kill()
+        else:
+            try:
+                self.conexao.send(None)
+            except (OSError, ValueError):
+                self.processo.kill()
+        self.processo.join(timeout=5)
+        if self.processo.is_alive():
+            self.processo.kill()
+            self.processo.join()
+        self.conexao.close()
+
+
+class SupervisorConversao:
+    """
+    Converte PDFs em processos filhos supervisionados.
+
+    Cada worker é um processo de longa duração que converte um PDF por
+    vez, então PDFs saudáveis não pagam o custo de criar um processo.
+    O supervisor acompanha o tempo e a memória (RSS) de cada conversão:
+    se um limite for excedido, ou se o processo morrer, o worker é
+    encerrado, o PDF é registrado como falha com o motivo e marcado para
+    quarentena, e um novo worker assume as tarefas seguintes.
+    """
+
+    def __init__(
+        self,
+        diretorio_saida: Path,
+        opcoes: Dict,
+        max_workers: int = 1,
+        tempo_limite: Optional[float] = None,
+        limite_memoria: Optional[int] = None,
+        intervalo: float = 0.25,
+    ):
+        """
+        Inicializa o supervisor.
+
+        Args:
+            diretorio_saida: Diretório de saída do lote
+            opcoes: Opções repassadas ao PDFConverter
+            max_workers: Número de processos worker
+            tempo_limite: Tempo máximo por PDF, em segundos (None = sem limite)
+            limite_memoria: RSS máximo por worker, em bytes (None = sem limite)
+            intervalo: Intervalo entre verificações dos limites, em segundos
+        """
+        self.diretorio_saida = Path(diretorio_saida)
+        self.opcoes = opcoes
+        self.max_workers = max(1, int(max_workers))
+        self.tempo_limite = tempo_limite
+        self.limite_memoria = limite_memoria
+        self.intervalo = intervalo
+        self._contexto = multiprocessing.get_context()
+
+    def _novo_worker(self) -> _Worker:
+        return _Worker(self._contexto, self.diretorio_saida, self.opcoes)
+
+    def executar(
+        self, tarefas: List[Tuple[int, Path, Optional[Dict]]]
+    ) -> Iterator[Tuple[int, Dict]]:
+        """
+        Executa as tarefas, na ordem dada, e devolve os resultados à medida
+        que terminam.
+
+        Args:
+            tarefas: Lista de (índice, caminho do PDF, registro anterior)
+
+        Yields:
+            Tuplas (índice, resultado)
+        """
+        fila = list(reversed(tarefas))
+        workers = [
+            self._novo_worker() for _ in range(min(self.max_workers, len(tarefas)))
+        ]
+
+        try:
+            while True:
+                # Distribuir tarefas para os workers ociosos
+                for worker in workers:
+                    if worker.tarefa is None and fila:
+                        worker.enviar(fila.pop())
+
+                ocupados = [w for w in workers if w.tarefa is not None]
+                if not ocupados:
+                    break
+
+                prontos = wait(
+                    [w.conexao for w in ocupados] + [w.processo.sentinel for w in ocupados],
+                    timeout=self.intervalo,
+                )
+
+                for i, worker in enumerate(workers):
+                    if worker.tarefa is None:
+                        continue
+
+                    if worker.conexao in prontos:
+                        try:
+                            resultado = worker.conexao.recv()
+                        except (EOFError, OSError):
+                            resultado = None
+
+                        if resultado is not None:
+                            worker.tarefa = None
+                            yield resultado
+
+                            if self._memoria_alta(worker):
+                                # Reciclar antes que a memória acumulada
+                                # seja atribuída ao próximo PDF
+                                worker.encerrar()
+                                workers[i] = self._novo_worker()
+                            continue
+
+                    motivo = self._verificar_limites(worker)
+                    if motivo is None:
+                        continue
+
+                    indice, pdf, _ = worker.tarefa
+                    logger.error(f"✗ {pdf.name}: {motivo}; processo encerrado")
+                    worker.encerrar(forcar=True)
+                    workers[i] = self._novo_worker()
+
+                    yield indice, {
+                        'pdf': pdf.name,
+                        'status': 'falha',
+                        'erro': motivo,
+                        'entrada': None,
+                        'quarentena': True
+                    }
+
+        finally:
+            for worker in workers:
+                worker.encerrar(forcar=worker.tarefa is not None)
+
+    def _verificar_limites(self, worker: _Worker) -> Optional[str]:
+        """
+        Verifica se o worker morreu ou excedeu algum limite.
+
+        Returns:
+            Motivo da falha ou None se o worker está saudável
+        """
+        if not worker.processo.is_alive():
+            return (
+                "processo de conversão encerrado inesperadamente "
+                f"(código {worker.processo.exitcode})"
+            )
+
+        if (
+            self.tempo_limite is not None
+            and time.monotonic() - worker.inicio > self.tempo_limite
+        ):
+            return f"tempo limite de {self.tempo_limite:g}s excedido"
+
+        if self.limite_memoria is not None:
+            rss = obter_rss(worker.processo.pid)
+            if rss is not None and rss > self.limite_memoria:
+                return (
+                    f"limite de memória de {self.limite_memoria // (1024 * 1024)} MB "
+                    "excedido"
+                )
+
+        return None
+
+    def _memoria_alta(self, worker: _Worker) -> bool:
+        """Indica se um worker ocioso já usa mais da metade do limite de memória."""
+        if self.limite_memoria is None:
+            return False
+        rss = obter_rss(worker.processo.pid)
+        return rss is not None and rss > self.limite_memoria / 2
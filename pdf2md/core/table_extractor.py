@@ -2,44 +2,94 @@
 Extrator de tabelas de PDFs.
 """
 
-from typing import Dict, List
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
 
 import fitz
 
+from pdf2md.core.page_context import ContextoPagina
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
+# Tolerâncias do ``find_tables`` (pt): segmentos com as pontas a até 3 pt
+# de distância no outro eixo contam como horizontais/verticais, e
+# segmentos alinhados a até 3 pt um do outro são emendados
+TOLERANCIA_ALINHAMENTO = 3
+TOLERANCIA_GRADE = TOLERANCIA_ALINHAMENTO + 3
+
+# Cruzamentos necessários para formar ao menos uma célula
+CRUZAMENTOS_MINIMOS = 4
+
 
 class ExtratorTabelas:
     """Extrai tabelas de PDFs com alta precisão."""
 
-    def __init__(self, documento: fitz.Document, verbose: bool = False):
+    def __init__(
+        self, documento: fitz.Document, verbose: bool = False, prefiltrar: bool = True
+    ):
         """
         Inicializa o extrator de tabelas.
 
         Args:
             documento: Documento PDF aberto com fitz
             verbose: Modo verbose
+            prefiltrar: Só rodar ``find_tables`` nas páginas cujos desenhos
+                formam uma grade (linhas horizontais e verticais que se
+                cruzam); sem a análise de layout do PyMuPDF, a detecção por
+                linhas não encontra tabelas nas demais
         """
         self.documento = documento
         self.verbose = verbose
+        self.prefiltrar = prefiltrar
+
+        # Páginas e tempos do pré-filtro (ver coletar_contadores)
+        self._contadores = {}
+        self._amostrada = False
 
-    def detectar_tabelas_pagina(self, numero_pagina: int) -> List:
+    def detectar_tabelas_pagina(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina] = None
+    ) -> List:
         """
         Detecta tabelas em uma página.
 
         Args:
             numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada (reutiliza os desenhos)
 
         Returns:
             Lista de tabelas detectadas
         """
         try:
-            pagina = self.documento[numero_pagina]
+            if contexto is not None:
+                pagina = contexto.pagina
+                desenhos = contexto.desenhos
+            else:
+                pagina = self.documento[numero_pagina]
+                desenhos = pagina.get_drawings()
+
+            amostra = False
+            if self.prefiltrar and not _analise_de_layout_ativa():
+                inicio = time.perf_counter()
+                candidata = _tem_grade(desenhos)
+                self._somar("tempo_prefiltro_tabelas", time.perf_counter() - inicio)
+                # A primeira página descartada passa pela detecção mesmo
+                # assim, para medir quanto o pré-filtro economiza
+                amostra = not candidata and not self._amostrada
+                if not candidata and not amostra:
+                    self._somar("paginas_sem_tabelas", 1)
+                    return []
 
             # Usar a detecção nativa do PyMuPDF
-            tabelas_finder = pagina.find_tables()  # ✅ Retorna TableFinder
+            inicio = time.perf_counter()
+            tabelas_finder = pagina.find_tables(paths=desenhos)  # ✅ Retorna TableFinder
+            self._somar("paginas_analisadas_tabelas", 1)
+            if amostra:
+                self._amostrada = True
+                self._somar("tempo_amostra_tabelas", time.perf_counter() - inicio)
+                self._somar("paginas_amostra_tabelas", 1)
 
             # ✅ CORREÇÃO: Converter para lista
             tabelas = list(tabelas_finder.tables) if tabelas_finder else []
@@ -55,6 +105,23 @@ class ExtratorTabelas:
             logger.error(f"Erro ao detectar tabelas: {e}")
             return []
 
+    def _somar(self, chave: str, valor: float) -> None:
+        """Soma um valor a um contador do pré-filtro."""
+        self._contadores[chave] = self._contadores.get(chave, 0) + valor
+
+    def coletar_contadores(self) -> dict:
+        """
+        Retorna e zera os contadores desde a última coleta.
+
+        Returns:
+            Dicionário com 'paginas_sem_tabelas' (ignoradas pelo
+            pré-filtro), 'paginas_analisadas_tabelas', os segundos gastos
+            no pré-filtro e, na página descartada que serviu de amostra,
+            os segundos do ``find_tables`` ('tempo_amostra_tabelas')
+        """
+        contadores, self._contadores = self._contadores, {}
+        return contadores
+
     def extrair_tabela_para_markdown(self, tabela) -> str:
         """
         Converte uma tabela para formato Markdown.
@@ -121,3 +188,69 @@ class ExtratorTabelas:
                     tabelas_por_pagina[numero_pagina] = tabelas_markdown
 
         return tabelas_por_pagina
+
+
+def _analise_de_layout_ativa() -> bool:
+    """
+    Indica se o PyMuPDF usa a análise de layout (pacote pymupdf.layout).
+
+    Com ela, ``find_tables`` também encontra tabelas sem linhas, e o
+    pré-filtro por grade deixaria de ser exato.
+    """
+    return getattr(sys.modules.get("pymupdf"), "_get_layout", None) is not None
+
+
+def _tem_grade(desenhos: list) -> bool:
+    """
+    Verifica se os desenhos de uma página podem formar uma tabela.
+
+    A estratégia padrão do ``find_tables`` ("lines") monta as células a
+    partir dos segmentos horizontais e verticais dos caminhos (linhas,
+    retângulos e quadriláteros). Uma célula exige ao menos quatro
+    cruzamentos entre eles; réguas de cabeçalho, sublinhados e páginas
+    sem desenhos não chegam a isso.
+
+    Args:
+        desenhos: Resultado de ``Page.get_drawings``
+
+    Returns:
+        True se houver cruzamentos suficientes para uma célula
+    """
+    horizontais = []
+    verticais = []
+    for caminho in desenhos:
+        itens = caminho["items"]
+        segmentos = []
+        for item in itens:
+            if item[0] == "l":
+                segmentos.append((item[1], item[2]))
+            elif item[0] in ("re", "qu"):
+                quad = item[1].quad if item[0] == "re" else item[1]
+                segmentos += [
+                    (quad.ul, quad.ur), (quad.ll, quad.lr),
+                    (quad.ul, quad.ll), (quad.ur, quad.lr),
+                ]
+        if caminho.get("closePath") and itens and itens[0][0] == itens[-1][0] == "l":
+            segmentos.append((itens[-1][2], itens[0][1]))
+
+        for p1, p2 in segmentos:
+            if abs(p1.y - p2.y) <= TOLERANCIA_ALINHAMENTO:
+                horizontais.append((min(p1.x, p2.x), max(p1.x, p2.x), p1.y))
+            elif abs(p1.x - p2.x) <= TOLERANCIA_ALINHAMENTO:
+                verticais.append((p1.x, min(p1.y, p2.y), max(p1.y, p2.y)))
+
+    if len(horizontais) < 2 or len(verticais) < 2:
+        return False
+
+    verticais.sort()
+    posicoes = [x for x, _, _ in verticais]
+    cruzamentos = 0
+    for x0, x1, y in horizontais:
+        inicio = bisect_left(posicoes, x0 - TOLERANCIA_GRADE)
+        fim = bisect_right(posicoes, x1 + TOLERANCIA_GRADE)
+        for _, y0, y1 in verticais[inicio:fim]:
+            if y0 - TOLERANCIA_GRADE <= y <= y1 + TOLERANCIA_GRADE:
+                cruzamentos += 1
+                if cruzamentos >= CRUZAMENTOS_MINIMOS:
+                    return True
+    return False
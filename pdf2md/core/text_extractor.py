@@ -3,15 +3,54 @@ Extrator de texto de PDFs com preservação de estrutura.
 """
 
 from pathlib import Path
+from typing import Optional
 
 import fitz  # PyMuPDF
 import re
 
+from pdf2md.core.page_context import ContextoPagina
 from pdf2md.utils.logger import obter_logger
 
 logger = obter_logger(__name__)
 
 
+def mesclar_em_ordem_leitura(blocos: list, inseridos: list) -> list:
+    """
+    Insere blocos novos (por exemplo, de OCR) na ordem de leitura dos
+    blocos de texto nativo.
+
+    Cada bloco novo entra antes do primeiro bloco da mesma coluna (que se
+    sobrepõe a ele na horizontal) que começa abaixo dele; sem esse bloco,
+    entra depois do último da coluna. Sem blocos na mesma coluna, vale a
+    posição vertical na página.
+
+    Args:
+        blocos: Blocos na ordem de leitura (ver extrair_blocos_estruturados)
+        inseridos: Blocos a inserir, no mesmo formato
+
+    Returns:
+        Nova lista com todos os blocos
+    """
+    resultado = list(blocos)
+
+    for novo in sorted(inseridos, key=lambda b: (b["y0"], b["x0"])):
+        mesma_coluna = [
+            i for i, bloco in enumerate(resultado)
+            if min(bloco["x1"], novo["x1"]) > max(bloco["x0"], novo["x0"])
+        ]
+        candidatos = mesma_coluna or range(len(resultado))
+
+        posicao = next(
+            (i for i in candidatos if resultado[i]["y0"] >= novo["y0"]), None
+        )
+        if posicao is None:
+            posicao = mesma_coluna[-1] + 1 if mesma_coluna else len(resultado)
+
+        resultado.insert(posicao, novo)
+
+    return resultado
+
+
 class ExtratorTexto:  # ✅ CORRIGIDO: Era "Extratortexto"
     """Extrai texto de PDFs preservando estrutura e formatação."""
 
@@ -46,15 +85,16 @@ class ExtratorTexto:  # ✅ CORRIGIDO: Era "Extratortexto"
                     f"Página {numero_pagina + 1}: {len(texto)} caracteres extraídos"
                 )
 
-            texto = leitor_pdf.extrair_texto(pagina)
-            texto = normalizar_texto(texto)
+            texto = self.normalizar_texto(texto)
             return texto
 
         except Exception as e:
             logger.error(f"Erro ao extrair texto da página {numero_pagina}: {e}")
             return ""
 
+    @staticmethod
     def limpar_linhas_vazias(texto_bruto: str) -> str:
+        """Remove linhas vazias no início e as repetidas em sequência."""
         linhas = texto_bruto.split("\n")
         linhas_limpa = []
         for linha in linhas:
@@ -65,7 +105,9 @@ class ExtratorTexto:  # ✅ CORRIGIDO: Era "Extratortexto"
             linhas_limpa.append(linha)
         return "\n".join(linhas_limpa)
 
+    @staticmethod
     def normalizar_texto(texto: str) -> str:
+        """Remove espaços repetidos e linhas vazias, só de símbolos ou muito curtas."""
         # Remove múltiplas quebras de linha
         texto = re.sub(r"\n\s*\n\s*\n+", "\n\n", texto)
 
@@ -84,19 +126,25 @@ class ExtratorTexto:  # ✅ CORRIGIDO: Era "Extratortexto"
 
         return "\n".join(linhas)
 
-    def extrair_blocos_estruturados(self, numero_pagina: int) -> list:
+    def extrair_blocos_estruturados(
+        self, numero_pagina: int, contexto: Optional[ContextoPagina] = None
+    ) -> list:
         """
         Extrai blocos de texto estruturados (com posição e tipo).
 
         Args:
             numero_pagina: Número da página (0-indexed)
+            contexto: Contexto da página já carregada (reutiliza a TextPage)
 
         Returns:
             Lista de blocos com informações de posição e tipo
         """
         try:
-            pagina = self.documento[numero_pagina]
-            blocos = pagina.get_text("blocks")
+            if contexto is not None:
+                blocos = contexto.obter_texto("blocks")
+            else:
+                pagina = self.documento[numero_pagina]
+                blocos = pagina.get_text("blocks")
 
             blocos_processados = []
 
@@ -2,7 +2,7 @@
 Formatador de Markdown - converte elementos extraídos para Markdown.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, TextIO
 
 from pdf2md.utils.logger import obter_logger
 
@@ -12,17 +12,27 @@ logger = obter_logger(__name__)
 class FormataadorMarkdown:
     """Formata elementos extraídos em Markdown bem estruturado."""
 
-    def __init__(self, titulo: str = "", verbose: bool = False):
+    def __init__(
+        self,
+        titulo: str = "",
+        verbose: bool = False,
+        destino: Optional[TextIO] = None,
+    ):
         """
         Inicializa o formatador.
 
         Args:
             titulo: Título do documento
             verbose: Modo verbose
+            destino: Arquivo (ou qualquer objeto com write) para o modo
+                streaming. Quando informado, ``descarregar()`` escreve os
+                fragmentos acumulados nele e libera a memória.
         """
         self.titulo = titulo
         self.verbose = verbose
+        self.destino = destino
         self.conteudo = []
+        self.caracteres_escritos = 0
 
     def adicionar_titulo(self, texto: str, nivel: int = 1) -> None:
         """
@@ -198,6 +208,8 @@ class FormataadorMarkdown:
         """
         Obtém o conteúdo completo formatado.
 
+        No modo streaming, retorna apenas o que ainda não foi descarregado.
+
         Returns:
             String com todo o conteúdo em Markdown
         """
@@ -207,6 +219,24 @@ class FormataadorMarkdown:
         """Limpa o conteúdo acumulado."""
         self.conteudo = []
 
+    def descarregar(self) -> None:
+        """
+        Escreve o conteúdo acumulado no destino (modo streaming).
+
+        O destino é descarregado (flush) a cada chamada, para que leitores
+        possam acompanhar o arquivo enquanto a conversão ainda está em
+        andamento. Sem destino configurado, não faz nada.
+        """
+        if self.destino is None or not self.conteudo:
+            return
+
+        trecho = "".join(self.conteudo)
+        self.destino.write(trecho)
+        self.destino.flush()
+
+        self.caracteres_escritos += len(trecho)
+        self.conteudo = []
+
     def _sanitizar_texto(self, texto: str) -> str:
         """
         Sanitiza o texto removendo caracteres problemáticos.
@@ -238,7 +268,7 @@ class FormataadorMarkdown:
         conteudo_completo = self.obter_conteudo()
 
         return {
-            "total_caracteres": len(conteudo_completo),
+            "total_caracteres": self.caracteres_escritos + len(conteudo_completo),
             "total_linhas": len(conteudo_completo.split("\n")),
             "total_palavras": len(conteudo_completo.split()),
             "total_elementos": len(self.conteudo),
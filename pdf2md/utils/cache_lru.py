@@ -0,0 +1,188 @@
+"""
+Cache em disco com limite de tamanho e descarte LRU.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from pdf2md.utils.logger import obter_logger
+
+logger = obter_logger(__name__)
+
+
+class CacheDiscoLRU:
+    """
+    Armazena entradas (arquivos ou diretórios) endereçadas por chave.
+
+    Cada entrada fica em ``<raiz>/<chave[:2]>/<chave>``. O horário de
+    modificação da entrada marca o último acesso: ao ultrapassar o tamanho
+    máximo, as entradas usadas há mais tempo são removidas primeiro.
+    As gravações são atômicas (diretório temporário + rename), então
+    vários processos podem compartilhar o mesmo cache.
+    """
+
+    # Ao descartar, reduz o cache até esta fração do limite
+    FRACAO_APOS_DESCARTE = 0.9
+
+    def __init__(self, diretorio: Path, tamanho_maximo: int):
+        """
+        Inicializa o cache.
+
+        Args:
+            diretorio: Diretório raiz do cache
+            tamanho_maximo: Tamanho máximo em bytes
+        """
+        self.diretorio = Path(diretorio)
+        self.tamanho_maximo = tamanho_maximo
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+        # Calculado na primeira gravação e atualizado a cada nova entrada
+        self._tamanho_atual = None
+
+    def _caminho_entrada(self, chave: str) -> Path:
+        """Retorna o caminho da entrada de uma chave."""
+        return self.diretorio / chave[:2] / chave
+
+    def obter(self, chave: str) -> Optional[Path]:
+        """
+        Busca uma entrada e marca o acesso para a política LRU.
+
+        Args:
+            chave: Chave da entrada
+
+        Returns:
+            Caminho da entrada ou None se não estiver no cache
+        """
+        caminho = self._caminho_entrada(chave)
+        if not caminho.exists():
+            return None
+
+        try:
+            os.utime(caminho)
+        except OSError:
+            # Entrada removida por outro processo entre exists() e utime()
+            return None
+
+        return caminho
+
+    def novo_temporario(self) -> Path:
+        """
+        Cria um diretório temporário dentro do cache para montar uma entrada.
+
+        Returns:
+            Caminho do diretório temporário
+        """
+        return Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.diretorio))
+
+    def confirmar(self, chave: str, temporario: Path) -> Path:
+        """
+        Move uma entrada montada em ``novo_temporario()`` para o cache.
+
+        Args:
+            chave: Chave da entrada
+            temporario: Arquivo ou diretório temporário com o conteúdo
+
+        Returns:
+            Caminho final da entrada
+        """
+        destino = self._caminho_entrada(chave)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+
+        tamanho = self._calcular_tamanho(temporario)
+
+        try:
+            os.replace(temporario, destino)
+        except OSError:
+            # Outro processo gravou a mesma chave primeiro
+            self._remover(temporario)
+            return destino
+
+        if self._tamanho_atual is None:
+            self._tamanho_atual = self.calcular_tamanho_total()
+        else:
+            self._tamanho_atual += tamanho
+
+        if self._tamanho_atual > self.tamanho_maximo:
+            self.descartar()
+
+        return destino
+
+    def descartar(self) -> int:
+        """
+        Remove as entradas menos usadas até respeitar o tamanho máximo.
+
+        Returns:
+            Número de entradas removidas
+        """
+        entradas = []
+        for caminho in self._listar_entradas():
+            try:
+                entradas.append(
+                    (caminho.stat().st_mtime, self._calcular_tamanho(caminho), caminho)
+                )
+            except OSError:
+                continue
+
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        limite = self.tamanho_maximo * self.FRACAO_APOS_DESCARTE
+        removidas = 0
+
+        for _, tamanho, caminho in sorted(entradas, key=lambda e: e[0]):
+            if total <= limite:
+                break
+            self._remover(caminho)
+            total -= tamanho
+            removidas += 1
+
+        self._tamanho_atual = total
+
+        if removidas:
+            logger.info(f"Cache: {removidas} entradas antigas removidas")
+
+        return removidas
+
+    def calcular_tamanho_total(self) -> int:
+        """Retorna o tamanho total ocupado pelas entradas, em bytes."""
+        return sum(self._calcular_tamanho(c) for c in self._listar_entradas())
+
+    def limpar(self) -> None:
+        """Remove todas as entradas do cache."""
+        for caminho in self._listar_entradas():
+            self._remover(caminho)
+        self._tamanho_atual = 0
+
+    def _listar_entradas(self):
+        """Itera sobre os caminhos de todas as entradas."""
+        for prefixo in self.diretorio.iterdir():
+            if prefixo.name.startswith(".") or not prefixo.is_dir():
+                continue
+            yield from prefixo.iterdir()
+
+    @staticmethod
+    def _calcular_tamanho(caminho: Path) -> int:
+        """Calcula o tamanho de um arquivo ou diretório, em bytes."""
+        if caminho.is_file():
+            return caminho.stat().st_size
+
+        total = 0
+        for raiz, _, arquivos in os.walk(caminho):
+            for nome in arquivos:
+                try:
+                    total += os.path.getsize(os.path.join(raiz, nome))
+                except OSError:
+                    continue
+        return total
+
+    @staticmethod
+    def _remover(caminho: Path) -> None:
+        """Remove um arquivo ou diretório, ignorando erros."""
+        if caminho.is_dir():
+            shutil.rmtree(caminho, ignore_errors=True)
+        else:
+            try:
+                caminho.unlink()
+            except OSError:
+                pass
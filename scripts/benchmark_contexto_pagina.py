@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: extração por página com e sem ContextoPagina.
+
+Compara o caminho antigo (extratores recriados a cada página, cada um
+carregando a página de novo) com o caminho atual (extratores criados uma
+vez por documento e uma única página/TextPage compartilhada).
+
+Uso:
+    python scripts/benchmark_contexto_pagina.py [arquivo.pdf] [--paginas N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.page_context import ContextoPagina  # noqa: E402
+from pdf2md.core.table_extractor import ExtratorTabelas  # noqa: E402
+from pdf2md.core.text_extractor import ExtratorTexto  # noqa: E402
+
+
+def criar_pdf_sintetico(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF com muito texto e uma tabela a cada cinco páginas."""
+    documento = fitz.open()
+    for i in range(paginas):
+        pagina = documento.new_page()
+        y = 60
+        for linha in range(45):
+            pagina.insert_text(
+                (50, y),
+                f"Página {i + 1}, linha {linha + 1}: texto corrido para o benchmark.",
+                fontsize=9,
+            )
+            y += 15
+
+        if i % 5 == 0:
+            for linha in range(5):
+                pagina.draw_line((50, 720 + linha * 15), (450, 720 + linha * 15))
+            for coluna in range(3):
+                pagina.draw_line((50 + coluna * 200, 720), (50 + coluna * 200, 780))
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def processar_sem_contexto(documento: fitz.Document) -> None:
+    """Caminho antigo: extratores e página recriados a cada etapa."""
+    for numero_pagina in range(len(documento)):
+        ExtratorTexto(documento).extrair_blocos_estruturados(numero_pagina)
+        ExtratorTabelas(documento).detectar_tabelas_pagina(numero_pagina)
+
+
+def processar_com_contexto(documento: fitz.Document) -> None:
+    """Caminho atual: extratores por documento e contexto por página."""
+    extrator_texto = ExtratorTexto(documento)
+    extrator_tabelas = ExtratorTabelas(documento)
+    for numero_pagina in range(len(documento)):
+        with ContextoPagina(documento, numero_pagina) as contexto:
+            extrator_texto.extrair_blocos_estruturados(numero_pagina, contexto)
+            extrator_tabelas.detectar_tabelas_pagina(numero_pagina, contexto)
+
+
+def medir(funcao, caminho_pdf: Path, repeticoes: int) -> float:
+    """Retorna o menor tempo (em segundos) entre as repetições."""
+    tempos = []
+    for _ in range(repeticoes):
+        # Documento novo a cada rodada para não reaproveitar caches do MuPDF
+        documento = fitz.open(str(caminho_pdf))
+        inicio = time.perf_counter()
+        funcao(documento)
+        tempos.append(time.perf_counter() - inicio)
+        documento.close()
+    return min(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=50)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_sintetico(
+                Path(temp) / "sintetico.pdf", args.paginas
+            )
+
+        with fitz.open(str(caminho_pdf)) as documento:
+            total_paginas = len(documento)
+
+        antigo = medir(processar_sem_contexto, caminho_pdf, args.repeticoes)
+        atual = medir(processar_com_contexto, caminho_pdf, args.repeticoes)
+
+    print(f"PDF: {caminho_pdf.name} ({total_paginas} páginas)")
+    print(f"  sem contexto: {antigo / total_paginas * 1000:8.2f} ms/página")
+    print(f"  com contexto: {atual / total_paginas * 1000:8.2f} ms/página")
+    print(f"  ganho:        {antigo / atual:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: extração de imagens recodificadas em PNG vs. bytes originais.
+
+Gera (ou lê) um PDF com fotos JPEG e mede, para cada modo do
+ExtratorImagens, o tempo por imagem e o espaço ocupado em disco. O modo
+PNG é medido também com as threads de gravação (--threads), incluindo a
+espera pelas gravações pendentes, e com as imagens reduzidas a
+--dimensao pixels em PNG, JPEG e WebP.
+
+Uso:
+    python scripts/benchmark_image_extraction.py [arquivo.pdf] [--paginas N] [--threads N]
+        [--dimensao N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+import fitz
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.image_extractor import ExtratorImagens  # noqa: E402
+
+
+def criar_pdf_fotos(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF com duas fotos JPEG (1600 x 1200) por página."""
+    gerador = np.random.default_rng(0)
+    documento = fitz.open()
+
+    for _ in range(paginas):
+        pagina = documento.new_page()
+        for y in (50, 430):
+            # Degradê com ruído: comprime como uma foto, não como um desenho
+            base = np.linspace(0, 255, 1600, dtype=np.float32)
+            canal = base[None, :] * 0.6 + gerador.normal(0, 25, (1200, 1600))
+            foto = np.stack([canal, canal[:, ::-1], canal[::-1]], axis=2)
+            foto = np.clip(foto, 0, 255).astype(np.uint8)
+            buffer = BytesIO()
+            Image.fromarray(foto).save(buffer, format="JPEG", quality=85)
+            pagina.insert_image(fitz.Rect(50, y, 545, y + 360), stream=buffer.getvalue())
+
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def medir(caminho_pdf: Path, diretorio: Path, **opcoes) -> dict:
+    """Extrai todas as imagens e retorna o tempo e o tamanho gravado."""
+    documento = fitz.open(str(caminho_pdf))
+    extrator = ExtratorImagens(documento, diretorio, **opcoes)
+
+    inicio = time.perf_counter()
+    imagens = extrator.extrair_todas_imagens()
+    gravados_em_threads = extrator.fechar()
+    decorrido = time.perf_counter() - inicio
+    documento.close()
+
+    return {
+        "ms_imagem": decorrido / max(1, len(imagens)) * 1000,
+        "bytes": sum(imagem["bytes"] for imagem in imagens) + gravados_em_threads,
+        "imagens": len(imagens),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=4,
+                        help="Threads de gravação no modo PNG em segundo plano")
+    parser.add_argument("--dimensao", type=int, default=1024,
+                        help="Maior lado das imagens nos modos reduzidos")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_fotos(temp / "fotos.pdf", args.paginas)
+
+        modos = [
+            ("PNG", {}),
+            (f"PNG ({args.threads} threads)", {"threads_gravacao": args.threads}),
+            ("originais", {"originais": True}),
+        ]
+        for formato in ("png", "jpeg", "webp"):
+            modos.append((f"{formato.upper()} ≤ {args.dimensao}px",
+                          {"formato": formato, "dimensao_maxima": args.dimensao}))
+        resultados = [
+            (nome, medir(caminho_pdf, temp / str(indice), **opcoes))
+            for indice, (nome, opcoes) in enumerate(modos)
+        ]
+
+    print(f"PDF: {caminho_pdf.name} ({resultados[0][1]['imagens']} imagens)")
+    print(f"  {'modo':<22}{'ms/imagem':>12}{'MB gravados':>14}")
+    for nome, r in resultados:
+        print(f"  {nome:<22}{r['ms_imagem']:>12.1f}{r['bytes'] / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
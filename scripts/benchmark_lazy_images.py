@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: conversão sem imagens vs. imagens gravadas vs. imagens adiadas.
+
+Gera (ou lê) um PDF com texto e uma foto por página e mede o tempo total
+da conversão só do texto, com a extração de imagens de sempre e com as
+imagens adiadas (só referências e manifesto). Mede também o tempo de
+gravar depois uma única imagem com ``materializar_imagens``.
+
+Uso:
+    python scripts/benchmark_lazy_images.py [arquivo.pdf] [--paginas N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+import fitz
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.converter import PDFConverter  # noqa: E402
+from pdf2md.core.image_manifest import ManifestoImagens, materializar_imagens  # noqa: E402
+
+
+def criar_pdf_ilustrado(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF com um parágrafo e uma foto (1600 x 1200) por página."""
+    gerador = np.random.default_rng(0)
+    documento = fitz.open()
+
+    for numero in range(paginas):
+        pagina = documento.new_page()
+        pagina.insert_text((72, 72), f"Seção {numero + 1}", fontsize=16)
+        pagina.insert_textbox(fitz.Rect(72, 90, 540, 300), "Texto da seção. " * 60,
+                              fontsize=10)
+        base = np.linspace(0, 255, 1600, dtype=np.float32)
+        canal = base[None, :] * 0.6 + gerador.normal(0, 25, (1200, 1600))
+        foto = np.clip(np.stack([canal, canal[:, ::-1], canal[::-1]], axis=2), 0, 255)
+        buffer = BytesIO()
+        Image.fromarray(foto.astype(np.uint8)).save(buffer, format="PNG")
+        pagina.insert_image(fitz.Rect(72, 320, 540, 671), stream=buffer.getvalue())
+
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def converter(caminho_pdf: Path, diretorio: Path, **opcoes) -> tuple:
+    """Converte o PDF e retorna (segundos, Markdown gerado)."""
+    inicio = time.perf_counter()
+    markdown = PDFConverter(caminho_pdf, diretorio, extrair_tabelas=False,
+                            **opcoes).converter()
+    return time.perf_counter() - inicio, markdown
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_ilustrado(temp / "ilustrado.pdf", args.paginas)
+
+        texto, _ = converter(caminho_pdf, temp / "texto")
+        imagens, _ = converter(caminho_pdf, temp / "imagens", extrair_imagens=True)
+        adiadas, markdown = converter(caminho_pdf, temp / "adiadas",
+                                      extrair_imagens=True, adiar_imagens=True)
+
+        referencias = ManifestoImagens(markdown).carregar()["imagens"]
+        inicio = time.perf_counter()
+        if referencias:
+            materializar_imagens(markdown, [referencias[0]["imagem"]])
+        uma_imagem = time.perf_counter() - inicio
+
+    print(f"PDF: {caminho_pdf.name} ({len(referencias)} imagens)")
+    print(f"  {'conversão':<24}{'segundos':>10}")
+    for nome, segundos in (("só texto", texto), ("imagens gravadas", imagens),
+                           ("imagens adiadas", adiadas)):
+        print(f"  {nome:<24}{segundos:>10.2f}")
+    print(f"  {'materializar 1 imagem':<24}{uma_imagem:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
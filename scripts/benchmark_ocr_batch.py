@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: OCR página a página vs. várias páginas por execução do Tesseract.
+
+Gera (ou lê) um PDF escaneado de páginas pequenas, em que o custo de
+iniciar o Tesseract e carregar o modelo do idioma pesa mais que o
+reconhecimento, e mede o tempo por página com um processo por página e
+com lotes de tamanhos diferentes. Com --workers N, mede a conversão
+completa com as páginas distribuídas entre N processos.
+
+Uso:
+    python scripts/benchmark_ocr_batch.py [arquivo.pdf] [--paginas N] [--lotes 10 50]
+        [--workers N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.converter import PDFConverter  # noqa: E402
+from pdf2md.core.ocr_processor import ProcessadorOCR  # noqa: E402
+
+
+def criar_pdf_escaneado(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF de páginas pequenas escaneadas (uma imagem por página)."""
+    documento = fitz.open()
+
+    for numero in range(paginas):
+        origem = fitz.open()
+        pagina = origem.new_page(width=300, height=200)
+        pagina.insert_text((20, 40), f"Recibo {numero + 1}", fontsize=14)
+        pagina.insert_text((20, 70), "Valor recebido: R$ 120,00", fontsize=10)
+        pix = pagina.get_pixmap(dpi=200)
+        origem.close()
+
+        nova = documento.new_page(width=300, height=200)
+        nova.insert_image(nova.rect, pixmap=pix)
+
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def medir(caminho_pdf: Path, tamanho_lote: int) -> float:
+    """Reconhece todas as páginas e retorna os milissegundos por página."""
+    documento = fitz.open(str(caminho_pdf))
+    processador = ProcessadorOCR(documento, idioma="eng", tamanho_lote=tamanho_lote)
+    total = len(documento)
+
+    inicio = time.perf_counter()
+    for numero_pagina in range(total):
+        processador.antecipar(numero_pagina)
+    for numero_pagina in range(total):
+        processador.processar_pagina_ocr(numero_pagina)
+    decorrido = time.perf_counter() - inicio
+
+    documento.close()
+    return decorrido / total * 1000
+
+
+def medir_conversao(caminho_pdf: Path, tamanho_lote: int, workers: int) -> float:
+    """Converte o PDF com OCR em ``workers`` processos; retorna ms por página."""
+    with tempfile.TemporaryDirectory() as saida:
+        conversor = PDFConverter(caminho_pdf, saida, ocr_habilitado=True,
+                                 idioma_ocr="eng", extrair_tabelas=False,
+                                 workers=workers, ocr_tamanho_lote=tamanho_lote)
+        inicio = time.perf_counter()
+        conversor.converter()
+        decorrido = time.perf_counter() - inicio
+        return decorrido / conversor.obter_estatisticas()["paginas_processadas"] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=200)
+    parser.add_argument("--lotes", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processos de páginas (mede a conversão completa)")
+    args = parser.parse_args()
+
+    processador = ProcessadorOCR(fitz.open(), idioma="eng")
+    if not processador.ocr_disponivel:
+        sys.exit("pytesseract não está instalado")
+    try:
+        processador.pytesseract.get_tesseract_version()
+    except Exception:
+        sys.exit("Tesseract não encontrado no PATH")
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_escaneado(Path(temp) / "escaneado.pdf",
+                                              args.paginas)
+
+        if args.workers > 1:
+            def medida(tamanho):
+                return medir_conversao(caminho_pdf, tamanho, args.workers)
+        else:
+            def medida(tamanho):
+                return medir(caminho_pdf, tamanho)
+
+        resultados = [(1, medida(1))]
+        for tamanho in args.lotes:
+            resultados.append((tamanho, medida(tamanho)))
+
+    base = resultados[0][1]
+    print(f"PDF: {caminho_pdf.name} ({args.workers} processo(s))")
+    print(f"  {'páginas por execução':<24}{'ms/página':>12}{'aceleração':>12}")
+    for tamanho, ms in resultados:
+        print(f"  {tamanho:<24}{ms:>12.1f}{base / ms:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: entrega da página renderizada ao Tesseract.
+
+Compara o caminho antigo (Pixmap → PNG → Image.open) com a entrega das
+amostras do Pixmap via Image.frombuffer, em RGB e em tons de cinza. Mede
+o tempo por página até o arquivo que o pytesseract grava para o Tesseract
+estar pronto (o PNG do caminho antigo é gravado em PNG de novo; as
+amostras, em PPM/PGM) e o pico de memória alocada pelo Python
+(tracemalloc), além do tamanho do buffer entregue. Com --tesseract, inclui
+o próprio OCR na medição de tempo.
+
+Uso:
+    python scripts/benchmark_ocr_pixmap.py [arquivo.pdf] [--paginas N] [--tesseract]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+import fitz
+from PIL import Image
+from pytesseract import pytesseract
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.ocr_processor import ProcessadorOCR, _imagem_pil  # noqa: E402
+
+
+def criar_pdf_escaneado(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF de páginas com texto renderizado como imagem (escaneado)."""
+    origem = fitz.open()
+    pagina = origem.new_page()
+    y = 60
+    for linha in range(45):
+        pagina.insert_text(
+            (50, y), f"Linha {linha + 1}: texto digitalizado para o benchmark.",
+            fontsize=10,
+        )
+        y += 15
+    imagem = pagina.get_pixmap(dpi=150).tobytes("png")
+    origem.close()
+
+    documento = fitz.open()
+    for _ in range(paginas):
+        nova = documento.new_page()
+        nova.insert_image(nova.rect, stream=imagem)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def via_png(documento, numero_pagina: int):
+    """Caminho antigo: codifica em PNG e decodifica de novo."""
+    pix = documento[numero_pagina].get_pixmap(matrix=fitz.Matrix(2, 2))
+    dados = pix.tobytes("png")
+    imagem = Image.open(BytesIO(dados))
+    imagem.load()
+    return imagem, len(dados)
+
+
+def via_buffer(processador: ProcessadorOCR, numero_pagina: int):
+    """Caminho atual: imagem montada sobre as amostras do Pixmap."""
+    renderizada = processador.renderizar_pagina(numero_pagina)
+    return _imagem_pil(renderizada), renderizada
+
+
+def medir(caminho_pdf: Path, modo: str, tesseract: bool) -> dict:
+    """Mede um modo sobre todas as páginas do PDF."""
+    documento = fitz.open(str(caminho_pdf))
+    processador = ProcessadorOCR(documento, idioma="eng",
+                                 escala_cinza=(modo == "cinza"))
+    total = len(documento)
+    bytes_buffer = 0
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+
+    for numero_pagina in range(total):
+        if modo == "png":
+            imagem, tamanho = via_png(documento, numero_pagina)
+        else:
+            # A imagem usa o buffer do Pixmap: liberá-la antes da renderização
+            imagem, renderizada = via_buffer(processador, numero_pagina)
+            tamanho = len(renderizada["amostras"])
+        bytes_buffer += tamanho
+
+        if tesseract:
+            processador.pytesseract.image_to_string(imagem, lang="eng")
+        else:
+            # Arquivo temporário que o pytesseract entrega ao Tesseract
+            with pytesseract.save(imagem):
+                pass
+        del imagem
+
+    decorrido = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    documento.close()
+
+    return {
+        "ms_pagina": decorrido / total * 1000,
+        "pico_mb": pico / (1024 * 1024),
+        "buffer_kb": bytes_buffer / total / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=20)
+    parser.add_argument("--tesseract", action="store_true",
+                        help="Executar o Tesseract em cada página")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_escaneado(Path(temp) / "escaneado.pdf",
+                                              args.paginas)
+
+        resultados = {
+            modo: medir(caminho_pdf, modo, args.tesseract)
+            for modo in ("png", "rgb", "cinza")
+        }
+
+    print(f"PDF: {caminho_pdf.name}")
+    print(f"  {'modo':<8}{'ms/página':>12}{'pico (MB)':>12}{'buffer (KB)':>14}")
+    for modo, r in resultados.items():
+        print(f"  {modo:<8}{r['ms_pagina']:>12.2f}{r['pico_mb']:>12.2f}"
+              f"{r['buffer_kb']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pré-processamento das páginas antes do OCR.
+
+Gera (ou lê) um PDF escaneado com fundo amarelado e páginas levemente
+inclinadas e mede, por página, o tempo de cada etapa do pré-processamento
+(binarização, inclinação, recorte) e a redução de pixels entregues ao
+Tesseract. Com --tesseract, mede também o OCR com e sem pré-processamento,
+mostrando o ganho líquido por página.
+
+Uso:
+    python scripts/benchmark_ocr_preprocess.py [arquivo.pdf] [--paginas N] [--tesseract]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+import fitz
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.ocr_processor import ProcessadorOCR, _imagem_pil  # noqa: E402
+
+
+def criar_pdf_escaneado(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF de páginas escaneadas, amareladas e inclinadas."""
+    documento = fitz.open()
+
+    for numero in range(paginas):
+        origem = fitz.open()
+        pagina = origem.new_page()
+        y = 60
+        for linha in range(45):
+            pagina.insert_text(
+                (50, y), f"Linha {linha + 1}: texto digitalizado para o benchmark.",
+                fontsize=10,
+            )
+            y += 15
+        pix = pagina.get_pixmap(dpi=200)
+        origem.close()
+
+        imagem = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        inclinacao = (numero % 5 - 2) * 0.8
+        imagem = imagem.rotate(inclinacao, fillcolor=(235, 225, 200))
+
+        buffer = BytesIO()
+        imagem.save(buffer, format="JPEG", quality=85)
+
+        nova = documento.new_page()
+        nova.insert_image(nova.rect, stream=buffer.getvalue())
+
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def medir(caminho_pdf: Path, preprocessar: bool, tesseract: bool) -> dict:
+    """Mede a renderização (e o OCR) de todas as páginas do PDF."""
+    documento = fitz.open(str(caminho_pdf))
+    processador = ProcessadorOCR(documento, idioma="eng", preprocessar=preprocessar)
+    total = len(documento)
+    tempo_ocr = 0.0
+
+    inicio = time.perf_counter()
+    for numero_pagina in range(total):
+        renderizada = processador.renderizar_pagina(numero_pagina)
+        if tesseract:
+            inicio_ocr = time.perf_counter()
+            imagem = _imagem_pil(renderizada)
+            processador.pytesseract.image_to_string(imagem, lang="eng")
+            del imagem
+            tempo_ocr += time.perf_counter() - inicio_ocr
+        del renderizada
+    decorrido = time.perf_counter() - inicio
+
+    contadores = processador.coletar_contadores().get("ocr_preprocessamento", {})
+    documento.close()
+
+    resultado = {
+        "ms_pagina": decorrido / total * 1000,
+        "ocr_ms_pagina": tempo_ocr / total * 1000,
+    }
+    for etapa in ("binarizacao", "inclinacao", "recorte"):
+        resultado[etapa] = contadores.get(etapa, 0) / total * 1000
+    if contadores:
+        resultado["pixels"] = contadores["pixels_finais"] / contadores["pixels_originais"]
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=10)
+    parser.add_argument("--tesseract", action="store_true",
+                        help="Executar o Tesseract em cada página")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_escaneado(Path(temp) / "escaneado.pdf",
+                                              args.paginas)
+
+        sem = medir(caminho_pdf, False, args.tesseract)
+        com = medir(caminho_pdf, True, args.tesseract)
+
+    print(f"PDF: {caminho_pdf.name}")
+    print("  Pré-processamento (ms/página): "
+          f"binarização {com['binarizacao']:.1f}, "
+          f"inclinação {com['inclinacao']:.1f}, "
+          f"recorte {com['recorte']:.1f}")
+    print(f"  Pixels entregues ao OCR: {com['pixels']:.0%} do original")
+    print(f"  {'modo':<20}{'total ms/página':>18}{'OCR ms/página':>16}")
+    for nome, r in (("sem pré-processar", sem), ("com pré-processar", com)):
+        print(f"  {nome:<20}{r['ms_pagina']:>18.1f}{r['ocr_ms_pagina']:>16.1f}")
+    if args.tesseract:
+        ganho = sem["ms_pagina"] - com["ms_pagina"]
+        print(f"  Ganho líquido: {ganho:.1f} ms/página")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: detecção de tabelas em todas as páginas vs. com o pré-filtro.
+
+Gera (ou lê) um documento longo de texto corrido, com réguas de cabeçalho
+e rodapé e uma tabela com bordas a cada 20 páginas, e mede o tempo da
+detecção de tabelas por página com e sem o pré-filtro por grade de
+linhas, conferindo que as mesmas tabelas são encontradas.
+
+Uso:
+    python scripts/benchmark_table_prefilter.py [arquivo.pdf] [--paginas N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf2md.core.page_context import ContextoPagina  # noqa: E402
+from pdf2md.core.table_extractor import ExtratorTabelas  # noqa: E402
+
+PARAGRAFO = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12
+
+
+def criar_pdf_prosa(caminho: Path, paginas: int) -> Path:
+    """Gera um PDF de texto corrido com uma tabela a cada 20 páginas."""
+    documento = fitz.open()
+    html = "".join(f"<h2>Seção {i}</h2><p>{PARAGRAFO}</p>" for i in range(5))
+
+    for numero in range(paginas):
+        pagina = documento.new_page()
+        pagina.insert_htmlbox(fitz.Rect(72, 60, 540, 640), html)
+        pagina.draw_line((72, 40), (540, 40))
+        pagina.draw_line((72, 800), (540, 800))
+        if numero % 20 == 0:
+            for linha in range(6):
+                pagina.draw_line((72, 660 + linha * 20), (540, 660 + linha * 20))
+            for x in (72, 240, 390, 540):
+                pagina.draw_line((x, 660), (x, 760))
+            for linha in range(5):
+                for coluna, x in enumerate((80, 250, 400)):
+                    pagina.insert_text((x, 675 + linha * 20), f"{linha}.{coluna}",
+                                       fontsize=9)
+
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def medir(caminho_pdf: Path, prefiltrar: bool) -> tuple:
+    """Detecta as tabelas de todas as páginas; retorna (ms/página, tabelas, contadores)."""
+    documento = fitz.open(str(caminho_pdf))
+    extrator = ExtratorTabelas(documento, prefiltrar=prefiltrar)
+    tabelas = 0
+
+    inicio = time.perf_counter()
+    for numero_pagina in range(len(documento)):
+        with ContextoPagina(documento, numero_pagina) as contexto:
+            tabelas += len(extrator.detectar_tabelas_pagina(numero_pagina, contexto))
+    decorrido = time.perf_counter() - inicio
+
+    total = len(documento)
+    documento.close()
+    return decorrido / total * 1000, tabelas, extrator.coletar_contadores()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="PDF a medir (padrão: sintético)")
+    parser.add_argument("--paginas", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pdf:
+            caminho_pdf = Path(args.pdf)
+        else:
+            caminho_pdf = criar_pdf_prosa(Path(temp) / "prosa.pdf", args.paginas)
+
+        todas_ms, todas_tabelas, _ = medir(caminho_pdf, False)
+        filtro_ms, filtro_tabelas, contadores = medir(caminho_pdf, True)
+
+    print(f"PDF: {caminho_pdf.name}")
+    print(f"  {'modo':<20}{'ms/página':>12}{'tabelas':>10}")
+    print(f"  {'todas as páginas':<20}{todas_ms:>12.1f}{todas_tabelas:>10}")
+    print(f"  {'pré-filtro':<20}{filtro_ms:>12.1f}{filtro_tabelas:>10}")
+    print(f"  páginas ignoradas: {contadores.get('paginas_sem_tabelas', 0)}, "
+          f"aceleração: {todas_ms / filtro_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,17 @@
 Testes para o conversor em lote.
 """
 
+import multiprocessing
+import os
+import time
+
 import pytest
 from pathlib import Path
-from pdf2md.core.batch_converter import BatchConverter
+from pdf2md.core.batch_converter import (
+    BatchConverter,
+    estimar_custo,
+    estimar_makespan,
+)
 
 
 class TestBatchConverter:
@@ -55,3 +63,213 @@ class TestBatchConverter:
                 diretorio_entrada=tmp_path / "nao_existe",
                 diretorio_saida=tmp_path / "output"
             )
+
+
+class TestBatchConverterParalelo:
+    """Testes para a conversão em lote com pool de processos."""
+
+    @pytest.fixture
+    def pasta_pdfs(self, tmp_path):
+        """Cria pasta com PDFs válidos e um PDF corrompido."""
+        import fitz
+
+        pasta = tmp_path / "pdfs"
+        pasta.mkdir()
+
+        for i in range(4):
+            documento = fitz.open()
+            documento.new_page().insert_text((72, 72), f"Documento {i}")
+            documento.save(str(pasta / f"doc_{i}.pdf"))
+            documento.close()
+
+        (pasta / "doc_corrompido.pdf").write_bytes(b"%PDF-1.4\n%fake")
+        return pasta
+
+    def test_paralelo_ordem_deterministica(self, pasta_pdfs, tmp_path):
+        """Os resultados seguem a ordem de listar_pdfs()."""
+        batch = BatchConverter(
+            diretorio_entrada=pasta_pdfs,
+            diretorio_saida=tmp_path / "output",
+            max_workers=3
+        )
+
+        resultado = batch.converter_todos()
+        nomes = [r['pdf'] for r in resultado['resultados']]
+
+        assert nomes == [pdf.name for pdf in batch.listar_pdfs()]
+        assert resultado['sucesso'] == 4
+        assert resultado['falhas'] == 1
+
+    def test_paralelo_igual_ao_serial(self, pasta_pdfs, tmp_path):
+        """A conversão paralela gera os mesmos arquivos que a serial."""
+        serial = BatchConverter(pasta_pdfs, tmp_path / "serial").converter_todos()
+        paralelo = BatchConverter(
+            pasta_pdfs, tmp_path / "paralelo", max_workers=2
+        ).converter_todos()
+
+        assert ([r['status'] for r in serial['resultados']]
+                == [r['status'] for r in paralelo['resultados']])
+        for md in (tmp_path / "serial").glob("*.md"):
+            assert md.read_bytes() == (tmp_path / "paralelo" / md.name).read_bytes()
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="a simulação de falha depende de processos criados com fork"
+    )
+    def test_worker_encerrado_nao_derruba_lote(self, pasta_pdfs, tmp_path, monkeypatch):
+        """Um worker que morre afeta apenas o PDF que estava convertendo."""
+        from pdf2md.core import batch_converter
+
+        conversor_original = batch_converter.PDFConverter
+
+        def conversor_instavel(caminho_pdf, **kwargs):
+            if caminho_pdf.name == "doc_2.pdf":
+                os._exit(1)
+            return conversor_original(caminho_pdf=caminho_pdf, **kwargs)
+
+        monkeypatch.setattr(batch_converter, "PDFConverter", conversor_instavel)
+
+        resultado = BatchConverter(
+            pasta_pdfs, tmp_path / "output", max_workers=2
+        ).converter_todos()
+        status = {r['pdf']: r['status'] for r in resultado['resultados']}
+
+        assert status['doc_2.pdf'] == 'falha'
+        assert status['doc_0.pdf'] == 'sucesso'
+        assert status['doc_3.pdf'] == 'sucesso'
+        assert resultado['sucesso'] == 3
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="a simulação de falha depende de processos criados com fork"
+)
+class TestBatchConverterSupervisao:
+    """Testes para os limites de tempo e memória e a quarentena."""
+
+    @pytest.fixture
+    def pasta_pdfs(self, tmp_path):
+        """Cria pasta com três PDFs válidos."""
+        import fitz
+
+        pasta = tmp_path / "pdfs"
+        pasta.mkdir()
+
+        for i in range(3):
+            documento = fitz.open()
+            documento.new_page().insert_text((72, 72), f"Documento {i}")
+            documento.save(str(pasta / f"doc_{i}.pdf"))
+            documento.close()
+
+        return pasta
+
+    def _simular(self, monkeypatch, acao):
+        """Faz doc_1.pdf executar ``acao`` em vez de converter."""
+        from pdf2md.core import batch_converter
+
+        conversor_original = batch_converter.PDFConverter
+
+        def conversor_problematico(caminho_pdf, **kwargs):
+            if caminho_pdf.name == "doc_1.pdf":
+                acao()
+            return conversor_original(caminho_pdf=caminho_pdf, **kwargs)
+
+        monkeypatch.setattr(batch_converter, "PDFConverter", conversor_problematico)
+
+    def test_tempo_limite(self, pasta_pdfs, tmp_path, monkeypatch):
+        """Um PDF que trava é encerrado e os demais são convertidos."""
+        self._simular(monkeypatch, lambda: time.sleep(60))
+
+        inicio = time.monotonic()
+        resultado = BatchConverter(
+            pasta_pdfs, tmp_path / "output", tempo_limite=1
+        ).converter_todos()
+        falha = resultado['resultados'][1]
+
+        assert time.monotonic() - inicio < 30
+        assert falha['status'] == 'falha'
+        assert 'tempo limite' in falha['erro']
+        assert resultado['sucesso'] == 2
+
+    def test_limite_memoria(self, pasta_pdfs, tmp_path, monkeypatch):
+        """Um PDF que excede o limite de memória é encerrado."""
+        from pdf2md.core.supervisor import obter_rss
+
+        if obter_rss(os.getpid()) is None:
+            pytest.skip("RSS indisponível neste sistema")
+
+        def consumir_memoria():
+            dados = b"x" * (800 * 1024 * 1024)
+            time.sleep(60)
+            return dados
+
+        self._simular(monkeypatch, consumir_memoria)
+
+        resultado = BatchConverter(
+            pasta_pdfs, tmp_path / "output", max_workers=2, limite_memoria_mb=400
+        ).converter_todos()
+        falha = resultado['resultados'][1]
+
+        assert falha['status'] == 'falha'
+        assert 'memória' in falha['erro']
+        assert resultado['sucesso'] == 2
+
+    def test_quarentena_pulada_ate_forcar(self, pasta_pdfs, tmp_path, monkeypatch):
+        """PDFs em quarentena são pulados nas próximas execuções, salvo com forcar."""
+        saida = tmp_path / "output"
+        self._simular(monkeypatch, lambda: os._exit(1))
+        BatchConverter(pasta_pdfs, saida, max_workers=2).converter_todos()
+        monkeypatch.undo()
+
+        pulado = BatchConverter(pasta_pdfs, saida).converter_todos()
+        assert pulado['quarentena'] == 1
+        assert pulado['resultados'][1]['status'] == 'quarentena'
+        assert not (saida / "doc_1.md").exists()
+
+        forcado = BatchConverter(pasta_pdfs, saida, forcar=True).converter_todos()
+        assert forcado['sucesso'] == 3
+
+        # Convertido com sucesso, o PDF sai da quarentena
+        assert BatchConverter(pasta_pdfs, saida).converter_todos()['quarentena'] == 0
+
+
+class TestBatchConverterEscalonamento:
+    """Testes para a ordenação LPT e a estimativa de makespan."""
+
+    def test_estimar_makespan(self):
+        """LPT distribui as tarefas pelo worker menos carregado."""
+        assert estimar_makespan([10, 1, 1, 1], workers=2) == 10
+        assert estimar_makespan([4, 3, 3, 2], workers=2) == 6
+        assert estimar_makespan([5, 5], workers=1) == 10
+        assert estimar_makespan([], workers=4) == 0
+
+    def test_estimar_custo_ocr_domina(self):
+        """Com OCR, o custo por página é muito maior."""
+        sem_ocr = estimar_custo(100, 1024, ocr=False, tabelas=True)
+        com_ocr = estimar_custo(100, 1024, ocr=True, tabelas=True)
+
+        assert com_ocr > sem_ocr * 10
+
+    def test_estimar_custos_maior_documento(self, tmp_path):
+        """O PDF com mais páginas recebe o maior custo; inválidos custam zero."""
+        import fitz
+
+        pasta = tmp_path / "pdfs"
+        pasta.mkdir()
+        for nome, paginas in (("curto.pdf", 1), ("longo.pdf", 30)):
+            documento = fitz.open()
+            for _ in range(paginas):
+                documento.new_page()
+            documento.save(str(pasta / nome))
+            documento.close()
+        (pasta / "quebrado.pdf").write_bytes(b"%PDF-1.4\n%fake")
+
+        batch = BatchConverter(pasta, tmp_path / "output", max_workers=2)
+        custos = batch.estimar_custos(batch.listar_pdfs())
+
+        assert custos[pasta / "longo.pdf"] > custos[pasta / "curto.pdf"] > 0
+        assert custos[pasta / "quebrado.pdf"] == 0
+
+        resultado = batch.converter_todos()
+        assert resultado['makespan_estimado'] is not None
+        assert resultado['makespan_real'] > 0
@@ -0,0 +1,150 @@
+"""
+Testes para o jornal de conversões em lote.
+"""
+
+import multiprocessing
+import time
+
+import fitz
+import pytest
+
+from pdf2md.core.batch_converter import BatchConverter
+from pdf2md.core.batch_journal import JornalLote, calcular_impressao_arquivo
+
+
+@pytest.fixture
+def pasta_pdfs(tmp_path):
+    """Cria pasta com dois PDFs válidos e um corrompido."""
+    pasta = tmp_path / "pdfs"
+    pasta.mkdir()
+
+    for i in range(2):
+        documento = fitz.open()
+        documento.new_page().insert_text((72, 72), f"Documento {i}")
+        documento.save(str(pasta / f"doc_{i}.pdf"))
+        documento.close()
+
+    (pasta / "doc_quebrado.pdf").write_bytes(b"%PDF-1.4\n%fake")
+    return pasta
+
+
+class TestJornalLote:
+    """Testes para a gravação do jornal."""
+
+    def test_registros_em_lote(self, tmp_path):
+        """Registros só vão para o banco ao atingir o tamanho do lote."""
+        with JornalLote(tmp_path, tamanho_lote=2, intervalo=3600) as jornal:
+            jornal.registrar({'pdf': 'a.pdf', 'status': 'sucesso'})
+            assert jornal.carregar() == {}
+
+            jornal.registrar({'pdf': 'b.pdf', 'status': 'falha', 'erro': 'x'})
+            registros = jornal.carregar()
+
+        assert set(registros) == {'a.pdf', 'b.pdf'}
+        assert registros['b.pdf']['erro'] == 'x'
+
+    def test_fechar_grava_pendentes(self, tmp_path):
+        """Fechar o jornal grava os registros acumulados."""
+        jornal = JornalLote(tmp_path, tamanho_lote=100, intervalo=3600)
+        jornal.registrar({'pdf': 'a.pdf', 'status': 'sucesso'})
+        jornal.fechar()
+
+        with JornalLote(tmp_path) as jornal:
+            assert 'a.pdf' in jornal.carregar()
+
+    def test_impressao_reaproveita_hash(self, tmp_path):
+        """Com tamanho e mtime iguais, o hash anterior é reaproveitado."""
+        arquivo = tmp_path / "a.pdf"
+        arquivo.write_bytes(b"conteudo")
+
+        impressao = calcular_impressao_arquivo(arquivo)
+        falsa = dict(impressao, hash="hash-anterior")
+
+        assert calcular_impressao_arquivo(arquivo, falsa)['hash'] == "hash-anterior"
+
+
+class TestBatchRetomada:
+    """Testes para a retomada de lotes."""
+
+    def test_retomar_pula_concluidos(self, pasta_pdfs, tmp_path):
+        """Ao retomar, PDFs concluídos são pulados e falhas são refeitas."""
+        saida = tmp_path / "output"
+        primeiro = BatchConverter(pasta_pdfs, saida).converter_todos()
+        assert primeiro['sucesso'] == 2
+        assert primeiro['falhas'] == 1
+
+        segundo = BatchConverter(pasta_pdfs, saida, retomar=True).converter_todos()
+
+        assert segundo['retomados'] == 2
+        assert segundo['sucesso'] == 2
+        assert segundo['falhas'] == 1
+        status = {r['pdf']: r.get('retomado', False) for r in segundo['resultados']}
+        assert status == {
+            'doc_0.pdf': True,
+            'doc_1.pdf': True,
+            'doc_quebrado.pdf': False,
+        }
+
+    def test_retomar_reconverte_entrada_alterada(self, pasta_pdfs, tmp_path):
+        """Um PDF alterado desde a última execução é convertido de novo."""
+        saida = tmp_path / "output"
+        BatchConverter(pasta_pdfs, saida).converter_todos()
+
+        documento = fitz.open()
+        documento.new_page().insert_text((72, 72), "Documento alterado")
+        documento.save(str(pasta_pdfs / "doc_1.pdf"))
+        documento.close()
+
+        resultado = BatchConverter(pasta_pdfs, saida, retomar=True).converter_todos()
+
+        assert resultado['retomados'] == 1
+        assert "alterado" in (saida / "doc_1.md").read_text(encoding="utf-8")
+
+    def test_sem_retomar_converte_tudo(self, pasta_pdfs, tmp_path):
+        """Sem --resume, o jornal é gravado mas nada é pulado."""
+        saida = tmp_path / "output"
+        BatchConverter(pasta_pdfs, saida).converter_todos()
+
+        resultado = BatchConverter(pasta_pdfs, saida).converter_todos()
+
+        assert resultado['retomados'] == 0
+        assert (saida / JornalLote.NOME_ARQUIVO).exists()
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="a simulação de PDF lento depende de processos criados com fork"
+    )
+    def test_interrupcao_preserva_concluidos(self, pasta_pdfs, tmp_path, monkeypatch):
+        """PDFs concluídos atrás de um PDF lento já estão no jornal ao interromper."""
+        from pdf2md.core import batch_converter
+
+        saida = tmp_path / "output"
+        conversor_original = batch_converter.PDFConverter
+        registrar_original = JornalLote.registrar
+
+        def conversor_lento(caminho_pdf, **kwargs):
+            if caminho_pdf.name == "doc_0.pdf":
+                time.sleep(20)
+            return conversor_original(caminho_pdf=caminho_pdf, **kwargs)
+
+        def registrar_e_interromper(jornal, resultado):
+            registrar_original(jornal, resultado)
+            if len(jornal._pendentes) == 2:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(batch_converter, "PDFConverter", conversor_lento)
+        monkeypatch.setattr(JornalLote, "registrar", registrar_e_interromper)
+
+        inicio = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            BatchConverter(pasta_pdfs, saida, max_workers=2).converter_todos()
+        assert time.monotonic() - inicio < 15
+        monkeypatch.undo()
+
+        with JornalLote(saida) as jornal:
+            registros = jornal.carregar()
+        assert set(registros) == {"doc_1.pdf", "doc_quebrado.pdf"}
+
+        retomado = BatchConverter(pasta_pdfs, saida, retomar=True).converter_todos()
+        assert retomado['retomados'] == 1
+        assert retomado['sucesso'] == 2
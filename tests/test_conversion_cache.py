@@ -0,0 +1,147 @@
+"""
+Testes para o cache de conversões.
+"""
+
+import os
+import shutil
+
+import fitz
+import pytest
+
+from pdf2md.core.conversion_cache import CacheConversao
+from pdf2md.core.converter import PDFConverter
+from pdf2md.utils.cache_lru import CacheDiscoLRU
+
+
+@pytest.fixture
+def pdf_teste(tmp_path):
+    """Fixture que gera um PDF simples com duas páginas."""
+    caminho = tmp_path / "entrada" / "documento.pdf"
+    caminho.parent.mkdir()
+    documento = fitz.open()
+    for i in range(2):
+        pagina = documento.new_page()
+        pagina.insert_text((72, 72), f"Texto da página {i + 1}")
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+class TestCacheDiscoLRU:
+    """Testes para o cache em disco genérico."""
+
+    def _gravar(self, cache, chave, tamanho):
+        temporario = cache.novo_temporario()
+        (temporario / "dados").write_bytes(b"x" * tamanho)
+        return cache.confirmar(chave, temporario)
+
+    def test_obter_inexistente(self, tmp_path):
+        """Chave ausente retorna None."""
+        cache = CacheDiscoLRU(tmp_path / "cache", tamanho_maximo=1000)
+        assert cache.obter("ab" * 32) is None
+
+    def test_gravar_e_obter(self, tmp_path):
+        """Uma entrada gravada pode ser lida de volta."""
+        cache = CacheDiscoLRU(tmp_path / "cache", tamanho_maximo=1000)
+        self._gravar(cache, "aa11", 10)
+
+        entrada = cache.obter("aa11")
+        assert (entrada / "dados").read_bytes() == b"x" * 10
+
+    def test_descarte_lru(self, tmp_path):
+        """Ao exceder o limite, a entrada usada há mais tempo sai primeiro."""
+        cache = CacheDiscoLRU(tmp_path / "cache", tamanho_maximo=250)
+
+        for indice, chave in enumerate(["aa01", "bb02"]):
+            entrada = self._gravar(cache, chave, 100)
+            os.utime(entrada, (indice, indice))
+
+        # Acessar a entrada mais antiga a torna a mais recente
+        cache.obter("aa01")
+        self._gravar(cache, "cc03", 100)
+
+        assert cache.obter("aa01") is not None
+        assert cache.obter("bb02") is None
+        assert cache.obter("cc03") is not None
+        assert cache.calcular_tamanho_total() <= 250
+
+
+class TestCacheConversao:
+    """Testes do cache integrado ao conversor."""
+
+    def test_acerto_restaura_markdown(self, pdf_teste, tmp_path):
+        """A segunda conversão do mesmo PDF vem do cache."""
+        cache = tmp_path / "cache"
+
+        primeiro = PDFConverter(
+            caminho_pdf=pdf_teste,
+            diretorio_saida=tmp_path / "saida1",
+            diretorio_cache=cache
+        )
+        arquivo1 = primeiro.converter()
+        assert primeiro.obter_estatisticas()['cache_acerto'] is False
+
+        segundo = PDFConverter(
+            caminho_pdf=pdf_teste,
+            diretorio_saida=tmp_path / "saida2",
+            diretorio_cache=cache
+        )
+        arquivo2 = segundo.converter()
+        stats = segundo.obter_estatisticas()
+
+        assert stats['cache_acerto'] is True
+        assert stats['paginas_processadas'] == 2
+        assert arquivo2.read_bytes() == arquivo1.read_bytes()
+
+    def test_acerto_nao_abre_pdf(self, pdf_teste, tmp_path, monkeypatch):
+        """Em um acerto o PDF não é aberto."""
+        cache = tmp_path / "cache"
+        PDFConverter(
+            caminho_pdf=pdf_teste,
+            diretorio_saida=tmp_path / "saida1",
+            diretorio_cache=cache
+        ).converter()
+
+        def falhar(*args, **kwargs):
+            raise AssertionError("PDF não deveria ser aberto")
+
+        monkeypatch.setattr("pdf2md.core.converter.fitz.open", falhar)
+
+        conversor = PDFConverter(
+            caminho_pdf=pdf_teste,
+            diretorio_saida=tmp_path / "saida2",
+            diretorio_cache=cache
+        )
+        assert conversor.converter().exists()
+
+    def test_titulo_reescrito_para_outro_nome(self, pdf_teste, tmp_path):
+        """O mesmo conteúdo com outro nome reaproveita o cache com o novo título."""
+        cache = tmp_path / "cache"
+        PDFConverter(
+            caminho_pdf=pdf_teste,
+            diretorio_saida=tmp_path / "saida1",
+            diretorio_cache=cache
+        ).converter()
+
+        copia = pdf_teste.with_name("renomeado.pdf")
+        shutil.copy(pdf_teste, copia)
+
+        conversor = PDFConverter(
+            caminho_pdf=copia,
+            diretorio_saida=tmp_path / "saida2",
+            diretorio_cache=cache
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+
+        assert conversor.obter_estatisticas()['cache_acerto'] is True
+        assert conteudo.startswith("# renomeado\n")
+        assert "# documento" not in conteudo
+
+    def test_opcoes_diferentes_nao_acertam(self, pdf_teste, tmp_path):
+        """Opções que alteram a saída geram outra chave."""
+        cache = CacheConversao(tmp_path / "cache")
+
+        chave1 = cache.calcular_chave(pdf_teste, {"extrair_tabelas": True})
+        chave2 = cache.calcular_chave(pdf_teste, {"extrair_tabelas": False})
+
+        assert chave1 != chave2
@@ -8,6 +8,22 @@ from datetime import datetime
 from pdf2md.core.converter import PDFConverter
 
 
+@pytest.fixture
+def pdf_varias_paginas(tmp_path):
+    """Fixture que gera um PDF com várias páginas de texto."""
+    import fitz
+
+    caminho = tmp_path / "varias_paginas.pdf"
+    documento = fitz.open()
+    for i in range(9):
+        pagina = documento.new_page()
+        pagina.insert_text((72, 72), f"Página número {i + 1}")
+        pagina.insert_text((72, 100), f"Conteúdo de teste da página {i + 1}.")
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
 class TestPDFConverterBasico:
     """Testes básicos do conversor."""
 
@@ -333,3 +349,298 @@ class TestPDFConverterErros:
                 caminho_pdf=Path("///caminho/invalido.pdf"),
                 diretorio_saida=Path("/tmp")
             )
+
+
+class TestPDFConverterParalelo:
+    """Testes da conversão com páginas em paralelo."""
+
+    def test_converter_workers_saida_identica(self, pdf_varias_paginas, tmp_path):
+        """A saída com workers deve ser idêntica à da conversão serial."""
+        serial = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "serial"
+        )
+        paralelo = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "paralelo",
+            workers=3
+        )
+
+        arquivo_serial = serial.converter()
+        arquivo_paralelo = paralelo.converter()
+
+        assert arquivo_paralelo.read_bytes() == arquivo_serial.read_bytes()
+
+    def test_converter_workers_estatisticas(self, pdf_varias_paginas, tmp_path):
+        """As estatísticas devem ser somadas entre os workers."""
+        serial = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "serial"
+        )
+        paralelo = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "paralelo",
+            workers=2
+        )
+
+        serial.converter()
+        paralelo.converter()
+
+        stats_serial = serial.obter_estatisticas()
+        stats_paralelo = paralelo.obter_estatisticas()
+
+        assert stats_paralelo['paginas_processadas'] == 9
+        for chave in ('paginas_processadas', 'tabelas_extraidas',
+                      'caracteres_extraidos', 'imagens_extraidas'):
+            assert stats_paralelo[chave] == stats_serial[chave]
+
+
+class TestPDFConverterStreaming:
+    """Testes da escrita do Markdown em modo streaming."""
+
+    def test_streaming_saida_identica(self, pdf_varias_paginas, tmp_path):
+        """O modo streaming deve gerar o mesmo arquivo que o modo padrão."""
+        padrao = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "padrao"
+        )
+        streaming = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "streaming",
+            streaming=True
+        )
+
+        arquivo_padrao = padrao.converter()
+        arquivo_streaming = streaming.converter()
+
+        assert arquivo_streaming.read_bytes() == arquivo_padrao.read_bytes()
+        assert streaming.formatador.conteudo == []
+        assert (streaming.obter_estatisticas()['tamanho_arquivo_saida']
+                == arquivo_padrao.stat().st_size)
+
+    def test_streaming_com_workers(self, pdf_varias_paginas, tmp_path):
+        """Streaming e workers podem ser combinados."""
+        padrao = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "padrao"
+        )
+        combinado = PDFConverter(
+            caminho_pdf=pdf_varias_paginas,
+            diretorio_saida=tmp_path / "combinado",
+            workers=2,
+            streaming=True
+        )
+
+        assert combinado.converter().read_bytes() == padrao.converter().read_bytes()
+
+    def test_workers_com_lotes_pendentes_limitados(
+        self, pdf_varias_paginas, tmp_path, monkeypatch
+    ):
+        """Só uma janela de lotes fica submetida sem ter sido consumida."""
+        from pdf2md.core import converter as modulo
+
+        pendentes = []
+        maximo = []
+
+        class LoteConcluido:
+            def __init__(self, resultados):
+                self.resultados = resultados
+
+            def result(self):
+                pendentes.remove(self)
+                return self.resultados
+
+        class ExecutorSincrono:
+            """Converte cada lote no processo atual, ao ser submetido."""
+
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_):
+                return False
+
+            def submit(self, funcao, *args):
+                pendentes.append(LoteConcluido(funcao(*args)))
+                maximo.append(len(pendentes))
+                return pendentes[-1]
+
+        monkeypatch.setattr(modulo, "ProcessPoolExecutor", ExecutorSincrono)
+        monkeypatch.setattr(modulo, "LOTES_PENDENTES_POR_WORKER", 1)
+
+        padrao = PDFConverter(pdf_varias_paginas, tmp_path / "padrao").converter()
+        combinado = PDFConverter(
+            pdf_varias_paginas, tmp_path / "combinado", workers=2, streaming=True
+        ).converter()
+
+        assert combinado.read_bytes() == padrao.read_bytes()
+        # 9 páginas em 5 lotes, com no máximo 2 pendentes
+        assert len(maximo) == 5
+        assert max(maximo) == 2
+
+
+class TestPDFConverterIncremental:
+    """Testes da reconversão incremental por página."""
+
+    def _gerar_pdf(self, caminho, textos):
+        import fitz
+
+        documento = fitz.open()
+        for texto in textos:
+            pagina = documento.new_page()
+            pagina.insert_text((72, 72), texto)
+        documento.save(str(caminho))
+        documento.close()
+        return caminho
+
+    def test_primeira_conversao_reconverte_tudo(self, tmp_path):
+        """Sem manifesto anterior, todas as páginas são convertidas."""
+        pdf = self._gerar_pdf(tmp_path / "contrato.pdf", ["A", "B", "C"])
+
+        conversor = PDFConverter(
+            caminho_pdf=pdf,
+            diretorio_saida=tmp_path / "saida",
+            incremental=True
+        )
+        conversor.converter()
+        stats = conversor.obter_estatisticas()
+
+        assert stats['paginas_reconvertidas'] == 3
+        assert stats['paginas_reutilizadas'] == 0
+
+    def test_pagina_alterada(self, tmp_path):
+        """Apenas a página alterada é reconvertida e a saída fica correta."""
+        saida = tmp_path / "saida"
+        pdf = self._gerar_pdf(
+            tmp_path / "contrato.pdf",
+            ["Cláusula um", "Cláusula dois", "Cláusula três"]
+        )
+        PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                     incremental=True).converter()
+
+        self._gerar_pdf(pdf, ["Cláusula um", "Cláusula dois (emenda)", "Cláusula três"])
+        conversor = PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                                 incremental=True)
+        arquivo = conversor.converter()
+        stats = conversor.obter_estatisticas()
+
+        assert stats['paginas_reutilizadas'] == 2
+        assert stats['paginas_reconvertidas'] == 1
+        assert stats['paginas_processadas'] == 3
+
+        completo = PDFConverter(caminho_pdf=pdf,
+                                diretorio_saida=tmp_path / "completo").converter()
+        assert arquivo.read_bytes() == completo.read_bytes()
+
+    def test_opcoes_diferentes_invalidam_manifesto(self, tmp_path):
+        """Mudar opções de saída força a reconversão de todas as páginas."""
+        saida = tmp_path / "saida"
+        pdf = self._gerar_pdf(tmp_path / "contrato.pdf", ["A", "B"])
+        PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                     incremental=True).converter()
+
+        conversor = PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                                 incremental=True, extrair_tabelas=False)
+        conversor.converter()
+
+        assert conversor.obter_estatisticas()['paginas_reutilizadas'] == 0
+
+    def test_incremental_com_workers(self, tmp_path):
+        """O modo incremental funciona junto com workers."""
+        saida = tmp_path / "saida"
+        textos = [f"Página {i}" for i in range(6)]
+        pdf = self._gerar_pdf(tmp_path / "contrato.pdf", textos)
+        PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                     incremental=True).converter()
+
+        textos[1] = "Página 1 alterada"
+        textos[4] = "Página 4 alterada"
+        self._gerar_pdf(pdf, textos)
+        conversor = PDFConverter(caminho_pdf=pdf, diretorio_saida=saida,
+                                 incremental=True, workers=2)
+        arquivo = conversor.converter()
+
+        assert conversor.obter_estatisticas()['paginas_reconvertidas'] == 2
+        completo = PDFConverter(caminho_pdf=pdf,
+                                diretorio_saida=tmp_path / "completo").converter()
+        assert arquivo.read_bytes() == completo.read_bytes()
+
+
+class TestPDFConverterOCRAutomatico:
+    """Testes do modo de OCR automático (página a página)."""
+
+    @pytest.fixture
+    def pdf_misto(self, tmp_path):
+        """PDF com uma página de texto, uma escaneada e uma em branco."""
+        import fitz
+
+        caminho = tmp_path / "misto.pdf"
+        documento = fitz.open()
+
+        documento.new_page().insert_text(
+            (72, 72), "Página com camada de texto completa e legível. " * 3
+        )
+
+        escaneada = documento.new_page()
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 100, 140), 0)
+        pixmap.clear_with(230)
+        escaneada.insert_image(escaneada.rect, pixmap=pixmap)
+
+        documento.new_page()
+        documento.save(str(caminho))
+        documento.close()
+        return caminho
+
+    @pytest.fixture
+    def ocr_simulado(self, monkeypatch):
+        """Substitui o Tesseract e registra as páginas enviadas ao OCR."""
+        from pdf2md.core.ocr_processor import ProcessadorOCR
+
+        paginas = []
+
+        def processar(self, numero_pagina, contexto=None):
+            paginas.append(numero_pagina)
+            return "Texto reconhecido pelo OCR"
+
+        monkeypatch.setattr(ProcessadorOCR, "processar_pagina_ocr", processar)
+        return paginas
+
+    def test_apenas_paginas_escaneadas(self, pdf_misto, tmp_path, ocr_simulado):
+        """Somente a página escaneada passa pelo OCR."""
+        conversor = PDFConverter(
+            caminho_pdf=pdf_misto,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado="auto"
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+        stats = conversor.obter_estatisticas()
+
+        assert ocr_simulado == [1]
+        assert "Texto reconhecido pelo OCR" in conteudo
+        assert "camada de texto completa" in conteudo
+        assert stats['paginas_ocr'] == 1
+        assert stats['paginas_texto_nativo'] == 2
+        assert [d['ocr'] for d in stats['decisoes_ocr']] == [False, True, False]
+        assert [d['pagina'] for d in stats['decisoes_ocr']] == [1, 2, 3]
+
+    def test_decisoes_com_workers(self, pdf_misto, tmp_path):
+        """As decisões por página são preservadas na conversão paralela."""
+        conversor = PDFConverter(
+            caminho_pdf=pdf_misto,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado="auto",
+            workers=2
+        )
+        conversor.converter()
+
+        decisoes = conversor.obter_estatisticas()['decisoes_ocr']
+        assert [d['ocr'] for d in decisoes] == [False, True, False]
+
+    def test_estimar_necessidade_ocr(self, pdf_misto):
+        """O leitor estima a fração de páginas escaneadas."""
+        from pdf2md.core.pdf_reader import LeitorPDF
+
+        with LeitorPDF(pdf_misto) as leitor:
+            assert leitor.estimar_necessidade_ocr() == pytest.approx(1 / 3)
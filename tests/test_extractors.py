@@ -7,6 +7,7 @@ from pathlib import Path
 from pdf2md.core.text_extractor import ExtratorTexto
 from pdf2md.core.table_extractor import ExtratorTabelas
 from pdf2md.core.image_extractor import ExtratorImagens
+from pdf2md.core.page_context import ContextoPagina
 import fitz
 
 
@@ -122,3 +123,174 @@ class TestExtratorTabelas:
         assert 'Nome' in resultado
         assert 'Idade' in resultado
         assert 'João' in resultado
+
+
+class TestContextoPagina:
+    """Testes para o contexto de página compartilhado."""
+
+    @pytest.fixture
+    def documento_pdf(self):
+        """Fixture com um documento PDF gerado em memória."""
+        doc = fitz.open()
+        pagina = doc.new_page()
+        pagina.insert_text((72, 72), "Primeiro bloco de texto")
+        pagina.insert_text((72, 300), "Segundo bloco de texto")
+        yield doc
+        doc.close()
+
+    def test_textpage_criada_uma_vez(self, documento_pdf):
+        """A TextPage deve ser reutilizada em leituras sucessivas."""
+        contexto = ContextoPagina(documento_pdf, 0)
+
+        assert contexto.textpage is contexto.textpage
+
+    def test_blocos_iguais_com_e_sem_contexto(self, documento_pdf):
+        """Os blocos extraídos com contexto devem ser os mesmos de antes."""
+        extrator = ExtratorTexto(documento_pdf)
+
+        sem_contexto = extrator.extrair_blocos_estruturados(0)
+        with ContextoPagina(documento_pdf, 0) as contexto:
+            com_contexto = extrator.extrair_blocos_estruturados(0, contexto)
+
+        assert com_contexto == sem_contexto
+        assert len(com_contexto) == 2
+
+    def test_texto_igual_ao_get_text(self):
+        """Tabulações e ligaduras saem como no ``get_text`` da página."""
+        doc = fitz.open()
+        pagina = doc.new_page()
+        pagina.insert_text((72, 72), "Coluna\tvalor")
+        pagina.insert_htmlbox(fitz.Rect(72, 100, 400, 200), "<p>efficient office flow</p>")
+
+        with ContextoPagina(doc, 0) as contexto:
+            assert contexto.obter_texto("blocks") == pagina.get_text("blocks")
+            assert contexto.obter_texto("text") == pagina.get_text("text")
+        doc.close()
+
+    def test_tabelas_com_contexto(self, documento_pdf):
+        """A detecção de tabelas aceita o contexto da página."""
+        extrator = ExtratorTabelas(documento_pdf)
+
+        with ContextoPagina(documento_pdf, 0) as contexto:
+            tabelas = extrator.detectar_tabelas_pagina(0, contexto)
+
+        assert tabelas == []
+
+    def test_liberar(self, documento_pdf):
+        """Ao sair do bloco with, os dados em cache são liberados."""
+        with ContextoPagina(documento_pdf, 0) as contexto:
+            contexto.textpage
+
+        assert contexto._textpage is None
+
+
+class TestProcessadorOCR:
+    """Testes para a renderização de páginas do OCR."""
+
+    @pytest.fixture
+    def documento(self):
+        documento = fitz.open()
+        pagina = documento.new_page(width=200, height=100)
+        pagina.insert_text((20, 50), "Texto para OCR", fontsize=14)
+        yield documento
+        documento.close()
+
+    def test_imagem_identica_ao_png(self, documento):
+        """A imagem montada sobre as amostras é igual à decodificada do PNG."""
+        from io import BytesIO
+        from PIL import Image
+        from pdf2md.core.ocr_processor import ProcessadorOCR, _imagem_pil
+
+        processador = ProcessadorOCR(documento)
+        renderizada = processador.renderizar_pagina(0)
+
+        zoom = renderizada["zoom"]
+        png = documento[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom)).tobytes("png")
+        referencia = Image.open(BytesIO(png)).convert("RGB")
+
+        assert _imagem_pil(renderizada).tobytes() == referencia.tobytes()
+
+    def test_entregue_ao_tesseract_sem_png(self, documento):
+        """O pytesseract grava a imagem em PPM/PGM, sem codificar PNG."""
+        pytesseract = pytest.importorskip("pytesseract")
+        from PIL import Image
+        from pdf2md.core.ocr_processor import ProcessadorOCR, _imagem_pil
+
+        for cinza in (False, True):
+            processador = ProcessadorOCR(documento, escala_cinza=cinza)
+            renderizada = processador.renderizar_pagina(0)
+            imagem = _imagem_pil(renderizada)
+
+            with pytesseract.pytesseract.save(imagem) as (_, arquivo):
+                assert arquivo.endswith(".PPM")
+                with Image.open(arquivo) as gravada:
+                    assert gravada.format == "PPM"
+                    assert gravada.tobytes() == imagem.tobytes()
+            # A imagem usa o buffer do Pixmap: liberá-la antes dele
+            del imagem
+
+    def test_escala_cinza_reduz_amostras(self, documento):
+        """Em tons de cinza, as amostras ocupam um terço do RGB."""
+        from pdf2md.core.ocr_processor import ProcessadorOCR
+
+        rgb = ProcessadorOCR(documento).renderizar_pagina(0, copiar=True)
+        cinza = ProcessadorOCR(documento, escala_cinza=True).renderizar_pagina(
+            0, copiar=True
+        )
+
+        assert cinza["modo"] == "L"
+        assert isinstance(cinza["amostras"], bytes)
+        assert len(cinza["amostras"]) * 3 == len(rgb["amostras"])
+
+    def _pagina_escaneada(self, documento, dpi):
+        """Adiciona uma página A4 formada por uma imagem com o DPI dado."""
+        pagina = documento.new_page(width=595, height=842)
+        largura = int(595 / 72 * dpi)
+        altura = int(842 / 72 * dpi)
+        pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, largura, altura), 0)
+        pixmap.clear_with(255)
+        pagina.insert_image(pagina.rect, pixmap=pixmap)
+        return pagina
+
+    def test_zoom_pagina_escaneada_usa_dpi_nativo(self):
+        """Uma página escaneada é renderizada na resolução da digitalização."""
+        from pdf2md.core.ocr_processor import DPI_MAXIMO_OCR, calcular_zoom_ocr
+
+        documento = fitz.open()
+        self._pagina_escaneada(documento, 200)
+        self._pagina_escaneada(documento, 600)
+        media, alta = documento[0], documento[1]
+
+        assert calcular_zoom_ocr(media, media.get_images()) == pytest.approx(
+            200 / 72, rel=0.01
+        )
+        # Acima do máximo não há ganho para o Tesseract
+        assert calcular_zoom_ocr(alta, alta.get_images()) == pytest.approx(
+            DPI_MAXIMO_OCR / 72, rel=0.01
+        )
+
+    def test_zoom_pelo_tamanho_das_letras(self):
+        """Letras grandes pedem menos resolução que letras pequenas."""
+        from pdf2md.core.ocr_processor import calcular_zoom_ocr
+
+        documento = fitz.open()
+        zooms = []
+        for tamanho in (7, 30):
+            pagina = documento.new_page()
+            for linha in range(8):
+                pagina.insert_text((50, 80 + linha * tamanho * 1.6),
+                                   "Linha de texto para a sonda", fontsize=tamanho)
+            zooms.append(calcular_zoom_ocr(pagina, []))
+
+        pequenas, grandes = zooms
+        assert grandes < pequenas
+
+    def test_zoom_limitado_em_paginas_enormes(self):
+        """Páginas muito grandes não passam do limite de pixels."""
+        from pdf2md.core.ocr_processor import MAXIMO_PIXELS_OCR, calcular_zoom_ocr
+
+        documento = fitz.open()
+        pagina = documento.new_page(width=3370, height=4768)  # A0
+
+        zoom = calcular_zoom_ocr(pagina, [])
+        assert abs(pagina.rect) * zoom * zoom <= MAXIMO_PIXELS_OCR * 1.01
@@ -2,6 +2,8 @@
 Testes para o formatador Markdown (expandido).
 """
 
+import io
+
 import pytest
 from pdf2md.markdown.formatter import FormataadorMarkdown
 
@@ -114,4 +116,28 @@ class TestFormataadorMarkdown:
         codigo = "python\nprint('Olá Mundo')\n"
         formatador.adicionar_paragrafo(codigo)
         conteudo = formatador.obter_conteudo()
-        assert "print" in conteudo
\ No newline at end of file
+        assert "print" in conteudo
+
+    def test_descarregar_sem_destino(self, formatador):
+        """Sem destino, descarregar não altera o conteúdo acumulado."""
+        formatador.adicionar_paragrafo("Texto")
+        formatador.descarregar()
+
+        assert formatador.obter_conteudo() == "Texto\n\n"
+
+    def test_descarregar_com_destino(self):
+        """No modo streaming, o conteúdo é escrito no destino e liberado."""
+        destino = io.StringIO()
+        formatador = FormataadorMarkdown(destino=destino)
+
+        formatador.adicionar_titulo("Documento", nivel=1)
+        formatador.descarregar()
+        assert destino.getvalue() == "# Documento\n\n"
+        assert formatador.conteudo == []
+
+        formatador.adicionar_paragrafo("Parágrafo")
+        formatador.descarregar()
+        assert destino.getvalue() == "# Documento\n\nParágrafo\n\n"
+        assert formatador.obter_estatisticas()["total_caracteres"] == len(
+            destino.getvalue()
+        )
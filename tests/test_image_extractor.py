@@ -0,0 +1,469 @@
+"""
+Testes para o extrator de imagens.
+"""
+
+import time
+from io import BytesIO
+
+import fitz
+import numpy as np
+import pytest
+from PIL import Image
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core import image_extractor
+from pdf2md.core.image_extractor import ExtratorImagens, GravadorImagens
+
+
+def _jpeg(modo, cor, tamanho=(120, 80)):
+    """Bytes de uma imagem JPEG lisa."""
+    buffer = BytesIO()
+    Image.new(modo, tamanho, cor).save(buffer, format="JPEG", quality=80)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def pdf_imagens(tmp_path):
+    """PDF com uma foto JPEG, uma imagem CMYK e uma imagem sem perdas."""
+    caminho = tmp_path / "fotos.pdf"
+    documento = fitz.open()
+    pagina = documento.new_page()
+    pagina.insert_text((72, 60), "Relatório fotográfico", fontsize=12)
+    pagina.insert_image(fitz.Rect(72, 100, 192, 180), stream=_jpeg("RGB", (200, 30, 30)))
+    pagina.insert_image(
+        fitz.Rect(72, 200, 192, 280), stream=_jpeg("CMYK", (0, 200, 200, 0))
+    )
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 40), 0)
+    pixmap.clear_with(90)
+    pagina.insert_image(fitz.Rect(72, 300, 132, 340), pixmap=pixmap)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+class TestImagensOriginais:
+    """Testes da gravação das imagens sem recodificar."""
+
+    def test_jpeg_gravado_como_esta(self, pdf_imagens, tmp_path):
+        """A foto JPEG sai byte a byte igual ao fluxo do PDF."""
+        documento = fitz.open(str(pdf_imagens))
+        extrator = ExtratorImagens(documento, tmp_path / "saida", originais=True)
+        imagens = extrator.extrair_imagens_pagina(0)
+
+        xref = documento[0].get_images()[0][0]
+        original = documento.extract_image(xref)["image"]
+        documento.close()
+
+        assert imagens[0]["nome_arquivo"] == "imagem_1_1.jpeg"
+        assert imagens[0]["original"] is True
+        assert imagens[0]["caminho"].read_bytes() == original
+
+    def test_cmyk_convertido_em_png(self, pdf_imagens, tmp_path):
+        """A imagem CMYK é decodificada e gravada em PNG RGB."""
+        documento = fitz.open(str(pdf_imagens))
+        extrator = ExtratorImagens(documento, tmp_path / "saida", originais=True)
+        imagens = extrator.extrair_imagens_pagina(0)
+        documento.close()
+
+        assert imagens[1]["nome_arquivo"] == "imagem_1_2.png"
+        assert imagens[1]["original"] is False
+        assert Image.open(imagens[1]["caminho"]).mode == "RGB"
+        assert extrator.obter_estatisticas()["imagens_originais"] == 2
+
+    def test_padrao_recodifica_em_png(self, pdf_imagens, tmp_path):
+        """Sem a opção, todas as imagens continuam em PNG."""
+        documento = fitz.open(str(pdf_imagens))
+        imagens = ExtratorImagens(documento, tmp_path / "saida").extrair_imagens_pagina(0)
+        documento.close()
+
+        assert [i["nome_arquivo"] for i in imagens] == [
+            "imagem_1_1.png", "imagem_1_2.png", "imagem_1_3.png"
+        ]
+        assert not any(i["original"] for i in imagens)
+
+    def test_conversor_referencia_os_arquivos(self, pdf_imagens, tmp_path):
+        """O Markdown aponta para os arquivos com a extensão original."""
+        conversor = PDFConverter(
+            pdf_imagens, tmp_path / "saida", extrair_imagens=True,
+            imagens_originais=True
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+        stats = conversor.obter_estatisticas()
+
+        assert "imagens/imagem_1_1.jpeg" in conteudo
+        assert "imagens/imagem_1_2.png" in conteudo
+        assert stats["imagens_originais"] == 2
+        assert stats["bytes_imagens"] == sum(
+            f.stat().st_size for f in (tmp_path / "saida" / "imagens").iterdir()
+        )
+
+
+@pytest.fixture
+def pdfs_com_logotipo(tmp_path):
+    """Dois PDFs com o mesmo logotipo no cabeçalho de todas as páginas."""
+    caminhos = []
+    for nome, paginas in (("oficio.pdf", 4), ("memorando.pdf", 2)):
+        caminho = tmp_path / "entrada" / nome
+        caminho.parent.mkdir(exist_ok=True)
+        documento = fitz.open()
+        logotipo = _jpeg("RGB", (20, 60, 160), (80, 40))
+        xref = 0
+        for numero in range(paginas):
+            pagina = documento.new_page()
+            retangulo = fitz.Rect(72, 30, 152, 70)
+            if xref:
+                pagina.insert_image(retangulo, xref=xref)
+            else:
+                xref = pagina.insert_image(retangulo, stream=logotipo)
+            pagina.insert_text((72, 120), f"{nome} página {numero + 1}", fontsize=12)
+        documento.save(str(caminho))
+        documento.close()
+        caminhos.append(caminho)
+    return caminhos
+
+
+class TestDeduplicacao:
+    """Testes da gravação única de imagens repetidas."""
+
+    def test_mesmo_xref_gravado_uma_vez(self, pdfs_com_logotipo, tmp_path):
+        """O logotipo de todas as páginas vira um arquivo só."""
+        documento = fitz.open(str(pdfs_com_logotipo[0]))
+        extrator = ExtratorImagens(documento, tmp_path / "saida", deduplicar=True)
+        imagens = extrator.extrair_todas_imagens()
+        documento.close()
+
+        assert len(imagens) == 4
+        assert len({imagem["caminho"] for imagem in imagens}) == 1
+        assert [imagem["referencia"] for imagem in imagens] == [False, True, True, True]
+        assert len(list((tmp_path / "saida" / "imagens").iterdir())) == 1
+        estatisticas = extrator.obter_estatisticas()
+        assert (estatisticas["imagens_unicas"], estatisticas["imagens_referencias"]) == (1, 3)
+
+    def test_mesmo_conteudo_entre_documentos(self, pdfs_com_logotipo, tmp_path):
+        """O segundo PDF reaproveita o arquivo gravado pelo primeiro."""
+        saida = tmp_path / "saida"
+        conteudos = []
+        for caminho in pdfs_com_logotipo:
+            conversor = PDFConverter(
+                caminho, saida, extrair_imagens=True, deduplicar_imagens=True
+            )
+            conteudos.append(conversor.converter().read_text(encoding="utf-8"))
+
+        arquivos = list((saida / "imagens").iterdir())
+        assert len(arquivos) == 1
+        referencia = f"imagens/{arquivos[0].name}"
+        assert all(conteudo.count(referencia) == total
+                   for conteudo, total in zip(conteudos, (4, 2)))
+
+        estatisticas = conversor.obter_estatisticas()
+        assert estatisticas["imagens_unicas"] == 0
+        assert estatisticas["imagens_referencias"] == 2
+        assert estatisticas["bytes_imagens"] == 0
+
+    def test_paralelo_igual_ao_serial(self, pdfs_com_logotipo, tmp_path):
+        """Com páginas em processos, o Markdown é o mesmo da conversão serial."""
+        opcoes = {"extrair_imagens": True, "deduplicar_imagens": True}
+        serial = PDFConverter(pdfs_com_logotipo[0], tmp_path / "serial", **opcoes)
+        paralelo = PDFConverter(
+            pdfs_com_logotipo[0], tmp_path / "paralelo", workers=2, **opcoes
+        )
+
+        assert serial.converter().read_bytes() == paralelo.converter().read_bytes()
+
+        estatisticas = paralelo.obter_estatisticas()
+        assert (estatisticas["imagens_unicas"], estatisticas["imagens_referencias"]) == (1, 3)
+
+    @pytest.mark.parametrize("threads", [0, 2])
+    def test_gravacoes_concorrentes_contam_um_arquivo(
+        self, pdfs_com_logotipo, tmp_path, monkeypatch, threads
+    ):
+        """Dois extratores que gravam o mesmo arquivo ao mesmo tempo contam uma imagem única."""
+        saida = tmp_path / "saida"
+        documento = fitz.open(str(pdfs_com_logotipo[0]))
+        extratores = [
+            ExtratorImagens(documento, saida, deduplicar=True, threads_gravacao=threads)
+            for _ in range(2)
+        ]
+        # Os dois chegam à gravação sem ver o arquivo do outro
+        monkeypatch.setattr(image_extractor.Path, "exists", lambda caminho: False)
+
+        imagens = [extrator.extrair_imagens_pagina(n)
+                   for n, extrator in enumerate(extratores)]
+        for extrator in extratores:
+            extrator.fechar()
+        contadores = [extrator.coletar_contadores() for extrator in extratores]
+        documento.close()
+
+        assert imagens[0][0]["caminho"] == imagens[1][0]["caminho"]
+        assert len(list((saida / "imagens").iterdir())) == 1
+        unicas = [extrator.obter_estatisticas()["imagens_unicas"] for extrator in extratores]
+        assert sorted(unicas) == [0, 1]
+        if threads:
+            # A gravação que perdeu a corrida é descontada depois
+            assert {} in contadores and {
+                "imagens_unicas": -1, "imagens_referencias": 1, "imagens_originais": 0
+            } in contadores
+        else:
+            assert imagens[1][0]["referencia"] is True
+
+
+class TestGravacaoEmSegundoPlano:
+    """Testes da codificação e gravação das imagens em threads."""
+
+    def test_gravador_limita_bytes_pendentes(self, tmp_path, monkeypatch):
+        """O gravador nunca retém mais bytes que o limite (salvo uma imagem)."""
+        picos = []
+        original = image_extractor._codificar_e_gravar
+
+        def lento(*args):
+            time.sleep(0.02)
+            return original(*args)
+
+        monkeypatch.setattr(image_extractor, "_codificar_e_gravar", lento)
+        gravador = GravadorImagens(2, memoria_maxima=250)
+        for indice in range(10):
+            gravador.enviar(tmp_path / f"{indice}.bin", bytes(100))
+            picos.append(gravador.bytes_pendentes)
+
+        assert gravador.fechar() == 1000
+        assert max(picos) <= 250
+        assert len(list(tmp_path.iterdir())) == 10
+
+    def test_mesmo_markdown_e_imagens(self, pdf_imagens, tmp_path):
+        """Com threads, o Markdown é o mesmo e as imagens ficam completas."""
+        serial = PDFConverter(pdf_imagens, tmp_path / "serial", extrair_imagens=True)
+        com_threads = PDFConverter(
+            pdf_imagens, tmp_path / "threads", extrair_imagens=True, threads_imagens=2
+        )
+
+        assert serial.converter().read_bytes() == com_threads.converter().read_bytes()
+        for arquivo in (tmp_path / "serial" / "imagens").iterdir():
+            gravado = tmp_path / "threads" / "imagens" / arquivo.name
+            assert (Image.open(gravado).convert("RGB").tobytes()
+                    == Image.open(arquivo).convert("RGB").tobytes())
+        assert com_threads.obter_estatisticas()["bytes_imagens"] == sum(
+            f.stat().st_size for f in (tmp_path / "threads" / "imagens").iterdir()
+        )
+
+    def test_deduplicacao_com_threads(self, pdfs_com_logotipo, tmp_path):
+        """Os nomes deduplicados não dependem das threads de gravação."""
+        nomes = []
+        for threads in (0, 2):
+            saida = tmp_path / f"threads_{threads}"
+            PDFConverter(
+                pdfs_com_logotipo[0], saida, extrair_imagens=True,
+                deduplicar_imagens=True, threads_imagens=threads
+            ).converter()
+            nomes.append(sorted(f.name for f in (saida / "imagens").iterdir()))
+
+        assert nomes[0] == nomes[1] and len(nomes[0]) == 1
+
+    def test_workers_gravam_antes_de_terminar(self, pdf_imagens, tmp_path):
+        """Com páginas em processos, as imagens estão no disco ao final."""
+        conversor = PDFConverter(
+            pdf_imagens, tmp_path / "saida", extrair_imagens=True,
+            threads_imagens=2, workers=2
+        )
+        conversor.converter()
+
+        assert len(list((tmp_path / "saida" / "imagens").glob("*.png"))) == 3
+        assert conversor.obter_estatisticas()["bytes_imagens"] > 0
+
+
+@pytest.fixture
+def pdf_decorado(tmp_path):
+    """PDF com uma foto, um espaçador, um fio, um ícone minúsculo e um fundo liso."""
+    caminho = tmp_path / "decorado.pdf"
+    documento = fitz.open()
+    pagina = documento.new_page()
+
+    foto = np.random.default_rng(0).integers(0, 255, (60, 90, 3), dtype=np.uint8)
+    buffer = BytesIO()
+    Image.fromarray(foto).save(buffer, format="PNG")
+    pagina.insert_image(fitz.Rect(72, 100, 252, 220), stream=buffer.getvalue())
+
+    def _liso(largura, altura, cor):
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, largura, altura), 0)
+        pixmap.clear_with(cor)
+        return pixmap
+
+    # Espaçador 1x1, fio de 400x2, ícone de 30x30 px em 6x6 pt e fundo branco
+    pagina.insert_image(fitz.Rect(10, 10, 11, 11), pixmap=_liso(1, 1, 255))
+    pagina.insert_image(fitz.Rect(72, 80, 472, 82), pixmap=_liso(400, 2, 0),
+                        keep_proportion=False)
+    pagina.insert_image(fitz.Rect(500, 20, 506, 26), pixmap=_liso(30, 30, 120))
+    pagina.insert_image(fitz.Rect(72, 300, 472, 500), pixmap=_liso(200, 100, 255),
+                        keep_proportion=False)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+class TestFiltrosImagens:
+    """Testes dos filtros de imagens decorativas."""
+
+    def test_so_a_foto_e_gravada(self, pdf_decorado, tmp_path):
+        """Espaçador, fio, ícone e fundo liso são ignorados, cada um pelo seu filtro."""
+        documento = fitz.open(str(pdf_decorado))
+        extrator = ExtratorImagens(
+            documento, tmp_path / "saida", lado_minimo=8, area_minima=100,
+            descartar_uniformes=True
+        )
+        imagens = extrator.extrair_imagens_pagina(0)
+        documento.close()
+
+        assert len(imagens) == 1
+        assert Image.open(imagens[0]["caminho"]).size == (90, 60)
+        assert extrator.coletar_contadores() == {
+            "imagens_ignoradas": {"pequenas": 2, "area": 1, "uniformes": 1}
+        }
+        assert extrator.coletar_contadores() == {}
+
+    def test_uniforme_com_imagem_original(self, pdf_decorado, tmp_path):
+        """As imagens lisas também são detectadas sem recodificar as imagens."""
+        documento = fitz.open(str(pdf_decorado))
+        extrator = ExtratorImagens(
+            documento, tmp_path / "saida", originais=True, descartar_uniformes=True
+        )
+        imagens = extrator.extrair_imagens_pagina(0)
+        documento.close()
+
+        # Sem os filtros de tamanho, todas as imagens lisas caem neste filtro
+        assert [imagem["nome_arquivo"] for imagem in imagens] == ["imagem_1_1.png"]
+        assert extrator.coletar_contadores()["imagens_ignoradas"] == {"uniformes": 4}
+
+    def test_conversor_sem_ruido(self, pdf_decorado, tmp_path):
+        """O Markdown só referencia a foto e as estatísticas trazem os motivos."""
+        conversor = PDFConverter(
+            pdf_decorado, tmp_path / "saida", extrair_imagens=True, filtrar_imagens=True
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+        stats = conversor.obter_estatisticas()
+
+        assert conteudo.count("](imagens/") == 1
+        assert stats["imagens_extraidas"] == 1
+        assert sum(stats["imagens_ignoradas"].values()) == 4
+
+
+@pytest.fixture
+def pdf_digitalizado(tmp_path):
+    """PDF com uma foto JPEG grande e uma digitalização sem perdas grande."""
+    caminho = tmp_path / "digitalizado.pdf"
+    gerador = np.random.default_rng(0)
+    foto = gerador.integers(0, 256, (900, 1200, 3), dtype=np.uint8)
+    buffer = BytesIO()
+    Image.fromarray(foto).save(buffer, format="JPEG", quality=85)
+
+    documento = fitz.open()
+    pagina = documento.new_page()
+    pagina.insert_image(fitz.Rect(50, 50, 350, 275), stream=buffer.getvalue())
+    varredura = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 1000, 1400), 0)
+    varredura.set_rect(varredura.irect, (255,))
+    varredura.set_rect(fitz.IRect(100, 100, 900, 300), (0,))
+    pagina.insert_image(fitz.Rect(50, 300, 250, 580), pixmap=varredura)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+class TestReducaoECodecs:
+    """Testes da dimensão máxima e dos formatos de saída."""
+
+    def test_reduz_ao_maior_lado(self, pdf_digitalizado, tmp_path):
+        """As duas imagens saem com o maior lado igual ao limite."""
+        documento = fitz.open(str(pdf_digitalizado))
+        extrator = ExtratorImagens(documento, tmp_path / "saida", dimensao_maxima=300)
+        imagens = extrator.extrair_imagens_pagina(0)
+        documento.close()
+
+        assert [Image.open(i["caminho"]).size for i in imagens] == [(300, 225), (214, 300)]
+        assert all(i["nome_arquivo"].endswith(".png") for i in imagens)
+        assert all(i["bytes"] < i["bytes_origem"] for i in imagens[:1])
+
+    def test_formatos_com_perdas(self, pdf_digitalizado, tmp_path):
+        """JPEG e WebP usam a extensão e o codec escolhidos."""
+        for formato, extensao, nome_pil in (("jpeg", "jpg", "JPEG"), ("webp", "webp", "WEBP")):
+            documento = fitz.open(str(pdf_digitalizado))
+            extrator = ExtratorImagens(
+                documento, tmp_path / formato, formato=formato, qualidade=60
+            )
+            imagens = extrator.extrair_imagens_pagina(0)
+            documento.close()
+
+            for imagem in imagens:
+                assert imagem["nome_arquivo"].endswith(f".{extensao}")
+                assert Image.open(imagem["caminho"]).format == nome_pil
+            assert Image.open(imagens[0]["caminho"]).size == (1200, 900)
+
+    def test_formato_invalido(self, pdf_digitalizado, tmp_path):
+        """Formatos desconhecidos são recusados."""
+        with pytest.raises(ValueError):
+            ExtratorImagens(fitz.open(), tmp_path, formato="gif")
+
+    def test_original_acima_do_limite_reduzido(self, pdf_digitalizado, tmp_path):
+        """Com originais, só as imagens dentro do limite passam sem recodificar."""
+        documento = fitz.open(str(pdf_digitalizado))
+        extrator = ExtratorImagens(
+            documento, tmp_path / "saida", originais=True, dimensao_maxima=2000
+        )
+        dentro = extrator.extrair_imagens_pagina(0)
+        extrator = ExtratorImagens(
+            documento, tmp_path / "reduzida", originais=True, dimensao_maxima=600
+        )
+        acima = extrator.extrair_imagens_pagina(0)
+        documento.close()
+
+        assert dentro[0]["original"] and dentro[0]["nome_arquivo"].endswith(".jpeg")
+        assert not acima[0]["original"]
+        assert Image.open(acima[0]["caminho"]).size == (600, 450)
+
+    def test_reducao_com_threads_e_deduplicacao(self, pdf_digitalizado, tmp_path):
+        """Com threads, o resultado é o mesmo e o nome muda com o limite."""
+        nomes = {}
+        for dimensao, threads in ((300, 0), (300, 2), (400, 0)):
+            documento = fitz.open(str(pdf_digitalizado))
+            extrator = ExtratorImagens(
+                documento, tmp_path / f"{dimensao}_{threads}", deduplicar=True,
+                threads_gravacao=threads, dimensao_maxima=dimensao
+            )
+            imagens = extrator.extrair_imagens_pagina(0)
+            extrator.fechar()
+            documento.close()
+            nomes[dimensao, threads] = [i["nome_arquivo"] for i in imagens]
+            assert Image.open(imagens[1]["caminho"]).size[1] == dimensao
+
+        assert nomes[300, 0] == nomes[300, 2]
+        assert nomes[300, 0] != nomes[400, 0]
+
+    def test_conversor_bytes_antes_e_depois(self, pdf_digitalizado, tmp_path, monkeypatch):
+        """MAX_IMAGE_SIZE chega ao conversor pela CLI e as estatísticas trazem os bytes."""
+        from click.testing import CliRunner
+
+        from pdf2md.cli import commands
+
+        recebidas = {}
+        original = commands.PDFConverter.__init__
+
+        def registrar(self, *args, **kwargs):
+            recebidas.update(kwargs)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(commands.PDFConverter, "__init__", registrar)
+        resultado = CliRunner().invoke(
+            commands.converter,
+            [str(pdf_digitalizado), "-o", str(tmp_path / "cli"), "--extract-images",
+             "--image-format", "jpeg", "--no-cache"],
+            env={"MAX_IMAGE_SIZE": "256"},
+        )
+        assert resultado.exit_code == 0, resultado.output
+        assert recebidas["dimensao_maxima_imagem"] == 256
+        assert recebidas["formato_imagem"] == "jpeg"
+
+        conversor = PDFConverter(
+            pdf_digitalizado, tmp_path / "saida", extrair_imagens=True,
+            dimensao_maxima_imagem=256, formato_imagem="jpeg"
+        )
+        conversor.converter()
+        stats = conversor.obter_estatisticas()
+
+        assert 0 < stats["bytes_imagens"] < stats["bytes_imagens_origem"]
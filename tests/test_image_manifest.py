@@ -0,0 +1,158 @@
+"""
+Testes para as imagens adiadas e a gravação sob demanda.
+"""
+
+import json
+from io import BytesIO
+
+import fitz
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from PIL import Image
+
+from pdf2md.cli.commands import cli
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.image_manifest import ManifestoImagens, materializar_imagens
+
+
+@pytest.fixture
+def pdf_ilustrado(tmp_path):
+    """PDF de três páginas com fotos e um logotipo repetido."""
+    caminho = tmp_path / "ilustrado.pdf"
+    gerador = np.random.default_rng(0)
+    documento = fitz.open()
+
+    logotipo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 20), 0)
+    logotipo.set_rect(logotipo.irect, (10, 60, 160))
+    xref_logotipo = 0
+    for numero in range(3):
+        pagina = documento.new_page()
+        pagina.insert_text((72, 60), f"Capítulo {numero + 1}", fontsize=14)
+        foto = gerador.integers(0, 256, (60, 80, 3), dtype=np.uint8)
+        buffer = BytesIO()
+        Image.fromarray(foto).save(buffer, format="PNG")
+        pagina.insert_image(fitz.Rect(72, 100, 232, 220), stream=buffer.getvalue())
+        xref_logotipo = pagina.insert_image(
+            fitz.Rect(500, 20, 540, 40), pixmap=logotipo, xref=xref_logotipo
+        )
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+def _converter(pdf, saida, **opcoes):
+    conversor = PDFConverter(pdf, saida, extrair_imagens=True, **opcoes)
+    return conversor, conversor.converter()
+
+
+class TestConversaoAdiada:
+    """Testes da conversão com as imagens adiadas."""
+
+    def test_referencias_sem_arquivos(self, pdf_ilustrado, tmp_path):
+        """O Markdown é o mesmo, nenhuma imagem é gravada e o manifesto as liga ao PDF."""
+        _, imediato = _converter(pdf_ilustrado, tmp_path / "imediato")
+        conversor, adiado = _converter(pdf_ilustrado, tmp_path / "adiado", adiar_imagens=True)
+
+        assert adiado.read_text(encoding="utf-8") == imediato.read_text(encoding="utf-8")
+        assert list((tmp_path / "adiado" / "imagens").iterdir()) == []
+
+        dados = ManifestoImagens(adiado).carregar()
+        assert dados["pdf"]["caminho"] == str(pdf_ilustrado.resolve())
+        assert [(e["imagem"], e["pagina"]) for e in dados["imagens"]][:2] == [
+            ("imagens/imagem_1_1.png", 1), ("imagens/imagem_1_2.png", 1)
+        ]
+        assert dados["imagens"][0]["bbox"] == [72.0, 100.0, 232.0, 220.0]
+        assert conversor.obter_estatisticas()["imagens_adiadas"] == 6
+
+    def test_deduplicacao_referencia_o_mesmo_xref(self, pdf_ilustrado, tmp_path):
+        """Com deduplicação, o logotipo repetido vira uma só imagem no manifesto."""
+        conversor, adiado = _converter(
+            pdf_ilustrado, tmp_path / "saida", adiar_imagens=True, deduplicar_imagens=True
+        )
+        entradas = ManifestoImagens(adiado).carregar()["imagens"]
+
+        logotipos = {e["imagem"] for e in entradas if e["bbox"][0] == 500}
+        assert logotipos == {"imagens/imagem_1_2.png"}
+        assert len(entradas) == 6
+        assert conversor.obter_estatisticas()["imagens_adiadas"] == 4
+
+    def test_paralelo_e_incremental(self, pdf_ilustrado, tmp_path):
+        """Workers e páginas reaproveitadas produzem o mesmo manifesto."""
+        _, serial = _converter(pdf_ilustrado, tmp_path / "serial", adiar_imagens=True)
+        _, paralelo = _converter(
+            pdf_ilustrado, tmp_path / "paralelo", adiar_imagens=True, workers=2
+        )
+        _converter(pdf_ilustrado, tmp_path / "incremental", adiar_imagens=True,
+                   incremental=True)
+        conversor, incremental = _converter(
+            pdf_ilustrado, tmp_path / "incremental", adiar_imagens=True, incremental=True
+        )
+
+        esperado = ManifestoImagens(serial).carregar()["imagens"]
+        assert ManifestoImagens(paralelo).carregar()["imagens"] == esperado
+        assert ManifestoImagens(incremental).carregar()["imagens"] == esperado
+        assert conversor.obter_estatisticas()["paginas_reutilizadas"] == 3
+
+
+class TestMaterializar:
+    """Testes da gravação das imagens adiadas."""
+
+    def test_igual_a_conversao_imediata(self, pdf_ilustrado, tmp_path):
+        """As imagens gravadas depois são as mesmas da conversão imediata."""
+        _converter(pdf_ilustrado, tmp_path / "imediato")
+        _, adiado = _converter(pdf_ilustrado, tmp_path / "adiado", adiar_imagens=True)
+
+        caminhos = materializar_imagens(adiado)
+
+        assert len(caminhos) == 6
+        for caminho in caminhos:
+            imediata = tmp_path / "imediato" / "imagens" / caminho.name
+            assert caminho.read_bytes() == imediata.read_bytes()
+
+    def test_so_as_pedidas(self, pdf_ilustrado, tmp_path):
+        """Só as imagens pedidas são gravadas; nomes desconhecidos são recusados."""
+        _, adiado = _converter(
+            pdf_ilustrado, tmp_path / "saida", adiar_imagens=True,
+            formato_imagem="jpeg", dimensao_maxima_imagem=40
+        )
+
+        caminhos = materializar_imagens(adiado, ["imagem_2_1.jpg"])
+
+        assert [p.name for p in (tmp_path / "saida" / "imagens").iterdir()] == [
+            "imagem_2_1.jpg"
+        ]
+        assert Image.open(caminhos[0]).format == "JPEG"
+        assert Image.open(caminhos[0]).size == (40, 30)
+        with pytest.raises(ValueError):
+            materializar_imagens(adiado, ["imagem_9_9.jpg"])
+
+    def test_pdf_alterado_recusado(self, pdf_ilustrado, tmp_path):
+        """Um PDF diferente do convertido não é usado."""
+        _, adiado = _converter(pdf_ilustrado, tmp_path / "saida", adiar_imagens=True)
+        documento = fitz.open(str(pdf_ilustrado))
+        documento.new_page()
+        documento.save(str(tmp_path / "outro.pdf"))
+        documento.close()
+
+        with pytest.raises(ValueError):
+            materializar_imagens(adiado, caminho_pdf=tmp_path / "outro.pdf")
+
+    def test_comando_materialize(self, pdf_ilustrado, tmp_path):
+        """O comando grava as imagens pedidas a partir do Markdown."""
+        runner = CliRunner()
+        resultado = runner.invoke(cli, [
+            "converter", str(pdf_ilustrado), "-o", str(tmp_path),
+            "--extract-images", "--lazy-images", "--no-cache",
+        ])
+        assert resultado.exit_code == 0, resultado.output
+        markdown = tmp_path / "ilustrado.md"
+        assert json.loads((tmp_path / "ilustrado.imagens.json").read_text())["imagens"]
+
+        resultado = runner.invoke(
+            cli, ["materialize", str(markdown), "imagens/imagem_3_1.png"]
+        )
+
+        assert resultado.exit_code == 0, resultado.output
+        assert (tmp_path / "imagens" / "imagem_3_1.png").exists()
+        assert not (tmp_path / "imagens" / "imagem_1_1.png").exists()
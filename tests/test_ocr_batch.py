@@ -0,0 +1,162 @@
+"""
+Testes para o OCR de várias páginas por execução do Tesseract.
+"""
+
+import multiprocessing
+from pathlib import Path
+
+import fitz
+import pytest
+from PIL import Image
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_processor import ProcessadorOCR
+
+
+def _texto(largura, altura):
+    return f"Página {largura}x{altura}\n"
+
+
+@pytest.fixture
+def pdf_paginas(tmp_path):
+    """PDF com cinco páginas de tamanhos diferentes."""
+    caminho = tmp_path / "paginas.pdf"
+    documento = fitz.open()
+    for numero in range(5):
+        pagina = documento.new_page(width=300 + 10 * numero, height=400)
+        pagina.insert_text((50, 50), f"Página {numero + 1}", fontsize=12)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+@pytest.fixture
+def tesseract_simulado(monkeypatch):
+    """
+    Tesseract simulado: uma página por imagem e o tamanho dela como texto.
+
+    Devolve as execuções em lote (listas de tamanhos) e as chamadas página
+    a página.
+    """
+    execucoes = []
+    avulsas = []
+
+    def executar(entrada, base, extension, lang, config="", nice=0, timeout=0):
+        caminhos = Path(entrada).read_text(encoding="utf-8").split()
+        tamanhos = [Image.open(caminho).size for caminho in caminhos]
+        execucoes.append(tamanhos)
+        saida = "".join(_texto(*tamanho) + "\f" for tamanho in tamanhos)
+        Path(f"{base}.{extension}").write_text(saida, encoding="utf-8")
+
+    def reconhecer(self, renderizada):
+        avulsas.append((renderizada["largura"], renderizada["altura"]))
+        return _texto(renderizada["largura"], renderizada["altura"])
+
+    processador = ProcessadorOCR(fitz.open(), idioma="eng")
+    if processador.pytesseract is None:
+        pytest.skip("pytesseract não instalado")
+    monkeypatch.setattr(processador.pytesseract.pytesseract, "run_tesseract", executar)
+    monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+    return execucoes, avulsas
+
+
+class TestReconhecerLote:
+    """Testes do reconhecimento de um lote de páginas."""
+
+    def test_uma_execucao_por_lote(self, pdf_paginas, tesseract_simulado):
+        """O lote passa por uma execução e a saída é dividida por página."""
+        execucoes, avulsas = tesseract_simulado
+        documento = fitz.open(str(pdf_paginas))
+        processador = ProcessadorOCR(documento, idioma="eng")
+        renderizadas = [processador.renderizar_pagina(n) for n in range(3)]
+
+        textos = processador.reconhecer_lote(renderizadas)
+        documento.close()
+
+        assert len(execucoes) == 1 and avulsas == []
+        assert textos == [
+            _texto(r["largura"], r["altura"]) for r in renderizadas
+        ]
+
+    def test_saida_incompleta_refaz_por_pagina(
+        self, pdf_paginas, tesseract_simulado, monkeypatch
+    ):
+        """Se faltarem páginas na saída, o lote é refeito página a página."""
+        _, avulsas = tesseract_simulado
+        documento = fitz.open(str(pdf_paginas))
+        processador = ProcessadorOCR(documento, idioma="eng")
+        monkeypatch.setattr(
+            processador.pytesseract.pytesseract, "run_tesseract",
+            lambda entrada, base, extension, lang, **_: Path(
+                f"{base}.{extension}"
+            ).write_text("só uma página", encoding="utf-8"),
+        )
+        renderizadas = [processador.renderizar_pagina(n) for n in range(3)]
+
+        textos = processador.reconhecer_lote(renderizadas)
+        documento.close()
+
+        assert len(avulsas) == 3
+        assert textos[2] == _texto(renderizadas[2]["largura"], renderizadas[2]["altura"])
+
+
+class TestConversorEmLotes:
+    """Testes do OCR em lotes no conversor."""
+
+    def test_mesmo_resultado_que_por_pagina(
+        self, pdf_paginas, tmp_path, tesseract_simulado
+    ):
+        """Lotes incompletos são descarregados e o Markdown não muda."""
+        execucoes, avulsas = tesseract_simulado
+
+        por_pagina = PDFConverter(
+            pdf_paginas, tmp_path / "pagina", ocr_habilitado=True
+        ).converter()
+        assert len(avulsas) == 5
+
+        conversor = PDFConverter(
+            pdf_paginas, tmp_path / "lote", ocr_habilitado=True, ocr_tamanho_lote=2
+        )
+        em_lotes = conversor.converter()
+
+        assert em_lotes.read_bytes() == por_pagina.read_bytes()
+        # Dois lotes completos; a última página fica sozinha
+        assert [len(lote) for lote in execucoes] == [2, 2]
+        assert len(avulsas) == 6
+        assert conversor.obter_estatisticas()["lotes_ocr"] == 3
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="o Tesseract simulado depende de processos criados com fork"
+    )
+    def test_lotes_com_motor(self, pdf_paginas, tmp_path, tesseract_simulado):
+        """Com o motor, os lotes vão aos workers e o resultado é o mesmo."""
+        serial = PDFConverter(
+            pdf_paginas, tmp_path / "serial", ocr_habilitado=True
+        ).converter()
+        com_motor = PDFConverter(
+            pdf_paginas, tmp_path / "motor", ocr_habilitado=True,
+            workers_ocr=2, ocr_tamanho_lote=3
+        ).converter()
+
+        assert com_motor.read_bytes() == serial.read_bytes()
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="o Tesseract simulado depende de processos criados com fork"
+    )
+    def test_lotes_com_paginas_em_processos(
+        self, pdf_paginas, tmp_path, tesseract_simulado
+    ):
+        """Com páginas em processos, cada processo reconhece as suas em lotes."""
+        serial = PDFConverter(
+            pdf_paginas, tmp_path / "serial", ocr_habilitado=True
+        ).converter()
+        conversor = PDFConverter(
+            pdf_paginas, tmp_path / "processos", ocr_habilitado=True,
+            workers=2, ocr_tamanho_lote=2
+        )
+
+        assert conversor.converter().read_bytes() == serial.read_bytes()
+        # Lotes de páginas [0, 1], [2, 3] e [4]
+        assert conversor.obter_estatisticas()["lotes_ocr"] == 3
@@ -0,0 +1,105 @@
+"""
+Testes para o cache de OCR por página.
+"""
+
+import fitz
+import pytest
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_cache import CacheOCR
+from pdf2md.core.ocr_processor import ProcessadorOCR
+
+
+def _gerar_pdf(caminho, textos):
+    """Gera um PDF com uma página por texto."""
+    documento = fitz.open()
+    for texto in textos:
+        documento.new_page().insert_text((72, 72), texto, fontsize=20)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+@pytest.fixture
+def tesseract_contado(monkeypatch):
+    """Tesseract simulado que registra cada página reconhecida."""
+    chamadas = []
+
+    def reconhecer(self, renderizada):
+        chamadas.append(renderizada["largura"])
+        return f"Texto OCR {len(chamadas)}"
+
+    monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+    return chamadas
+
+
+class TestCacheOCR:
+    """Testes para a chave e a gravação do cache."""
+
+    def test_chave_depende_do_idioma(self, tmp_path):
+        """A mesma imagem em outro idioma gera outra chave."""
+        cache = CacheOCR(tmp_path / "cache")
+        renderizada = {
+            "modo": "L", "largura": 2, "altura": 1, "zoom": 2, "amostras": b"\x00\xff"
+        }
+
+        assert (cache.calcular_chave(renderizada, "por")
+                != cache.calcular_chave(renderizada, "eng"))
+
+    def test_guardar_e_buscar(self, tmp_path):
+        """Um texto gravado é lido de volta, inclusive vazio."""
+        cache = CacheOCR(tmp_path / "cache")
+        cache.guardar("ab12", "texto")
+        cache.guardar("cd34", "")
+
+        assert cache.buscar("ab12") == "texto"
+        assert cache.buscar("cd34") == ""
+        assert cache.buscar("ef56") is None
+
+
+class TestConversorComCacheOCR:
+    """Testes do cache de OCR integrado ao conversor."""
+
+    def test_nova_capa_reaproveita_paginas(self, tmp_path, tesseract_contado):
+        """Reenviar o documento com uma capa nova só reconhece a capa."""
+        cache = tmp_path / "cache_ocr"
+        original = _gerar_pdf(tmp_path / "original.pdf", ["Um", "Dois", "Três"])
+        com_capa = _gerar_pdf(
+            tmp_path / "com_capa.pdf", ["Capa", "Um", "Dois", "Três"]
+        )
+
+        primeiro = PDFConverter(
+            caminho_pdf=original,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado=True,
+            diretorio_cache_ocr=cache
+        )
+        primeiro.converter()
+        assert primeiro.obter_estatisticas()['ocr_cache_falhas'] == 3
+
+        segundo = PDFConverter(
+            caminho_pdf=com_capa,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado=True,
+            diretorio_cache_ocr=cache
+        )
+        conteudo = segundo.converter().read_text(encoding="utf-8")
+        stats = segundo.obter_estatisticas()
+
+        assert len(tesseract_contado) == 4
+        assert stats['ocr_cache_acertos'] == 3
+        assert stats['ocr_cache_falhas'] == 1
+        assert "Texto OCR 1" in conteudo
+
+    def test_sem_cache_sem_contadores(self, tmp_path, tesseract_contado):
+        """Sem diretório de cache, nenhum contador é registrado."""
+        pdf = _gerar_pdf(tmp_path / "doc.pdf", ["Um"])
+
+        conversor = PDFConverter(
+            caminho_pdf=pdf,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado=True
+        )
+        conversor.converter()
+
+        assert 'ocr_cache_acertos' not in conversor.obter_estatisticas()
@@ -0,0 +1,141 @@
+"""
+Testes para o motor de OCR com pool de processos.
+"""
+
+import multiprocessing
+import os
+import time
+
+import fitz
+import pytest
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_engine import MotorOCR
+from pdf2md.core.ocr_processor import ProcessadorOCR
+
+# Os workers herdam o Tesseract simulado apenas quando criados com fork
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="o Tesseract simulado depende de processos criados com fork"
+)
+
+
+@pytest.fixture
+def tesseract_simulado(monkeypatch):
+    """Substitui o Tesseract por uma função que devolve as próprias amostras."""
+
+    def reconhecer(self, renderizada):
+        amostras = renderizada["amostras"]
+        # Imagens com mais bytes terminam antes, invertendo a ordem de término
+        time.sleep(max(0.0, 0.2 - len(amostras) * 0.02))
+        return amostras.decode()
+
+    monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+
+
+class TestMotorOCR:
+    """Testes do motor de OCR."""
+
+    def test_resultados_em_ordem(self, tesseract_simulado):
+        """Os textos voltam na ordem das imagens, não na ordem de término."""
+        amostras = [("x" * i).encode() for i in range(1, 9)]
+
+        with MotorOCR(workers=4) as motor:
+            textos = list(motor.reconhecer({"amostras": a} for a in amostras))
+
+        assert textos == [a.decode() for a in amostras]
+
+    def test_fila_limitada(self, tesseract_simulado):
+        """Nunca há mais imagens em andamento que o tamanho da fila."""
+        with MotorOCR(workers=2, tamanho_fila=3) as motor:
+            for i in range(8):
+                motor.enviar({"amostras": b"x"})
+                assert len(motor._pendentes) <= 3
+
+    def test_tesseract_com_uma_thread(self, monkeypatch):
+        """Os workers limitam o Tesseract a uma thread."""
+        monkeypatch.setattr(
+            ProcessadorOCR,
+            "reconhecer_imagem",
+            lambda self, renderizada: os.environ.get("OMP_THREAD_LIMIT", ""),
+        )
+
+        with MotorOCR(workers=1) as motor:
+            assert motor.enviar({"amostras": b"x"}).result() == "1"
+
+
+class TestConversorComMotorOCR:
+    """Testes do conversor usando o motor de OCR."""
+
+    @pytest.fixture
+    def pdf_escaneado(self, tmp_path):
+        """PDF com páginas de tamanhos diferentes (imagens distintas)."""
+        caminho = tmp_path / "escaneado.pdf"
+        documento = fitz.open()
+        for i in range(6):
+            documento.new_page(width=200 + 40 * i, height=300)
+        documento.save(str(caminho))
+        documento.close()
+        return caminho
+
+    @pytest.fixture
+    def tesseract_por_tamanho(self, monkeypatch):
+        """Tesseract simulado que devolve o tamanho da imagem recebida."""
+
+        def reconhecer(self, renderizada):
+            return f"Imagem {renderizada['largura']}x{renderizada['altura']}"
+
+        monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+
+    def test_saida_igual_ao_ocr_serial(self, pdf_escaneado, tmp_path,
+                                       tesseract_por_tamanho):
+        """O Markdown com o motor é idêntico ao do OCR no processo atual."""
+        serial = PDFConverter(
+            caminho_pdf=pdf_escaneado,
+            diretorio_saida=tmp_path / "serial",
+            ocr_habilitado=True
+        ).converter()
+
+        com_motor = PDFConverter(
+            caminho_pdf=pdf_escaneado,
+            diretorio_saida=tmp_path / "motor",
+            ocr_habilitado=True,
+            workers_ocr=3
+        ).converter()
+
+        assert com_motor.read_bytes() == serial.read_bytes()
+        assert "Imagem " in com_motor.read_text(encoding="utf-8")
+
+    def test_motor_compartilhado(self, pdf_escaneado, tmp_path, tesseract_por_tamanho):
+        """Um motor externo pode atender vários documentos."""
+        with MotorOCR(workers=2) as motor:
+            for nome in ("a", "b"):
+                conversor = PDFConverter(
+                    caminho_pdf=pdf_escaneado,
+                    diretorio_saida=tmp_path / nome,
+                    ocr_habilitado=True,
+                    motor_ocr=motor
+                )
+                conversor.converter()
+                assert conversor.processador_ocr._antecipadas == {}
+
+        assert ((tmp_path / "a" / "escaneado.md").read_bytes()
+                == (tmp_path / "b" / "escaneado.md").read_bytes())
+
+    def test_cache_ocr_com_motor(self, pdf_escaneado, tmp_path, tesseract_por_tamanho):
+        """Páginas no cache de OCR não são enviadas ao motor."""
+        opcoes = {
+            "ocr_habilitado": True,
+            "workers_ocr": 2,
+            "diretorio_cache_ocr": tmp_path / "cache_ocr",
+        }
+        PDFConverter(pdf_escaneado, tmp_path / "a", **opcoes).converter()
+
+        conversor = PDFConverter(pdf_escaneado, tmp_path / "b", **opcoes)
+        conversor.converter()
+        stats = conversor.obter_estatisticas()
+
+        assert stats['ocr_cache_acertos'] == 6
+        assert 'ocr_cache_falhas' not in stats
+        assert ((tmp_path / "a" / "escaneado.md").read_bytes()
+                == (tmp_path / "b" / "escaneado.md").read_bytes())
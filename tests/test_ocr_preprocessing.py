@@ -0,0 +1,158 @@
+"""
+Testes para o pré-processamento das páginas antes do OCR.
+"""
+
+import fitz
+import numpy as np
+import pytest
+from PIL import Image
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_preprocessing import (
+    binarizar_adaptativo,
+    estimar_inclinacao,
+    preprocessar,
+    recortar_margens,
+)
+from pdf2md.core.ocr_processor import ProcessadorOCR
+
+
+def _pagina_texto(inclinacao=0.0, fundo=(255, 255, 255)):
+    """Renderiza uma página de texto (opcionalmente girada) como matriz RGB."""
+    documento = fitz.open()
+    pagina = documento.new_page()
+    for linha in range(30):
+        pagina.insert_text(
+            (60, 80 + linha * 20), f"Linha {linha} de texto digitalizado.", fontsize=11
+        )
+    pix = pagina.get_pixmap(dpi=150)
+    imagem = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    documento.close()
+
+    if inclinacao:
+        imagem = imagem.rotate(inclinacao, expand=True, fillcolor=fundo)
+    return np.asarray(imagem)
+
+
+class TestEtapasPreprocessamento:
+    """Testes das etapas isoladas."""
+
+    def test_binarizacao_com_iluminacao_irregular(self):
+        """Um fundo em degradê vira branco e o texto continua preto."""
+        cinza = np.tile(np.linspace(120, 250, 400).astype(np.uint8), (200, 1))
+        # Traços finos, como os de letras
+        cinza[100:103, 50:350] = cinza[100:103, 50:350] // 3
+
+        binaria = binarizar_adaptativo(cinza)
+
+        assert set(np.unique(binaria)) <= {0, 255}
+        assert (binaria[:90] == 255).all()
+        assert (binaria[100:103, 50:350] == 0).all()
+
+    def test_binarizacao_de_faixa_larga(self):
+        """Faixas muito largas (A0 paisagem a 300 DPI) não estouram as somas."""
+        cinza = np.full((120, 14040), 235, dtype=np.uint8)
+        cinza[40:60, ::10] = 30
+
+        binaria = binarizar_adaptativo(cinza)
+
+        assert (binaria == 0).mean() == pytest.approx(20 * 1404 / cinza.size, rel=0.05)
+        assert (binaria[:30] == 255).all()
+
+    @pytest.mark.parametrize("inclinacao", [-3.0, 0.0, 2.0])
+    def test_estimar_inclinacao(self, inclinacao):
+        """A inclinação de uma página girada é recuperada."""
+        binaria = binarizar_adaptativo(
+            _pagina_texto(inclinacao).mean(axis=2).astype(np.uint8)
+        )
+
+        assert estimar_inclinacao(binaria) == pytest.approx(inclinacao, abs=0.2)
+
+    def test_recortar_margens(self):
+        """O recorte mantém a tinta com uma pequena margem."""
+        binaria = np.full((300, 200), 255, dtype=np.uint8)
+        binaria[100:120, 50:150] = 0
+
+        recorte = recortar_margens(binaria)
+
+        assert recorte.shape == (40, 120)
+        assert (recorte == 0).sum() == 20 * 100
+
+    def test_recortar_pagina_em_branco(self):
+        """Sem tinta, a imagem fica como está."""
+        binaria = np.full((30, 20), 255, dtype=np.uint8)
+        assert recortar_margens(binaria) is binaria
+
+
+class TestPreprocessar:
+    """Testes do pré-processamento completo."""
+
+    def test_pagina_girada_fica_reta_e_menor(self):
+        """A página girada é endireitada e perde as margens."""
+        reta, _ = preprocessar(_pagina_texto())
+        girada, tempos = preprocessar(_pagina_texto(2.0, fundo=(225, 215, 190)))
+
+        assert tempos["angulo"] == pytest.approx(2.0, abs=0.2)
+        assert tempos["pixels_finais"] < tempos["pixels_originais"]
+        # Depois de endireitada, a caixa do texto volta ao tamanho original
+        assert girada.shape == pytest.approx(reta.shape, abs=6)
+        assert girada.flags["C_CONTIGUOUS"]
+
+    def test_tempos_por_etapa(self):
+        """Cada etapa tem seu tempo registrado."""
+        _, tempos = preprocessar(_pagina_texto())
+
+        for etapa in ("binarizacao", "inclinacao", "recorte"):
+            assert tempos[etapa] >= 0
+
+
+class TestProcessadorComPreprocessamento:
+    """Testes do pré-processamento integrado ao OCR."""
+
+    @pytest.fixture
+    def pdf_texto(self, tmp_path):
+        caminho = tmp_path / "texto.pdf"
+        documento = fitz.open()
+        pagina = documento.new_page()
+        pagina.insert_text((72, 72), "Texto para o OCR", fontsize=20)
+        documento.save(str(caminho))
+        documento.close()
+        return caminho
+
+    def test_renderizacao_preprocessada(self, pdf_texto):
+        """A página entregue ao OCR é binária, recortada e sem cópia extra."""
+        documento = fitz.open(str(pdf_texto))
+        comum = ProcessadorOCR(documento, idioma="eng").renderizar_pagina(0)
+        processador = ProcessadorOCR(documento, idioma="eng", preprocessar=True)
+        renderizada = processador.renderizar_pagina(0)
+
+        assert renderizada["modo"] == "L"
+        assert renderizada["largura"] * renderizada["altura"] < (
+            comum["largura"] * comum["altura"] / 10
+        )
+        assert len(renderizada["amostras"]) == renderizada["largura"] * renderizada["altura"]
+
+        contadores = processador.coletar_contadores()["ocr_preprocessamento"]
+        assert contadores["paginas"] == 1
+        assert contadores["pixels_originais"] == comum["largura"] * comum["altura"]
+        documento.close()
+
+    def test_estatisticas_do_conversor(self, pdf_texto, tmp_path, monkeypatch):
+        """O conversor soma os tempos de pré-processamento das páginas."""
+        monkeypatch.setattr(
+            ProcessadorOCR, "reconhecer_imagem",
+            lambda self, renderizada: f"{renderizada['modo']} {renderizada['largura']}"
+        )
+
+        conversor = PDFConverter(
+            caminho_pdf=pdf_texto,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado=True,
+            ocr_preprocessar=True
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+        stats = conversor.obter_estatisticas()
+
+        assert "L " in conteudo
+        assert stats["ocr_preprocessamento"]["paginas"] == 1
+        assert stats["ocr_preprocessamento"]["binarizacao"] > 0
@@ -0,0 +1,175 @@
+"""
+Testes para o OCR restrito às regiões de imagem das páginas.
+"""
+
+import multiprocessing
+
+import fitz
+import pytest
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_processor import (
+    OCR_REGIOES,
+    ProcessadorOCR,
+    localizar_regioes_ocr,
+)
+from pdf2md.core.page_context import ContextoPagina
+from pdf2md.core.text_extractor import ExtratorTexto, mesclar_em_ordem_leitura
+
+
+def _pixmap(largura, altura):
+    """Imagem cinza lisa com as dimensões dadas."""
+    pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, largura, altura), 0)
+    pixmap.clear_with(128)
+    return pixmap
+
+
+@pytest.fixture
+def pdf_com_anexo(tmp_path):
+    """PDF nativo com um anexo escaneado entre dois parágrafos e um ícone."""
+    caminho = tmp_path / "com_anexo.pdf"
+    documento = fitz.open()
+    pagina = documento.new_page()
+    pagina.insert_text((72, 80), "Parágrafo antes do anexo.", fontsize=12)
+    # Anexo escaneado a 200 DPI (300 x 200 pt)
+    pagina.insert_image(fitz.Rect(72, 150, 372, 350), pixmap=_pixmap(833, 556),
+                        keep_proportion=False)
+    pagina.insert_text((72, 420), "Parágrafo depois do anexo.", fontsize=12)
+    # Ícone pequeno, que não vale o OCR
+    pagina.insert_image(fitz.Rect(500, 40, 520, 60), pixmap=_pixmap(40, 40),
+                        keep_proportion=False)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+@pytest.fixture
+def tesseract_por_tamanho(monkeypatch):
+    """Tesseract simulado que devolve o tamanho da imagem recebida."""
+    chamadas = []
+
+    def reconhecer(self, renderizada):
+        chamadas.append((renderizada["largura"], renderizada["altura"]))
+        return f"Anexo {renderizada['largura']}x{renderizada['altura']}"
+
+    monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+    return chamadas
+
+
+class TestLocalizarRegioes:
+    """Testes da escolha das regiões reconhecidas."""
+
+    def test_ignora_icones(self, pdf_com_anexo):
+        """Só o anexo é uma região; o ícone é pequeno demais."""
+        documento = fitz.open(str(pdf_com_anexo))
+        with ContextoPagina(documento, 0) as contexto:
+            regioes = localizar_regioes_ocr(contexto, [])
+        documento.close()
+
+        assert len(regioes) == 1
+        retangulo, dpi = regioes[0]
+        assert retangulo == fitz.Rect(72, 150, 372, 350)
+        assert dpi == pytest.approx(200, rel=0.01)
+
+    def test_ignora_imagem_com_texto_nativo(self, pdf_com_anexo):
+        """Uma imagem que já tem texto por cima não passa pelo OCR."""
+        documento = fitz.open(str(pdf_com_anexo))
+        blocos = [{
+            "x0": 80, "y0": 200, "x1": 360, "y1": 220,
+            "texto": "Texto já reconhecido sobre a imagem escaneada do anexo, "
+                     "vindo de uma camada de texto invisível",
+        }]
+        with ContextoPagina(documento, 0) as contexto:
+            assert localizar_regioes_ocr(contexto, blocos) == []
+        documento.close()
+
+
+class TestMesclarOrdemLeitura:
+    """Testes da inserção dos blocos de OCR entre os blocos nativos."""
+
+    @staticmethod
+    def _bloco(x0, y0, x1, y1, texto):
+        return {"x0": x0, "y0": y0, "x1": x1, "y1": y1, "texto": texto}
+
+    def test_insere_pela_posicao_vertical(self):
+        """O bloco de OCR fica entre o texto acima e o texto abaixo."""
+        blocos = [
+            self._bloco(72, 70, 400, 90, "antes"),
+            self._bloco(72, 400, 400, 420, "depois"),
+        ]
+        novo = self._bloco(72, 150, 372, 350, "ocr")
+
+        mesclados = mesclar_em_ordem_leitura(blocos, [novo])
+
+        assert [b["texto"] for b in mesclados] == ["antes", "ocr", "depois"]
+
+    def test_respeita_colunas(self):
+        """Na coluna da direita, o bloco de OCR não invade a da esquerda."""
+        blocos = [
+            self._bloco(50, 100, 280, 120, "esquerda 1"),
+            self._bloco(50, 500, 280, 520, "esquerda 2"),
+            self._bloco(320, 100, 550, 120, "direita 1"),
+            self._bloco(320, 500, 550, 520, "direita 2"),
+        ]
+        novo = self._bloco(320, 200, 550, 400, "ocr")
+
+        mesclados = mesclar_em_ordem_leitura(blocos, [novo])
+
+        assert [b["texto"] for b in mesclados] == [
+            "esquerda 1", "esquerda 2", "direita 1", "ocr", "direita 2"
+        ]
+
+
+class TestConversorOCRRegioes:
+    """Testes do modo de OCR por regiões no conversor."""
+
+    def test_texto_do_anexo_na_ordem_de_leitura(
+        self, pdf_com_anexo, tmp_path, tesseract_por_tamanho
+    ):
+        """O texto reconhecido do anexo fica entre os parágrafos nativos."""
+        conversor = PDFConverter(
+            caminho_pdf=pdf_com_anexo,
+            diretorio_saida=tmp_path / "saida",
+            ocr_habilitado=OCR_REGIOES
+        )
+        conteudo = conversor.converter().read_text(encoding="utf-8")
+
+        # Só o anexo é renderizado, na resolução nativa
+        assert len(tesseract_por_tamanho) == 1
+        largura, altura = tesseract_por_tamanho[0]
+        assert largura == pytest.approx(833, abs=1)
+        assert altura == pytest.approx(556, abs=1)
+        antes = conteudo.index("Parágrafo antes")
+        anexo = conteudo.index(f"Anexo {largura}x{altura}")
+        depois = conteudo.index("Parágrafo depois")
+        assert antes < anexo < depois
+        assert conversor.obter_estatisticas()["regioes_ocr"] == 1
+
+    def test_blocos_de_ocr_marcados(self, pdf_com_anexo, tesseract_por_tamanho):
+        """Os blocos reconhecidos trazem a posição da região e 'ocr'."""
+        documento = fitz.open(str(pdf_com_anexo))
+        processador = ProcessadorOCR(documento, idioma="eng")
+        with ContextoPagina(documento, 0) as contexto:
+            blocos = ExtratorTexto(documento).extrair_blocos_estruturados(0, contexto)
+            blocos_ocr = processador.processar_regioes_ocr(0, contexto, blocos)
+        documento.close()
+
+        assert len(blocos_ocr) == 1
+        assert blocos_ocr[0]["ocr"] is True
+        assert (blocos_ocr[0]["y0"], blocos_ocr[0]["y1"]) == (150, 350)
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="o Tesseract simulado depende de processos criados com fork"
+    )
+    def test_regioes_com_motor(self, pdf_com_anexo, tmp_path, tesseract_por_tamanho):
+        """Com o motor, o resultado é o mesmo do OCR no processo atual."""
+        serial = PDFConverter(
+            pdf_com_anexo, tmp_path / "serial", ocr_habilitado=OCR_REGIOES
+        ).converter()
+        com_motor = PDFConverter(
+            pdf_com_anexo, tmp_path / "motor", ocr_habilitado=OCR_REGIOES,
+            workers_ocr=2
+        ).converter()
+
+        assert com_motor.read_bytes() == serial.read_bytes()
@@ -0,0 +1,155 @@
+"""
+Testes para o OCR em faixas de páginas muito grandes.
+"""
+
+import multiprocessing
+import threading
+
+import fitz
+import pytest
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.ocr_processor import (
+    FAIXAS_SIMULTANEAS,
+    SOBREPOSICAO_FAIXAS,
+    ProcessadorOCR,
+    costurar_faixas,
+    planejar_faixas,
+)
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def pdf_a0(tmp_path):
+    """PDF com uma página A0 com texto e uma página A4."""
+    caminho = tmp_path / "planta.pdf"
+    documento = fitz.open()
+    pagina = documento.new_page(width=2384, height=3370)
+    for linha in range(60):
+        pagina.insert_text((100, 100 + linha * 50), f"Cota {linha}", fontsize=24)
+    documento.new_page().insert_text((72, 72), "Memorial descritivo", fontsize=12)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+@pytest.fixture
+def tesseract_registrado(monkeypatch):
+    """Tesseract simulado que registra o tamanho de cada imagem recebida."""
+    imagens = []
+    trava = threading.Lock()
+
+    def reconhecer(self, renderizada):
+        with trava:
+            imagens.append(len(renderizada["amostras"]))
+            return f"Faixa {len(imagens)}"
+
+    monkeypatch.setattr(ProcessadorOCR, "reconhecer_imagem", reconhecer)
+    return imagens
+
+
+class TestPlanejarFaixas:
+    """Testes da divisão da página em faixas."""
+
+    def test_faixas_cobrem_a_pagina_com_sobreposicao(self):
+        """As faixas vão do topo à base e se sobrepõem."""
+        pagina = fitz.Rect(0, 0, 2384, 3370)
+        zoom, faixas = planejar_faixas(pagina, 300 / 72, 3, 32 * MB)
+
+        assert zoom == pytest.approx(300 / 72, abs=0.001)
+        assert faixas[0].y0 == 0 and faixas[-1].y1 == 3370
+        for acima, abaixo in zip(faixas, faixas[1:]):
+            assert acima.y1 - abaixo.y0 == pytest.approx(SOBREPOSICAO_FAIXAS)
+        for faixa in faixas:
+            assert faixa.width * faixa.height * zoom * zoom * 3 <= 32 * MB
+
+    def test_pagina_larga_demais_reduz_zoom(self):
+        """Se nem uma faixa mínima cabe no orçamento, o zoom diminui."""
+        pagina = fitz.Rect(0, 0, 20000, 1000)
+        zoom, faixas = planejar_faixas(pagina, 300 / 72, 3, 4 * MB)
+
+        assert zoom < 300 / 72
+        assert faixas[0].height >= 3 * SOBREPOSICAO_FAIXAS
+        assert faixas[0].width * faixas[0].height * zoom * zoom * 3 <= 4 * MB
+
+
+class TestCosturarFaixas:
+    """Testes da junção dos textos das faixas."""
+
+    def test_remove_linhas_repetidas_e_restos(self):
+        """Linhas da sobreposição aparecem uma vez; restos cortados somem."""
+        acima = "Linha 1\nLinha 2\nLinha 3 da emenda\nLinha 4 da emenda\n~,. ;"
+        abaixo = "'' ~\nLinha 3 da emenda\nLinha 4 da ernenda\nLinha 5\nLinha 6"
+
+        assert costurar_faixas([acima, abaixo]).splitlines() == [
+            "Linha 1", "Linha 2", "Linha 3 da emenda", "Linha 4 da emenda",
+            "Linha 5", "Linha 6",
+        ]
+
+    def test_sem_emenda_concatena(self):
+        """Sem linhas em comum (sobreposição em branco), nada é removido."""
+        assert costurar_faixas(["Linha 10", "Linha 11"]) == "Linha 10\nLinha 11"
+
+
+class TestOCREmFaixas:
+    """Testes do OCR em faixas no processador e no conversor."""
+
+    def test_memoria_por_faixa_limitada(self, pdf_a0, tesseract_registrado):
+        """Nenhuma imagem entregue ao OCR passa do orçamento da página."""
+        documento = fitz.open(str(pdf_a0))
+        processador = ProcessadorOCR(
+            documento, idioma="eng", memoria_maxima=32 * MB
+        )
+
+        texto = processador.processar_pagina_ocr(0)
+        contadores = processador.coletar_contadores()
+        documento.close()
+
+        assert contadores["paginas_em_faixas"] == 1
+        assert contadores["faixas_ocr"] == len(tesseract_registrado) > 1
+        # Cada faixa fica com uma parte do orçamento da página
+        assert max(tesseract_registrado) <= 32 * MB / (FAIXAS_SIMULTANEAS + 1)
+        assert texto.splitlines()[0] == "Faixa 1"
+
+    def test_pagina_pequena_inteira(self, pdf_a0, tesseract_registrado):
+        """Páginas que cabem no limite são reconhecidas inteiras."""
+        documento = fitz.open(str(pdf_a0))
+        processador = ProcessadorOCR(
+            documento, idioma="eng", memoria_maxima=32 * MB
+        )
+
+        processador.processar_pagina_ocr(1)
+        documento.close()
+
+        assert len(tesseract_registrado) == 1
+        assert "paginas_em_faixas" not in processador.coletar_contadores()
+
+    def test_sem_limite_resolucao_reduzida(self, pdf_a0, tesseract_registrado):
+        """Sem limite de memória, a página grande perde resolução."""
+        documento = fitz.open(str(pdf_a0))
+        sem_limite = ProcessadorOCR(documento, idioma="eng").renderizar_pagina(0)
+        documento.close()
+
+        assert sem_limite["largura"] * sem_limite["altura"] <= 40_000_000 * 1.01
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="o Tesseract simulado depende de processos criados com fork"
+    )
+    def test_faixas_com_motor(self, pdf_a0, tmp_path, monkeypatch):
+        """Com o motor, as faixas passam pela fila e o resultado é o mesmo."""
+        monkeypatch.setattr(
+            ProcessadorOCR, "reconhecer_imagem",
+            lambda self, renderizada: f"Faixa {renderizada['altura']}"
+        )
+        opcoes = {"ocr_habilitado": True, "ocr_memoria_maxima_mb": 32}
+
+        serial = PDFConverter(pdf_a0, tmp_path / "serial", **opcoes)
+        serial.converter()
+        com_motor = PDFConverter(pdf_a0, tmp_path / "motor", workers_ocr=2, **opcoes)
+        com_motor.converter()
+
+        assert ((tmp_path / "serial" / "planta.md").read_bytes()
+                == (tmp_path / "motor" / "planta.md").read_bytes())
+        assert com_motor.obter_estatisticas()["paginas_em_faixas"] == 1
@@ -0,0 +1,110 @@
+"""
+Testes para o pré-filtro de páginas antes da detecção de tabelas.
+"""
+
+import sys
+
+import fitz
+import pytest
+
+from pdf2md.core.converter import PDFConverter
+from pdf2md.core.table_extractor import ExtratorTabelas, _tem_grade
+
+
+def _desenhar_tabela(pagina, topo=450):
+    """Tabela de 5 linhas e 3 colunas, com as bordas e o texto das células."""
+    for linha in range(6):
+        pagina.draw_line((72, topo + linha * 20), (540, topo + linha * 20))
+    for x in (72, 200, 350, 540):
+        pagina.draw_line((x, topo), (x, topo + 100))
+    for linha in range(5):
+        for coluna, x in enumerate((80, 210, 360)):
+            pagina.insert_text((x, topo + 15 + linha * 20), f"c{linha}{coluna}", fontsize=9)
+
+
+@pytest.fixture
+def pdf_relatorio(tmp_path):
+    """PDF de seis páginas de texto; a quarta tem uma tabela com bordas."""
+    caminho = tmp_path / "relatorio.pdf"
+    documento = fitz.open()
+    for numero in range(6):
+        pagina = documento.new_page()
+        pagina.insert_text((72, 72), f"Seção {numero + 1}", fontsize=14)
+        pagina.insert_textbox(
+            fitz.Rect(72, 90, 540, 400), "Texto corrido do relatório. " * 40, fontsize=10
+        )
+        # Réguas de cabeçalho e rodapé em todas as páginas
+        pagina.draw_line((72, 40), (540, 40))
+        pagina.draw_line((72, 800), (540, 800))
+        if numero == 3:
+            _desenhar_tabela(pagina)
+    documento.save(str(caminho))
+    documento.close()
+    return caminho
+
+
+class TestGrade:
+    """Testes da verificação de grade nos desenhos."""
+
+    def test_sem_desenhos_ou_so_reguas(self, pdf_relatorio):
+        """Páginas sem desenhos ou só com linhas horizontais não têm grade."""
+        documento = fitz.open(str(pdf_relatorio))
+        assert _tem_grade([]) is False
+        assert _tem_grade(documento[0].get_drawings()) is False
+        assert _tem_grade(documento[3].get_drawings()) is True
+        documento.close()
+
+    def test_retangulo_conta_como_grade(self):
+        """Um retângulo tem quatro cruzamentos e a página é analisada."""
+        pagina = fitz.open().new_page()
+        pagina.draw_rect(fitz.Rect(100, 100, 300, 200), fill=(0.9, 0.9, 0.9))
+
+        assert _tem_grade(pagina.get_drawings()) is True
+
+
+class TestPrefiltroTabelas:
+    """Testes do pré-filtro no extrator e no conversor."""
+
+    def test_mesmas_tabelas_com_e_sem_prefiltro(self, pdf_relatorio):
+        """O pré-filtro não perde tabelas e conta as páginas ignoradas."""
+        documento = fitz.open(str(pdf_relatorio))
+        com = ExtratorTabelas(documento)
+        sem = ExtratorTabelas(documento, prefiltrar=False)
+
+        encontradas = [
+            (len(com.detectar_tabelas_pagina(n)), len(sem.detectar_tabelas_pagina(n)))
+            for n in range(len(documento))
+        ]
+        contadores = com.coletar_contadores()
+        documento.close()
+
+        assert encontradas == [(0, 0)] * 3 + [(1, 1)] + [(0, 0)] * 2
+        # Uma página descartada passa pela detecção como amostra do custo
+        assert contadores["paginas_sem_tabelas"] == 4
+        assert contadores["paginas_analisadas_tabelas"] == 2
+        assert contadores["paginas_amostra_tabelas"] == 1
+        assert com.coletar_contadores() == {}
+        assert "paginas_sem_tabelas" not in sem.coletar_contadores()
+
+    def test_layout_ativo_desliga_prefiltro(self, pdf_relatorio, monkeypatch):
+        """Com a análise de layout, tabelas sem linhas existem e nada é pulado."""
+        extrator = ExtratorTabelas(fitz.open(str(pdf_relatorio)))
+        monkeypatch.setattr(sys.modules["pymupdf"], "_get_layout", lambda *a, **k: None)
+
+        extrator.detectar_tabelas_pagina(0)
+
+        assert "paginas_sem_tabelas" not in extrator.coletar_contadores()
+
+    def test_conversor_relata_economia(self, pdf_relatorio, tmp_path):
+        """O Markdown não muda e as estatísticas trazem as páginas e o tempo poupados."""
+        com = PDFConverter(pdf_relatorio, tmp_path / "com")
+        sem = PDFConverter(pdf_relatorio, tmp_path / "sem", prefiltrar_tabelas=False)
+
+        assert com.converter().read_text(encoding="utf-8") == (
+            sem.converter().read_text(encoding="utf-8")
+        )
+        stats = com.obter_estatisticas()
+        assert stats["tabelas_extraidas"] == 1
+        assert stats["paginas_sem_tabelas"] == 4
+        assert "tempo_economizado_tabelas" in stats
+        assert "paginas_sem_tabelas" not in sem.obter_estatisticas()